@@ -0,0 +1,93 @@
+# benchmarks/bench_card_extraction.py
+"""
+Compare card extraction strategies on the saved search fixture pages.
+
+    python benchmarks/bench_card_extraction.py            # offline page_source parsing only
+    python benchmarks/bench_card_extraction.py --browser  # + headless Chrome: webdriver vs script vs html
+"""
+import os
+import sys
+import time
+import pathlib
+import argparse
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from card_parser import EXTRACTORS, parse_cards_html
+
+FIXTURES = sorted((ROOT / "benchmarks" / "fixtures").glob("search_*_layout.html"))
+BASE_URL = "https://www.freelancer.in/search/projects"
+
+
+def timed(fn, repeat):
+    """Return (best seconds per call, last result)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def first_mismatch(projects, expected):
+    """Describe the first card that differs between two extractions, None if they agree."""
+    if len(projects) != len(expected):
+        return f"{len(projects)} cards vs {len(expected)}"
+    for i, (got, want) in enumerate(zip(projects, expected)):
+        for key in sorted(set(got) | set(want)):
+            if got.get(key) != want.get(key):
+                return f"card {i} {key!r}: {got.get(key)!r} != {want.get(key)!r}"
+    return None
+
+
+def bench_offline(repeat):
+    print("📄 Offline page_source parsing")
+    for path in FIXTURES:
+        html = path.read_text(encoding="utf-8")
+        seconds, projects = timed(lambda: parse_cards_html(html, BASE_URL), repeat)
+        print(f"  {path.name:<28} {len(projects):>4} cards  {seconds * 1000:8.2f} ms")
+
+
+def bench_browser(repeat):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    mismatches = []
+    try:
+        print("🌐 Headless Chrome extraction")
+        for path in FIXTURES:
+            driver.get(path.as_uri())
+            results = {}
+            for name, extract in EXTRACTORS.items():
+                seconds, projects = timed(lambda: extract(driver), repeat)
+                results[name] = (seconds, projects)
+            baseline = results["webdriver"][0]
+            for name, (seconds, projects) in results.items():
+                print(f"  {path.name:<28} {name:<10} {len(projects):>4} cards  {seconds * 1000:8.2f} ms  x{baseline / seconds:6.1f}")
+            for name in ("webdriver", "html"):
+                mismatch = first_mismatch(results["script"][1], results[name][1])
+                if mismatch:
+                    mismatches.append(f"{path.name}: script vs {name}: {mismatch}")
+    finally:
+        driver.quit()
+    # Posting age and bid count included: the script must be a drop-in for the other extractors
+    assert not mismatches, "card extractors disagree:\n  " + "\n  ".join(mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", action="store_true", help="also benchmark against headless Chrome")
+    parser.add_argument("--repeat", type=int, default=int(os.getenv("BENCH_REPEAT", "5")))
+    args = parser.parse_args()
+
+    bench_offline(args.repeat)
+    if args.browser:
+        bench_browser(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_discovery.py
+"""
+Measure browserless discovery latency against the local fixture server.
+
+    python benchmarks/bench_discovery.py --polls 50
+"""
+import sys
+import time
+import pathlib
+import argparse
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from http_discovery import HttpDiscovery
+from fixture_server import start_fixture_server
+
+ENDPOINTS = {
+    "html (old layout)": "/search/projects?layout=old",
+    "html (new layout)": "/search/projects?layout=new",
+    "json api": "/api/projects/0.1/projects/active",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server()
+    for name, path in ENDPOINTS.items():
+        discovery = HttpDiscovery(base_url + path)
+        discovery.load_cookies([{"name": "session", "value": "fixture"}])
+        connections_before = server.stats["connections"]
+        timings = []
+        for _ in range(args.polls):
+            start = time.perf_counter()
+            projects = discovery.fetch_projects()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        connections = server.stats["connections"] - connections_before
+        print(f"📊 {name:<18} {len(projects):>3} projects | p50 {timings[len(timings) // 2]:6.1f}ms "
+              f"| max {timings[-1]:6.1f}ms | {connections} connection(s) for {args.polls} polls")
+        discovery.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_page_load.py
+"""
+Measure time-to-#bidAmountInput on project pages with the "full" and "fast" page-load profiles.
+
+    python benchmarks/bench_page_load.py                       # latest project links from the bid store
+    python benchmarks/bench_page_load.py URL [URL ...] --repeat 3
+
+Uses the persistent Chrome profile from CHROME_PROFILE_DIR so the bid form is visible when logged in.
+"""
+import sys
+import time
+import pathlib
+import argparse
+import statistics
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from browser import create_driver
+from bid_store import get_store
+
+
+def time_to_bid_form(driver, url, timeout=20) -> float:
+    start = time.perf_counter()
+    driver.get(url)
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.ID, "bidAmountInput")))
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="*")
+    parser.add_argument("--limit", type=int, default=5, help="links taken from the bid store when no URLs are given")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    urls = args.urls or [b["link"] for b in list(get_store().load_submitted().values())[-args.limit:]]
+    for page_load in ("full", "fast"):
+        driver = create_driver("worker-0", page_load=page_load)
+        timings = []
+        try:
+            for _ in range(args.repeat):
+                for url in urls:
+                    try:
+                        timings.append(time_to_bid_form(driver, url))
+                    except Exception as e:
+                        print(f"⚠️ {page_load}: no bid form on {url} ({type(e).__name__})")
+        finally:
+            driver.quit()
+        if timings:
+            print(f"📊 {page_load:<5} time to bidAmountInput: median {statistics.median(timings):7.0f}ms "
+                  f"| max {max(timings):7.0f}ms | n={len(timings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# benchmarks/bench_throughput.py
+"""
+End-to-end throughput benchmark: headless Chrome against the local mock marketplace and fake LLM.
+Runs discovery once over N synthetic projects, bids on all of them and reports bids/minute,
+per-stage latency percentiles (from the TRACE_FILE spans) and memory.
+
+    python benchmarks/bench_throughput.py --projects 30 --llm-latency 2 --workers 2 --pipeline-workers 4
+"""
+import os
+import sys
+import json
+import time
+import pathlib
+import argparse
+import resource
+import tempfile
+import tracemalloc
+from collections import defaultdict
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--restricted", type=float, default=0.1, help="fraction of projects without a bid form")
+    parser.add_argument("--llm-latency", type=float, default=1.0)
+    parser.add_argument("--llm-jitter", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=1, help="browser sessions")
+    parser.add_argument("--pipeline-workers", type=int, default=2, help="0 generates inline")
+    parser.add_argument("--pipeline-batch", type=int, default=1, help="projects per batched LLM request")
+    parser.add_argument("--page-load", default="fast", choices=["fast", "full"])
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    # Isolate state before any bot module reads its configuration
+    workdir = tempfile.mkdtemp(prefix="bench-")
+    os.chdir(workdir)
+    trace_file = os.path.join(workdir, "trace.jsonl")
+    os.environ.update({
+        "BIDS_DB": os.path.join(workdir, "bids.db"),
+        "LLM_CACHE_DB": os.path.join(workdir, "llm_cache.db"),
+        "PROPOSAL_INDEX_FILE": os.path.join(workdir, "proposal_index.f32"),
+        "TRACE_FILE": trace_file,
+        "CHROME_PROFILE_DIR": "",
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "fake"),
+        "OPENROUTER_API_KEY": os.getenv("OPENROUTER_API_KEY", "fake"),
+    })
+
+    from openai import OpenAI
+    from mock_marketplace import start_mock_marketplace
+    from fake_llm import start_fake_llm
+
+    market, market_url = start_mock_marketplace(args.projects, args.restricted)
+    llm, llm_url = start_fake_llm(args.llm_latency, args.llm_jitter)
+
+    import bid_generator
+    import bot
+    import logger
+    from browser import create_driver
+    from pipeline import ProposalPipeline
+    from worker_pool import BidWorkerPool
+
+    # Every routed endpoint points at the fake LLM
+    bid_generator.router_client = OpenAI(base_url=llm_url, api_key="fake")
+    bid_generator.client = OpenAI(base_url=llm_url, api_key="fake")
+    bot.SEARCH_URL = f"{market_url}/search/projects"
+
+    tracemalloc.start()
+    drivers = [create_driver(f"bench-{i}", page_load=args.page_load, headless=not args.headed)
+               for i in range(args.workers)]
+    pipeline = (ProposalPipeline(bot.generate_proposal, workers=args.pipeline_workers,
+                                 generate_batch=bot.generate_proposals, batch_size=args.pipeline_batch)
+                if args.pipeline_workers > 0 else None)
+    pool = BidWorkerPool(drivers, lambda driver, project: bot.prefill_bid(driver, project, pipeline))
+
+    start = time.perf_counter()
+    try:
+        projects = bot.find_projects(drivers[0])
+        if pipeline:
+            pipeline.feed(projects)
+        pool.submit(projects)
+        pool.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+        if pipeline:
+            pipeline.shutdown()
+        for driver in drivers:
+            driver.quit()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.shutdown()
+
+    stages = defaultdict(list)
+    with open(trace_file, encoding="utf-8") as f:
+        for line in f:
+            span = json.loads(line)
+            stages[span["stage"]].append(span["duration_ms"])
+
+    print("\n" + "=" * 72)
+    print(f"📊 {len(projects)} projects discovered | {pool.placed} bids placed | {len(market.marketplace.bids)} bids received")
+    print(f"⏱ {elapsed:.1f}s total | {pool.placed / elapsed * 60:.1f} bids/minute "
+          f"| workers={args.workers} pipeline={args.pipeline_workers} llm={args.llm_latency}s")
+    print(f"🧠 LLM requests: {llm.stats['requests']} ({llm.stats['completion_chars']} chars streamed, "
+          f"{llm.stats['cancelled']} cut off early) | peak Python heap {peak_bytes / 1e6:.1f} MB "
+          f"| max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    print("-" * 72)
+    print(f"{'stage':<24}{'n':>5}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'max ms':>11}")
+    for stage in sorted(stages):
+        values = stages[stage]
+        print(f"{stage:<24}{len(values):>5}{percentile(values, 50):>11.1f}{percentile(values, 95):>11.1f}"
+              f"{percentile(values, 99):>11.1f}{max(values):>11.1f}")
+    print("=" * 72)
+    market.shutdown()
+    llm.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/fake_llm.py
+"""
+OpenAI-compatible chat completions stub with configurable latency, for benchmarking without a paid model.
+Batched prompts ("Project ID: ..." blocks) get a {"proposals": [...]} JSON reply.
+Supports "stream": true (server-sent events, the latency spread over the chunks) and "max_tokens" (~4 chars each).
+
+    python benchmarks/fake_llm.py --latency 2.0 --jitter 0.5 --port 8767
+    # then point an OpenAI client at base_url="http://127.0.0.1:8767/v1"
+"""
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+PROPOSAL = """Hello,
+
+AlphaFusion Corporation builds AI-powered software, automation and data platforms for clients in finance, \
+healthcare and retail. We have delivered similar systems end to end, from discovery to deployment.
+
+Approach:
+- Review the requirements and agree on measurable acceptance criteria.
+- Design a modular architecture that is easy to extend and maintain.
+- Implement iteratively with regular demos and code reviews.
+- Test thoroughly and deploy with monitoring in place.
+
+We would be glad to discuss the details on a short call and share relevant examples of our work.
+
+Best regards,
+AlphaFusion Corporation"""
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self.send_json({"error": {"message": "not found"}}, status=404)
+
+        prompt_chars = sum(len(m.get("content") or "") for m in request.get("messages", []))
+        with server.stats_lock:
+            server.stats["requests"] += 1
+            server.stats["prompt_chars"] += prompt_chars
+        latency = max(0.0, server.latency + random.uniform(-server.jitter, server.jitter))
+        content = server.proposal
+        user = next((m.get("content") or "" for m in reversed(request.get("messages", [])) if m.get("role") == "user"), "")
+        ids = re.findall(r"^Project ID: (\S+)$", user, re.M)
+        if ids:
+            # 20% prompt processing + 80% decoding per proposal, as in the streaming model
+            latency *= 0.2 + 0.8 * len(ids)
+            content = json.dumps({"proposals": [{"id": i, "proposal": server.proposal} for i in ids]})
+        if request.get("max_tokens"):
+            content = content[:request["max_tokens"] * 4]
+        if request.get("stream"):
+            return self.stream(request, content, latency)
+        time.sleep(latency)
+        with server.stats_lock:
+            server.stats["completion_chars"] += len(content)
+
+        self.send_json({
+            "id": f"chatcmpl-fake-{server.stats['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": prompt_chars // 4, "completion_tokens": len(content) // 4,
+                      "total_tokens": (prompt_chars + len(content)) // 4},
+        })
+
+    def stream(self, request, content, latency):
+        """Send ~4-character deltas as server-sent events: 20% of the latency to the first token, the rest spread out."""
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        deltas = [content[i:i + 4] for i in range(0, len(content), 4)]
+        time.sleep(latency * 0.2)
+        step = latency * 0.8 / max(1, len(deltas))
+        sent = 0
+        try:
+            for delta in deltas + [None]:
+                event = {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": request.get("model", "fake"),
+                         "choices": [{"index": 0, "delta": {"content": delta} if delta else {},
+                                      "finish_reason": None if delta else "stop"}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                if delta:
+                    sent += len(delta)
+                    time.sleep(step)
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            with server.stats_lock:
+                server.stats["cancelled"] += 1
+        finally:
+            with server.stats_lock:
+                server.stats["completion_chars"] += sent
+
+
+def start_fake_llm(latency: float = 1.0, jitter: float = 0.0, port: int = 0, handler=FakeLLMHandler,
+                   proposal: str = PROPOSAL):
+    """Start the stub on a daemon thread and return (server, base_url) where base_url ends in /v1."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.jitter = jitter
+    server.proposal = proposal
+    server.stats = {"requests": 0, "prompt_chars": 0, "completion_chars": 0, "cancelled": 0}
+    server.stats_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds per completion")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    server, base_url = start_fake_llm(args.latency, args.jitter, args.port)
+    print(f"🧪 Fake LLM listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
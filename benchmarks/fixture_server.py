@@ -0,0 +1,77 @@
+# benchmarks/fixture_server.py
+"""
+Local stand-in for the marketplace discovery endpoints, serving the saved fixtures.
+
+    python benchmarks/fixture_server.py --port 8765
+    DISCOVERY_BACKEND=http DISCOVERY_URL=http://127.0.0.1:8765/search/projects python bot.py
+"""
+import pathlib
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.stats["connections"] += 1
+
+    def send_body(self, body: bytes, content_type: str, status: int = 200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        with self.server.stats_lock:
+            self.server.stats["requests"] += 1
+            self.server.stats["last_cookie"] = self.headers.get("Cookie", "")
+
+        if url.path == "/search/projects":
+            layout = query.get("layout", ["new"])[0]
+            path = FIXTURES / f"search_{layout}_layout.html"
+            if path.exists():
+                return self.send_body(path.read_bytes(), "text/html; charset=utf-8")
+        elif url.path == "/api/projects/0.1/projects/active":
+            return self.send_body((FIXTURES / "projects_active.json").read_bytes(), "application/json")
+        self.send_body(b"Not found", "text/plain", status=404)
+
+
+def start_fixture_server(port: int = 0, handler=FixtureHandler):
+    """Start the server on a daemon thread and return (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.stats = {"connections": 0, "requests": 0, "last_cookie": ""}
+    server.stats_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.port)
+    print(f"🧪 Fixture server listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
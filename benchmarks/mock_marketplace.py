@@ -0,0 +1,192 @@
+# benchmarks/mock_marketplace.py
+"""
+Local mock of the marketplace pages used by find_projects and prefill_bid.
+
+  /search/projects              N synthetic projects, half in the old ProjectCard layout, half in search-result-list
+  /projects/<category>/<slug>   project page with the full description and the bid form
+                                (bidAmountInput, periodInput or weeklyLimitInput, descriptionTextArea, Place Bid)
+  POST /api/projects/0.1/bids/  bid creation; the page then redirects with ?bidCreated=true
+
+    python benchmarks/mock_marketplace.py --projects 50 --port 8766
+"""
+import json
+import random
+import argparse
+import threading
+from html import escape
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+CATEGORIES = ["python", "machine-learning", "web-scraping", "api-development", "react-js", "data-analytics"]
+SKILLS = ["Python", "Machine Learning (ML)", "Web Scraping", "API Development", "React.js", "Node.js",
+          "Data Analysis", "Django", "FastAPI", "PostgreSQL", "AWS", "Docker"]
+TOPICS = ["Trading Dashboard", "Lead Scraper", "Chatbot Integration", "Sales Forecasting Model", "REST API Backend",
+          "Data Pipeline", "Invoice Automation", "Recommendation Engine", "Admin Panel", "Price Monitor"]
+BUDGETS = [("$", "USD", 250, 750, False), ("₹", "INR", 12500, 37500, False), ("£", "GBP", 20, 250, False),
+           ("$", "USD", 15, 25, True), ("€", "EUR", 30, 250, False)]
+
+
+def make_projects(n: int, restricted: float = 0.0, seed: int = 7) -> list:
+    """Deterministic synthetic projects."""
+    rng = random.Random(seed)
+    projects = []
+    for i in range(n):
+        topic = rng.choice(TOPICS)
+        sign, code, low, high, hourly = rng.choice(BUDGETS)
+        title = f"{topic} #{i + 1}"
+        slug = f"{topic.replace(' ', '-')}-{40000000 + i}"
+        full_description = " ".join(
+            f"We need help with the {topic.lower()} (part {j + 1}): build, test and deploy a reliable solution "
+            f"using {rng.choice(SKILLS)} with clear documentation and handover."
+            for j in range(rng.randint(3, 8))
+        )
+        projects.append({
+            "title": title,
+            "path": f"/projects/{rng.choice(CATEGORIES)}/{slug}",
+            "budget": f"Budget {sign}{low:,} – {high:,} {code}" + (" per hour" if hourly else ""),
+            "hourly": hourly,
+            "description": full_description[:240] + "… more",
+            "full_description": full_description,
+            "skills": rng.sample(SKILLS, 4),
+            "restricted": rng.random() < restricted,
+            "posted_minutes": i,
+            "bids": rng.randint(0, 40),
+        })
+    return projects
+
+
+def _posted(p) -> str:
+    minutes = p["posted_minutes"]
+    return "just now" if minutes == 0 else f"{minutes} minute{'s' if minutes > 1 else ''} ago"
+
+
+def render_search(projects) -> str:
+    half = len(projects) // 2
+    old = "".join(f"""
+<a href="{escape(p['path'])}"><div class="ProjectCard">
+  <span class="Title-text">{escape(p['title'])}</span>
+  <div class="BudgetUpgradeWrapper-budget"><span class="text-foreground">{escape(p['budget'])}</span></div>
+  <p data-margin-bottom="xsmall">{escape(p['description'])}</p>
+  <div class="SkillsWrapper">{''.join(f'<span class="Content">{escape(s)}</span>' for s in p['skills'])}</div>
+  <div class="ProjectCard-meta"><span>{_posted(p)}</span> <span>{p['bids']} bids</span></div>
+</div></a>""" for p in projects[:half])
+    new = "".join(f"""
+<li><div class="info-card-title"><a href="{escape(p['path'])}">{escape(p['title'])}</a></div>
+  <div class="info-card-price"><span>{escape(p['budget'])}</span></div>
+  <p class="info-card-description">{escape(p['description'])}</p>
+  <div class="info-card-skills">{''.join(f'<span>{escape(s)}</span>' for s in p['skills'])}</div>
+  <div class="info-card-details"><span>{_posted(p)}</span> <span>{p['bids']} bids</span></div>
+</li>""" for p in projects[half:])
+    return f"""<!DOCTYPE html><html><head><meta charset="utf-8"><title>Search Projects</title></head>
+<body><main>{old}</main><ul class="search-result-list">{new}</ul></body></html>"""
+
+
+def render_project(p) -> str:
+    if p["restricted"]:
+        form = '<div class="RestrictedBanner">You cannot bid on this project.</div>'
+    else:
+        period = ('<input id="weeklyLimitInput" type="number">' if p["hourly"]
+                  else '<input id="periodInput" type="number">')
+        form = f"""
+<form id="bidForm" onsubmit="return false">
+  <input id="bidAmountInput" type="number">
+  {period}
+  <textarea id="descriptionTextArea"></textarea>
+  <fl-button fltrackinglabel="PlaceBidButton"><button type="button" onclick="placeBid()">Place Bid</button></fl-button>
+</form>
+<script>
+function placeBid() {{
+  const body = {{
+    amount: document.getElementById("bidAmountInput").value,
+    period: (document.getElementById("periodInput") || document.getElementById("weeklyLimitInput")).value,
+    description: document.getElementById("descriptionTextArea").value,
+  }};
+  fetch("/api/projects/0.1/bids/?path=" + encodeURIComponent(location.pathname), {{
+    method: "POST", headers: {{"Content-Type": "application/json"}}, body: JSON.stringify(body),
+  }}).then((r) => r.json()).then((r) => {{
+    if (r.status === "success") location.href = location.pathname + "?bidCreated=true";
+  }});
+}}
+</script>"""
+    return f"""<!DOCTYPE html><html><head><meta charset="utf-8"><title>{escape(p['title'])}</title></head>
+<body><h1>{escape(p['title'])}</h1>
+<app-project-details-description><div class="ProjectDescription"><fl-interactive-text>
+  <div class="ContentWrapper"><span>{escape(p['full_description'])}</span></div>
+</fl-interactive-text></div></app-project-details-description>
+{form}
+</body></html>"""
+
+
+class MarketplaceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body, content_type="text/html; charset=utf-8", status=200):
+        body = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        market = self.server.marketplace
+        path = urlparse(self.path).path
+        if path == "/search/projects":
+            return self.send_body(render_search(market.projects))
+        project = market.by_path.get(path)
+        if project:
+            return self.send_body(render_project(project))
+        self.send_body("Not found", "text/plain", status=404)
+
+    def do_POST(self):
+        market = self.server.marketplace
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if url.path == "/api/projects/0.1/bids/":
+            path = parse_qs(url.query).get("path", [""])[0]
+            with market.lock:
+                market.bids.append({"path": path, **payload})
+            return self.send_body(json.dumps({"status": "success", "result": {"id": len(market.bids)}}),
+                                  "application/json")
+        self.send_body("Not found", "text/plain", status=404)
+
+
+class Marketplace:
+    def __init__(self, projects):
+        self.projects = projects
+        self.by_path = {p["path"]: p for p in projects}
+        self.bids = []
+        self.lock = threading.Lock()
+
+
+def start_mock_marketplace(n_projects: int = 20, restricted: float = 0.0, seed: int = 7, port: int = 0):
+    """Start the mock marketplace on a daemon thread and return (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), MarketplaceHandler)
+    server.daemon_threads = True
+    server.marketplace = Marketplace(make_projects(n_projects, restricted, seed))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--restricted", type=float, default=0.0, help="fraction of projects without a bid form")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    server, base_url = start_mock_marketplace(args.projects, args.restricted, port=args.port)
+    print(f"🧪 Mock marketplace listening on {base_url}/search/projects")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,75 @@
 # bid_generator.py
 import os
 import re
+import json
+import hashlib
+import threading
 from dotenv import load_dotenv
 from openai import OpenAI
+from logger import get_logger
+from llm_router import LLMRouter, Endpoint
+from prompt_builder import PromptBuilder
+from company_profile import ALPHAFUSION_PROFILE
+from llm_cache import get_cache, cache_key
 
 load_dotenv()
 
+log = get_logger("bid_generator")
+
 MAX_PROPOSAL_LENGTH = 1500
+# ~4 characters per token, with headroom so the length cutoff, not the token cap, ends a stream
+PROPOSAL_MAX_TOKENS = int(os.getenv("PROPOSAL_MAX_TOKENS", "500"))
+PROPOSAL_STREAMING = os.getenv("PROPOSAL_STREAMING", "1") == "1"
+MODEL = os.getenv("PROPOSAL_MODEL", "deepseek/deepseek-chat-v3.1:free")
+SYSTEM_PROMPT = "You are an experienced corporate proposal writer representing **AlphaFusion Corporation**, a leader in AI, software engineering, automation, and cybersecurity."
+SIGN_OFF = "\n\nBest regards,\nAlphaFusion Corporation"
+# Batched proposals shorter than this are treated as failed and regenerated on their own
+BATCH_MIN_PROPOSAL_CHARS = int(os.getenv("BATCH_MIN_PROPOSAL_CHARS", "300"))
 API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=API_KEY)
-
-router_client = OpenAI(
-  base_url="https://openrouter.ai/api/v1",
-  api_key=os.getenv("OPENROUTER_API_KEY"),
-)
-
-
-# AlphaFusion Corporation profile
-ALPHAFUSION_PROFILE = """
-AlphaFusion Corporation is a next-generation technology company that bridges the power of Artificial Intelligence, Machine Learning, and Advanced Software Engineering to build intelligent solutions for the modern world. Our expertise spans finance, cybersecurity, automation, data analytics, cloud infrastructure, and full-stack development — empowering global businesses to innovate, scale, and lead with confidence.
+# Created on first use, so importing this module needs no credentials
+client = None
+router_client = None
 
-We engineer intelligence into everything we build. Our teams combine deep technical expertise with a strong understanding of real-world business needs to deliver AI-powered software systems, custom applications, and next-generation digital platforms that drive measurable impact.
+# Ranked "provider:model" endpoints (provider = openrouter | openai); the first is preferred,
+# the next ones take hedged requests and failovers. Unset: the OpenRouter model only, so a paid
+# hedge endpoint is never added just because OPENAI_API_KEY happens to be set
+LLM_PROVIDERS = os.getenv("LLM_PROVIDERS", "")
 
-Core Domains:
-1) AI & ML – Predictive modeling, NLP, computer vision, recommendation systems, autonomous decision engines.
-2) Software & Web Development – Full-stack apps, APIs, enterprise-grade platforms (React, Next.js, Node.js, Python, etc.).
-3) Fintech & Data Analytics – Advanced trading dashboards, AI-powered market forecasting (TradeShark engine), global data visualization.
-4) Cybersecurity – Zero Trust architectures, threat detection, encryption, AI-driven security automation.
-5) Automation & Cloud – Scalable cloud deployments (AWS, Azure, GCP), Kubernetes, DevOps, intelligent process automation.
+_router = None
+_router_lock = threading.Lock()
 
-Vision:
-Redefine how businesses interact with technology — fusing AI, automation, and human creativity to empower innovation, trust, and transformation. Deliver intelligent systems that evolve with business needs.
+def provider_spec() -> str:
+    return LLM_PROVIDERS or f"openrouter:{MODEL}"
 
-Why Work With Us:
-- Cross-disciplinary expertise across AI, enterprise platforms, and cloud systems.
-- Custom-built solutions tailored to every business.
-- End-to-end delivery from concept to deployment.
-- Innovation-driven culture leveraging emerging technologies.
-- Trusted by clients worldwide across finance, defense, healthcare, retail, and smart infrastructure.
-"""
-
-def generate_bid(project_title: str, project_desc: str, budget: str|None=None) -> str:
-    try:
-        prompt = f"""
-You are an experienced corporate proposal writer representing **AlphaFusion Corporation**, a leader in AI, software engineering, automation, and cybersecurity.
+def get_client(provider: str) -> OpenAI:
+    """Return the shared client for 'openrouter' or 'openai', creating it on first use."""
+    global client, router_client
+    if provider == "openai":
+        if client is None:
+            client = OpenAI(api_key=API_KEY)
+        return client
+    if provider == "openrouter":
+        if router_client is None:
+            router_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=os.getenv("OPENROUTER_API_KEY"))
+        return router_client
+    raise ValueError(f"Unknown LLM provider: {provider}")
 
-Write a professional, institution-grade proposal for the following project:
+def get_router() -> LLMRouter:
+    """Return the process-wide LLM router over the configured clients."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            spec = provider_spec()
+            endpoints = []
+            for item in filter(None, (i.strip() for i in spec.split(","))):
+                provider, model = item.split(":", 1)
+                endpoints.append(Endpoint(item, get_client(provider), model))
+            _router = LLMRouter(endpoints)
+        return _router
 
-Title: {project_title}
-Description: {project_desc}
-Budget: {budget or 'Not specified'}
 
-Use this company profile for context:
-{ALPHAFUSION_PROFILE}
-
-Follow these rules strictly:
-- Keep total length smaller than 1500 characters.
+PROPOSAL_RULES = f"""Follow these rules strictly:
+- Keep total length smaller than {MAX_PROPOSAL_LENGTH} characters.
 - Start with a short greeting: 'Hello,' (no client name).
 - Maintain a confident, objective tone—no unnecessary gratitude (avoid phrases like "thank you for considering").
 - Summarize AlphaFusion’s relevant expertise, past work, and credibility clearly.
@@ -69,32 +83,21 @@ Follow these rules strictly:
 - Avoid pleasantries like “thank you for considering” or “we appreciate your time.”
 - Return only the final proposal text without extra commentary.
 - Do NOT include any special tokens such as <begin_of_sentence>, <end_of_sentence>, or similar markers.
-Return plain text only.
+Return plain text only."""
 
-"""
+prompt_builder = PromptBuilder(ALPHAFUSION_PROFILE, SYSTEM_PROMPT, PROPOSAL_RULES)
+# Changing the rules or profile invalidates cached proposals
+PROMPT_VERSION = hashlib.sha1(prompt_builder.system.encode("utf-8")).hexdigest()[:12]
 
-        completion = router_client.chat.completions.create(model="deepseek/deepseek-chat-v3.1:free",messages=[
-        {"role": "system", "content": "You are an experienced corporate proposal writer representing **AlphaFusion Corporation**, a leader in AI, software engineering, automation, and cybersecurity."},
-        {"role": "user", "content": prompt}])
 
-        response = completion.choices[0].message.content
-        response = re.sub(r"<.*?>", "", response)
-        response = response.strip()
-        # Hard truncate if necessary
-        if len(response) > MAX_PROPOSAL_LENGTH:
-            response = response[:MAX_PROPOSAL_LENGTH].rsplit('.', 1)[0] + '.'
-        return response
-        # resp = client.chat.completions.create(
-        #     model="gpt-5-mini",
-        #     messages=[{"role":"user","content":prompt}],
-        #     max_tokens=400,
-        # )
-        # return resp.choices[0].message.content.strip()
+def proposal_cache_key(project_title: str, project_desc: str, budget=None, skills=None) -> str:
+    return cache_key(f"{provider_spec()}|{PROMPT_VERSION}", title=project_title, description=project_desc,
+                     budget=budget, skills=",".join(skills or []))
 
-    except Exception as e:
-        print(f"⚠️ AI proposal generation failed: {e}")
-        # Fallback professional template
-        fallback_proposal = f"""Hello,
+
+def fallback_proposal(project_title: str, budget: str|None=None) -> str:
+    """Professional template used when the model is unavailable."""
+    return f"""Hello,
 
 I am pleased to submit my bid for '{project_title}'. At AlphaFusion Corporation, we specialize in developing intelligent and secure solutions across AI, machine learning, software engineering, cybersecurity, and automation. Our teams have successfully delivered enterprise-grade projects spanning fintech, defense, healthcare, smart infrastructure, and cloud platforms, consistently ensuring performance, scalability, and robust security.
 
@@ -111,4 +114,199 @@ Best regards,
 AlphaFusion Corporation
 """
 
-        return fallback_proposal
+
+_SPECIAL_TOKEN_RE = re.compile(r"<[^<>\n]*>")
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
+
+
+class ProposalCutter:
+    """
+    Incremental cleanup of a streamed proposal: strips special tokens like <begin_of_sentence> as
+    they arrive and releases text one complete sentence at a time, so the stream can be stopped
+    at the last sentence boundary before `limit` without taking back anything already released.
+    """
+
+    def __init__(self, limit: int = MAX_PROPOSAL_LENGTH):
+        self.limit = limit
+        self.text = ""      # cleaned text received so far
+        self.pending = ""   # raw tail that may be the start of a special token
+        self.sent = 0       # characters of self.text already released
+        self.full = False
+
+    def feed(self, delta: str) -> str:
+        """Add streamed text; return newly completed sentences ('' if none)."""
+        buf = _SPECIAL_TOKEN_RE.sub("", self.pending + delta)
+        # Hold back an unclosed '<' until we know whether it opens a token
+        cut = buf.rfind("<")
+        if cut != -1 and "\n" not in buf[cut:] and len(buf) - cut < 64:
+            buf, self.pending = buf[:cut], buf[cut:]
+        else:
+            self.pending = ""
+        self.text += buf if self.text else buf.lstrip()
+        if len(self.text) > self.limit:
+            self.full = True
+            return self._release(self._boundary(self.limit) or (self.limit if not self.sent else 0))
+        return self._release(self._boundary(len(self.text)))
+
+    def finish(self) -> str:
+        """Release whatever is left once the stream has ended."""
+        if self.full:
+            return ""
+        self.text = (self.text + self.pending).rstrip()
+        self.pending = ""
+        if len(self.text) > self.limit:
+            self.full = True
+            return self._release(self._boundary(self.limit) or (self.limit if not self.sent else 0))
+        return self._release(len(self.text))
+
+    def _boundary(self, end: int) -> int:
+        """Position just after the last sentence end within text[:end] (0 if none)."""
+        last = 0
+        for m in _SENTENCE_END_RE.finditer(self.text, self.sent):
+            if m.end() > end:
+                break
+            last = m.end()
+        return last
+
+    def _release(self, end: int) -> str:
+        if end <= self.sent:
+            return ""
+        chunk, self.sent = self.text[self.sent:end], end
+        return chunk
+
+
+def clean_proposal(response: str) -> str:
+    """Strip special tokens and cut to the last sentence within MAX_PROPOSAL_LENGTH."""
+    response = _SPECIAL_TOKEN_RE.sub("", response)
+    response = response.strip()
+    # Hard truncate if necessary
+    if len(response) > MAX_PROPOSAL_LENGTH:
+        response = response[:MAX_PROPOSAL_LENGTH].rsplit('.', 1)[0] + '.'
+    return response
+
+
+def _parse_batch(content: str) -> dict:
+    """{id: proposal} from the model's JSON reply, tolerating code fences and surrounding text."""
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("no JSON object in batch reply")
+    data = json.loads(content[start:end + 1])
+    entries = data.get("proposals", []) if isinstance(data, dict) else []
+    return {str(e.get("id")): e.get("proposal") for e in entries if isinstance(e, dict)}
+
+
+def generate_bids(projects: list) -> dict:
+    """
+    Generate proposals for several projects in one request, sharing the prompt prefix.
+    `projects` are {'id', 'title', 'description', 'budget', 'skills', 'examples'} dicts; returns {id: proposal}.
+    Entries missing from the reply or failing validation are generated one by one with generate_bid.
+    """
+    results, keys = {}, {}
+    cache = get_cache()
+    if cache is not None:
+        for p in projects:
+            keys[str(p["id"])] = proposal_cache_key(p["title"], p["description"], p.get("budget"), p.get("skills"))
+            cached = cache.get(keys[str(p["id"])])
+            if cached:
+                results[str(p["id"])] = cached
+    uncached = [p for p in projects if str(p["id"]) not in results]
+    try:
+        if uncached:
+            _, completion = get_router().complete(
+                prompt_builder.build_batch(uncached),
+                max_tokens=PROPOSAL_MAX_TOKENS * len(uncached) + 50 * len(uncached),
+            )
+            wanted = {str(p["id"]) for p in uncached}
+            for pid, proposal in _parse_batch(completion.choices[0].message.content or "").items():
+                if pid in wanted and isinstance(proposal, str):
+                    proposal = clean_proposal(proposal)
+                    if len(proposal) >= BATCH_MIN_PROPOSAL_CHARS:
+                        results[pid] = proposal
+                        if cache is not None:
+                            cache.put(keys[pid], proposal)
+    except Exception as e:
+        log.warning(f"⚠️ Batched proposal generation failed: {e}")
+
+    missing = [p for p in uncached if str(p["id"]) not in results]
+    if missing:
+        log.info(f"🔁 Generating {len(missing)} of {len(projects)} batched proposals individually")
+    for p in missing:
+        results[str(p["id"])] = generate_bid(p["title"], p["description"], p.get("budget"), p.get("skills"),
+                                             p.get("examples"))
+    return results
+
+
+def stream_bid(project_title: str, project_desc: str, budget: str|None=None, skills=None, examples=None):
+    """
+    Yield the proposal sentence by sentence while the model streams it. The stream is closed
+    as soon as the text reaches MAX_PROPOSAL_LENGTH, so no tokens are paid for text that would be cut.
+    """
+    cache = get_cache()
+    key = proposal_cache_key(project_title, project_desc, budget, skills) if cache is not None else None
+    cached = cache.get(key) if cache is not None else None
+    if cached:
+        yield cached
+        return
+    released = False
+    parts = []
+    try:
+        stream = get_router().stream(prompt_builder.build(project_title, project_desc, budget, skills, examples),
+                                     max_tokens=PROPOSAL_MAX_TOKENS)
+        cutter = ProposalCutter(MAX_PROPOSAL_LENGTH)
+        try:
+            for event in stream:
+                if not event.choices:
+                    continue
+                chunk = cutter.feed(event.choices[0].delta.content or "")
+                if chunk:
+                    released = True
+                    parts.append(chunk)
+                    yield chunk
+                if cutter.full:
+                    break
+        finally:
+            stream.close()
+        chunk = cutter.finish()
+        if not released and not chunk:
+            raise ValueError("empty completion")
+        if cache is not None:
+            cache.put(key, "".join(parts + [chunk]).strip())
+        if chunk:
+            released = True
+            yield chunk
+    except Exception as e:
+        log.warning(f"⚠️ AI proposal generation failed: {e}")
+        # Whole sentences may already be typed; finish them off instead of starting over
+        yield SIGN_OFF if released else fallback_proposal(project_title, budget)
+
+
+def generate_bid(project_title: str, project_desc: str, budget: str|None=None, skills=None, examples=None) -> str:
+    if PROPOSAL_STREAMING:
+        return "".join(stream_bid(project_title, project_desc, budget, skills, examples)).strip()
+    cache = get_cache()
+    key = proposal_cache_key(project_title, project_desc, budget, skills) if cache is not None else None
+    cached = cache.get(key) if cache is not None else None
+    if cached:
+        return cached
+    try:
+        _, completion = get_router().complete(
+            prompt_builder.build(project_title, project_desc, budget, skills, examples),
+            max_tokens=PROPOSAL_MAX_TOKENS,
+        )
+
+        response = clean_proposal(completion.choices[0].message.content)
+        if not response:
+            raise ValueError("empty completion")
+        if cache is not None:
+            cache.put(key, response)
+        return response
+        # resp = client.chat.completions.create(
+        #     model="gpt-5-mini",
+        #     messages=[{"role":"user","content":prompt}],
+        #     max_tokens=400,
+        # )
+        # return resp.choices[0].message.content.strip()
+
+    except Exception as e:
+        log.warning(f"⚠️ AI proposal generation failed: {e}")
+        return fallback_proposal(project_title, budget)
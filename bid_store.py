@@ -0,0 +1,309 @@
+# bid_store.py
+import os
+import re
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from logger import get_logger
+
+DB_FILE = os.getenv("BIDS_DB", "bids.db")
+BIDS_FILE = "submitted_bids.json"
+SKIPPED_FILE = "skipped_bids.json"
+
+log = get_logger("bid_store")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submitted_bids (
+    project_id       TEXT PRIMARY KEY,
+    title            TEXT,
+    link             TEXT,
+    budget           TEXT,
+    description      TEXT,
+    full_description TEXT,
+    proposal         TEXT,
+    min_budget       INTEGER,
+    days             INTEGER,
+    hours            INTEGER,
+    created_at       REAL
+);
+CREATE INDEX IF NOT EXISTS idx_submitted_title ON submitted_bids(title);
+CREATE INDEX IF NOT EXISTS idx_submitted_link ON submitted_bids(link);
+
+CREATE TABLE IF NOT EXISTS skipped_bids (
+    project_id  TEXT PRIMARY KEY,
+    title       TEXT,
+    link        TEXT,
+    budget      TEXT,
+    reason      TEXT,
+    description TEXT,
+    skills      TEXT,
+    created_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_skipped_title ON skipped_bids(title);
+CREATE INDEX IF NOT EXISTS idx_skipped_link ON skipped_bids(link);
+"""
+
+SUBMITTED_COLUMNS = ["title", "budget", "description", "full_description", "proposal", "min_budget", "days", "hours", "link"]
+SKIPPED_COLUMNS = ["title", "link", "budget", "reason", "description", "skills"]
+
+
+def project_id_from_link(link: str) -> str:
+    """
+    Derive a stable project key from a project link.
+    Example: '.../projects/api-developmet/SmartWaste-Smart-Waste-39906445' -> '39906445'
+             '.../projects/flutter/Local-Professional-Services-Booking' -> 'flutter/local-professional-services-booking'
+    The category is kept for slug keys because the same slug is reused across categories.
+    """
+    if not link:
+        return ""
+    path = link.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    parts = path.split("/")
+    slug = parts[-1]
+    match = re.search(r"-(\d{5,})$", slug)
+    if match:
+        return match.group(1)
+    if len(parts) >= 2 and parts[-2] != "projects":
+        slug = f"{parts[-2]}/{slug}"
+    return slug.lower()
+
+
+def project_key(project: dict) -> str:
+    """Canonical project key: project ID/slug from the link, title only as a fallback."""
+    key = project_id_from_link(project.get("link", ""))
+    if key:
+        return key
+    return "title:" + (project.get("title") or "").strip()
+
+
+_INSERT_SUBMITTED = (
+    "INSERT OR IGNORE INTO submitted_bids "
+    "(project_id, title, link, budget, description, full_description, proposal, min_budget, days, hours, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_SKIPPED = (
+    "INSERT OR IGNORE INTO skipped_bids "
+    "(project_id, title, link, budget, reason, description, skills, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _submitted_row(record: dict) -> tuple:
+    return (
+        project_key(record),
+        record.get("title", "N/A"),
+        record.get("link", ""),
+        record.get("budget", "N/A"),
+        record.get("description", "N/A"),
+        record.get("full_description", ""),
+        record.get("proposal", ""),
+        record.get("min_budget"),
+        record.get("days"),
+        record.get("hours"),
+        time.time(),
+    )
+
+
+def _skipped_row(project: dict, reason: str) -> tuple:
+    return (
+        project_key(project),
+        project.get("title", "Unknown").strip(),
+        project.get("link", ""),
+        project.get("budget", "N/A"),
+        reason,
+        project.get("description", "N/A"),
+        json.dumps(project.get("skills", []), ensure_ascii=False),
+        time.time(),
+    )
+
+
+class BidStore:
+    """SQLite (WAL) storage for submitted and skipped bids, one row per project key."""
+
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self.conn.executescript(SCHEMA)
+
+    def _migrate(self):
+        """
+        Re-key tables from stores created when rows were keyed by title, which silently
+        dropped a new project whose title matched an older one.
+        """
+        for table in ("submitted_bids", "skipped_bids"):
+            pk = [r["name"] for r in self.conn.execute(f"PRAGMA table_info({table})") if r["pk"]]
+            if pk != ["title"]:
+                continue
+            self.conn.execute("BEGIN")
+            try:
+                rows = [dict(r) for r in self.conn.execute(f"SELECT * FROM {table} ORDER BY created_at, rowid")]
+                self.conn.execute(f"DROP TABLE {table}")
+                for statement in SCHEMA.split(";"):
+                    if table in statement:
+                        self.conn.execute(statement)
+                kept = 0
+                for row in rows:
+                    row["project_id"] = project_key(row)
+                    kept += self.conn.execute(
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                        tuple(row.values()),
+                    ).rowcount
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            log.info(f"📦 Re-keyed {table} by project ID ({kept} rows, {len(rows) - kept} duplicates of a project dropped)")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    # --- writes ---
+
+    def add_submitted(self, record: dict, warn: bool = True) -> bool:
+        """Insert a single submitted bid. Returns False (and warns) if the project is already stored."""
+        row = _submitted_row(record)
+        with self.lock:
+            added = self.conn.execute(_INSERT_SUBMITTED, row).rowcount > 0
+        if not added and warn:
+            log.warning(f"⚠️ Submitted bid not stored, project {row[0]} is already recorded: {row[1]}")
+        return added
+
+    def add_skipped(self, project: dict, reason: str, warn: bool = True) -> bool:
+        """Insert a single skipped project. Returns False (and warns) if the project is already stored."""
+        row = _skipped_row(project, reason)
+        with self.lock:
+            added = self.conn.execute(_INSERT_SKIPPED, row).rowcount > 0
+        if not added and warn:
+            log.warning(f"⚠️ Skipped project not stored, project {row[0]} is already recorded: {row[1]}")
+        return added
+
+    # --- reads ---
+
+    def has_project_id(self, table: str, project_id: str) -> bool:
+        """Indexed lookup of a project key in 'submitted_bids' or 'skipped_bids'."""
+        if table not in ("submitted_bids", "skipped_bids"):
+            raise ValueError(f"Unknown table: {table}")
+        with self.lock:
+            row = self.conn.execute(f"SELECT 1 FROM {table} WHERE project_id = ?", (project_id,)).fetchone()
+        return row is not None
+
+    def iter_keys(self, table: str):
+        """Yield (link, title) for every row of 'submitted_bids' or 'skipped_bids'."""
+        if table not in ("submitted_bids", "skipped_bids"):
+            raise ValueError(f"Unknown table: {table}")
+        with self.lock:
+            rows = self.conn.execute(f"SELECT link, title FROM {table}").fetchall()
+        for r in rows:
+            yield r["link"], r["title"]
+
+    def count_submitted(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM submitted_bids").fetchone()[0]
+
+    def load_submitted(self) -> dict:
+        """Return all submitted bids keyed by project key, each entry in the legacy JSON shape."""
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM submitted_bids ORDER BY created_at, rowid").fetchall()
+        bids = {}
+        for r in rows:
+            entry = {col: r[col] for col in SUBMITTED_COLUMNS}
+            if entry["days"] is None:
+                entry.pop("days")
+            if entry["hours"] is None:
+                entry.pop("hours")
+            bids[r["project_id"]] = entry
+        return bids
+
+    def load_skipped(self) -> dict:
+        """Return all skipped projects keyed by project key, each entry in the legacy JSON shape."""
+        with self.lock:
+            rows = self.conn.execute("SELECT * FROM skipped_bids ORDER BY created_at, rowid").fetchall()
+        skipped = {}
+        for r in rows:
+            entry = {col: r[col] for col in SKIPPED_COLUMNS}
+            entry["skills"] = json.loads(entry["skills"] or "[]")
+            skipped[r["project_id"]] = entry
+        return skipped
+
+    # --- migration ---
+
+    def import_json(self, bids_file: str = BIDS_FILE, skipped_file: str = SKIPPED_FILE):
+        """One-shot import of the JSON files (keyed by title or project key). Existing rows are kept."""
+        bids, skipped = {}, {}
+        if os.path.exists(bids_file):
+            with open(bids_file, "r", encoding="utf-8") as f:
+                bids = json.load(f)
+        if os.path.exists(skipped_file):
+            with open(skipped_file, "r", encoding="utf-8") as f:
+                skipped = json.load(f)
+        added_bids = added_skipped = 0
+        # One transaction under one lock hold, so no other thread's writes land inside it
+        with self.lock:
+            self.conn.execute("BEGIN")
+            try:
+                for title, record in bids.items():
+                    row = _submitted_row(dict(record, title=record.get("title", title)))
+                    added_bids += self.conn.execute(_INSERT_SUBMITTED, row).rowcount
+                for title, record in skipped.items():
+                    row = _skipped_row(dict(record, title=record.get("title", title)), record.get("reason", "N/A"))
+                    added_skipped += self.conn.execute(_INSERT_SKIPPED, row).rowcount
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+        return added_bids, added_skipped
+
+    def export_json(self, bids_file: str = BIDS_FILE, skipped_file: str = SKIPPED_FILE):
+        """Write the store back out in the legacy JSON format."""
+        with open(bids_file, "w", encoding="utf-8") as f:
+            json.dump(self.load_submitted(), f, ensure_ascii=False, indent=4)
+        with open(skipped_file, "w", encoding="utf-8") as f:
+            json.dump(self.load_skipped(), f, ensure_ascii=False, indent=4)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_store() -> BidStore:
+    """Return the process-wide store, importing the legacy JSON files on first creation."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            is_new = not os.path.exists(DB_FILE)
+            _store = BidStore(DB_FILE)
+            if is_new:
+                added_bids, added_skipped = _store.import_json()
+                if added_bids or added_skipped:
+                    log.info(f"📦 Imported {added_bids} submitted and {added_skipped} skipped bids into {DB_FILE}")
+        return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite bid store.")
+    parser.add_argument("command", choices=["import", "export", "stats"])
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--bids-file", default=BIDS_FILE)
+    parser.add_argument("--skipped-file", default=SKIPPED_FILE)
+    args = parser.parse_args()
+
+    store = BidStore(args.db)
+    if args.command == "import":
+        added_bids, added_skipped = store.import_json(args.bids_file, args.skipped_file)
+        print(f"📦 Imported {added_bids} submitted and {added_skipped} skipped bids into {args.db}")
+    elif args.command == "export":
+        store.export_json(args.bids_file, args.skipped_file)
+        print(f"💾 Exported {args.db} to {args.bids_file} and {args.skipped_file}")
+    else:
+        print(f"📈 Submitted: {store.count_submitted()} | Skipped: {len(store.load_skipped())}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
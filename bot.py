@@ -1,93 +1,195 @@
 # main.py
 import os
-import re
 import json
 import time
-from selenium import webdriver
-from bid_generator import generate_bid
+from concurrent.futures import ThreadPoolExecutor
+from bid_generator import generate_bid, generate_bids, stream_bid, PROPOSAL_STREAMING
+from bid_store import get_store
+from dedupe import get_dedupe_index, SUBMITTED, SKIPPED
+from pipeline import ProposalPipeline, PIPELINE_WORKERS
+from card_parser import EXTRACTORS, extract_cards_script
+from http_discovery import HttpDiscovery
+from browser import create_driver, has_valid_session, drain_performance_log, wait_for_response, PERFORMANCE_LOG
+from worker_pool import BidWorkerPool, BID_WORKERS
+from priority import BidQueue
+from incremental import IncrementalScan, INCREMENTAL_DISCOVERY
+from scheduler import AdaptivePoller
+from keyword_filter import get_filter
+from budget import parse_budget
+from ranking import get_ranker, RANKING
+from proposal_index import get_proposal_index, PROPOSAL_REUSE
+from repost import get_repost_index, REPOST_DETECTION, REPOST_SKIP_REASONS
+from restriction import get_restriction_predictor, RESTRICT_PREDICTION
+from logger import get_logger
+from metrics import timed, observe_stage, inc, start_http_server, write_textfile
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-BIDS_FILE = "submitted_bids.json"
-SKIPPED_FILE = "skipped_bids.json"
-exclude_keywords = ["wordpress", "woocommerce", "template", "shopify", "wix"]
-
-# --- configure Selenium ---
-options = Options()
-options.add_argument("--start-maximized")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+CARD_EXTRACTION = os.getenv("CARD_EXTRACTION", "script")  # script | html | webdriver
+SEARCH_URL = "https://www.freelancer.in/search/projects?projectLanguages=en&projectSkills=9,13,92,263,292,439,500,913,1031,1092,1093,2165,2376,2801,2833,2916,2935,2940,2966,2986"
+DISCOVERY_BACKEND = os.getenv("DISCOVERY_BACKEND", "browser")  # browser | http
+DISCOVERY_URL = os.getenv("DISCOVERY_URL", SEARCH_URL)
+# Set every bid form field in one script instead of typing the proposal key by key
+BID_FAST_FILL = os.getenv("BID_FAST_FILL", "1") == "1"
+BID_CONFIRM_TIMEOUT = float(os.getenv("BID_CONFIRM_TIMEOUT", "10"))
+BID_CREATE_URL = os.getenv("BID_CREATE_URL", "/api/projects/0.1/bids/")  # bid creation request to watch for
+
+# Sets the fields through the native value setters and fires the events Angular/React forms listen to,
+# then reads them back so a field the form rejected or reformatted sends us down the typing path
+FAST_FILL_SCRIPT = """
+const [fields, values] = arguments;
+fields.forEach((el, i) => {
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, String(values[i]));
+    for (const type of ["input", "change", "blur"]) {
+        el.dispatchEvent(new Event(type, { bubbles: true }));
+    }
+});
+return fields.every((el, i) => el.value === String(values[i]) && !el.classList.contains("ng-invalid"));
+"""
+
+log = get_logger("bot")
 
 def load_skipped_bids():
     """Load skipped bids."""
-    if os.path.exists(SKIPPED_FILE):
-        with open(SKIPPED_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-def save_skipped_bids(skipped):
-    """Save skipped bids."""
-    with open(SKIPPED_FILE, "w", encoding="utf-8") as f:
-        json.dump(skipped, f, ensure_ascii=False, indent=4)
+    return get_store().load_skipped()
 
 def mark_skipped(project, reason):
-    """Mark a project as skipped permanently."""
-    skipped = load_skipped_bids()
-    title = project.get("title", "Unknown").strip()
-    if title not in skipped:
-        skipped[title] = {
-            "title": project.get("title", "N/A"),
-            "link": project.get("link", ""),
-            "budget": project.get("budget", "N/A"),
-            "reason": reason,
-            "description": project.get("description", "N/A"),
-            "skills": project.get("skills", [])
-        }
-        save_skipped_bids(skipped)
+    """Mark a project as skipped permanently. A project already recorded as skipped is left as is."""
+    # Projects already bid on come back here on every poll, so an existing row is expected
+    if not get_store().add_skipped(project, reason, warn=False):
+        return
+    get_dedupe_index().add_skipped(project)
+    if REPOST_DETECTION and reason in REPOST_SKIP_REASONS:
+        get_repost_index().add(project, SKIPPED)
+    inc("bidder_projects_skipped_total", help="Projects skipped, by reason.", reason=reason)
 
 def get_total_bids():
-    """Return total number of unique bids placed (cached in submitted_bids.json)."""
-    bids = load_submitted_bids()
-    return len(bids)
+    """Return total number of unique bids placed (stored in the bid store)."""
+    return get_store().count_submitted()
 
 def print_bid_stats(session_count=0):
     """Print total and session bid counts."""
     total_bids = get_total_bids()
-    print(f"📈 Total bids placed so far: {total_bids} | Current session: {session_count}")
+    log.info(f"📈 Total bids placed so far: {total_bids} | Current session: {session_count}",
+             extra={"total_bids": total_bids, "session_bids": session_count})
 
 def load_submitted_bids():
-    """Load already submitted bids from local JSON."""
-    if os.path.exists(BIDS_FILE):
-        with open(BIDS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-def save_submitted_bids(bids):
-    """Save updated bids to local JSON."""
-    with open(BIDS_FILE, "w", encoding="utf-8") as f:
-        json.dump(bids, f, ensure_ascii=False, indent=4)
+    """Load already submitted bids from the bid store."""
+    return get_store().load_submitted()
+
+def save_submitted_bid(bid):
+    """Save a single submitted bid to the bid store."""
+    get_store().add_submitted(bid)
+    get_dedupe_index().add_submitted(bid)
+    if REPOST_DETECTION:
+        get_repost_index().add(bid, SUBMITTED)
+    if PROPOSAL_REUSE:
+        get_proposal_index().add(bid)
+    inc("bidder_bids_placed_total", help="Bids confirmed by the marketplace.")
 
 def get_min_budget(budget_str):
     """
-    Extract the lowest numeric value from a budget string.
+    Lowest amount of a budget string, in the project's own currency (what the bid form takes).
     Example: 'Budget £10 – 20 GBP' -> 10
     """
-    # Find all numbers in the string
-    numbers = re.findall(r'\d+', budget_str.replace(',', ''))
-    if numbers:
-        # Return the minimum as integer
-        return int(numbers[0])  # first number is usually the lowest in these strings
-    return 0  # fallback if no number found
-
-def login_freelancer(email: str, password: str):
+    return int(parse_budget(budget_str).minimum or 0)
+
+def card_description(project):
+    description = project.get("description", "")
+    if description.endswith("… more"):
+        description = description[:-len("… more")].strip()
+    return description
+
+def generate_proposals(projects):
+    """Batch counterpart of generate_proposal for the pipeline: one LLM request for several cards."""
+    results, items = {}, []
+    for i, p in enumerate(projects):
+        examples = None
+        if PROPOSAL_REUSE:
+            results[str(i)], examples = get_proposal_index().lookup(p, card_description(p))
+            if results[str(i)]:
+                continue
+        items.append({"id": str(i), "title": p.get("title", "N/A"), "description": card_description(p),
+                      "budget": get_min_budget(p.get("budget", "0")), "skills": p.get("skills"),
+                      "examples": examples})
+    if items:
+        with timed("llm.generate_batch", size=len(items)):
+            results.update(generate_bids(items))
+    return [results[str(i)] for i in range(len(projects))]
+
+def generate_proposal(project, description=None):
+    """
+    Yield the proposal for a project in chunks (sentence by sentence when streaming).
+    Without a description the card text is used, as in the pre-generation pipeline.
+    """
+    if description is None:
+        description = card_description(project)
+    link = project.get("link", "")
+    examples = None
+    if PROPOSAL_REUSE:
+        proposal, examples = get_proposal_index().lookup(project, description)
+        if proposal:
+            yield proposal
+            return
+    args = dict(project_title=project.get("title", "N/A"), project_desc=description,
+                budget=get_min_budget(project.get("budget", "0")), skills=project.get("skills"),
+                examples=examples)
+    start = time.perf_counter()
+    if not PROPOSAL_STREAMING:
+        with timed("llm.generate", link=link):
+            proposal = generate_bid(**args)
+        yield proposal
+        return
+    first = True
+    for chunk in stream_bid(**args):
+        if first:
+            observe_stage("llm.first_chunk", time.perf_counter() - start, link=link)
+            first = False
+        yield chunk
+    observe_stage("llm.generate", time.perf_counter() - start, link=link, streamed=True)
+
+def fast_fill(driver, fields, values):
+    """Fill the bid form in one round trip; False if validation rejected any value."""
+    try:
+        return bool(driver.execute_script(FAST_FILL_SCRIPT, fields, [str(v) for v in values]))
+    except Exception as e:
+        log.debug(f"Fast fill failed: {e}")
+        return False
+
+def confirm_bid(driver, timeout=BID_CONFIRM_TIMEOUT):
+    """
+    True once the marketplace accepts the bid. The bid-creation response in the performance log
+    and the bidCreated=true redirect are watched together, and whichever shows up first decides.
+    If the response is not observed or its status is unknown (status 0: the request failed in the
+    browser or no headers were logged), the redirect is waited for until the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    redirected = lambda d: "bidCreated=true" in d.current_url
+    if PERFORMANCE_LOG:
+        response = wait_for_response(driver, BID_CREATE_URL, "POST", timeout, done=redirected)
+        if response is None and redirected(driver):
+            return True
+        if response is not None and response[0]:
+            status, body = response
+            try:
+                accepted = json.loads(body).get("status", "success") == "success"
+            except (ValueError, AttributeError):
+                accepted = True  # body not retrievable; the status code decides
+            return 200 <= status < 300 and accepted
+    try:
+        WebDriverWait(driver, max(0.5, deadline - time.monotonic())).until(redirected)
+        return True
+    except TimeoutException:
+        return False
+
+def login_freelancer(driver, email: str, password: str):
     driver.get("https://www.freelancer.com/login")
     WebDriverWait(driver, 15).until(lambda d: d.execute_script("return document.readyState") == "complete")
     try:
-        print(email, password)
+        log.info(f"🔐 Logging in as {email}")
         driver.find_element(By.ID, "emailOrUsernameInput").send_keys(email)
         driver.find_element(By.ID, "passwordInput").send_keys(password)
         login_button = WebDriverWait(driver, 20).until(
@@ -99,29 +201,49 @@ def login_freelancer(email: str, password: str):
     
         # Click the button
         login_button.click()
-        print("✅ Login successfully!")
-        time.sleep(6)  # wait for login to complete
+        # Wait for the redirect away from the login page instead of a fixed sleep
+        WebDriverWait(driver, 15).until(lambda d: "/login" not in d.current_url)
+        log.info("✅ Login successfully!")
     except Exception as e:
-        print("❌ Login failed!:")
-        print(e)
+        log.error("❌ Login failed!:")
+        log.error(str(e))
 
-def find_projects():
-    search_url = "https://www.freelancer.in/search/projects?projectLanguages=en&projectSkills=9,13,92,263,292,439,500,913,1031,1092,1093,2165,2376,2801,2833,2916,2935,2940,2966,2986"
-    driver.get(search_url)
-    
+def scrape_projects(driver, scan=None):
+    """
+    Render the search page in the browser, scroll to the end and extract all cards.
+    With an IncrementalScan, scrolling stops as soon as already seen projects are reached.
+    """
     wait = WebDriverWait(driver, 10)
+    if PERFORMANCE_LOG:
+        drain_performance_log(driver)  # chromedriver buffers every event until read
     try:
-        wait.until(
-            lambda d: d.find_elements(By.CLASS_NAME, "ProjectCard") or
-                      d.find_elements(By.CSS_SELECTOR, "ul.search-result-list li")
-        )
+        with timed("discovery.load"):
+            driver.get(SEARCH_URL)
+            wait.until(
+                lambda d: d.find_elements(By.CLASS_NAME, "ProjectCard") or
+                          d.find_elements(By.CSS_SELECTOR, "ul.search-result-list li")
+            )
     except:
-        print("⚠️ No projects found on the page.")
+        log.warning("⚠️ No projects found on the page.")
+        if scan:
+            scan.start()
         return []
 
+    extractor = EXTRACTORS.get(CARD_EXTRACTION, extract_cards_script)
+    reached_known = False
+
+    def extract_cards(driver):
+        with timed("discovery.extract", mode=CARD_EXTRACTION):
+            return extractor(driver)
+
     # Auto-scroll
+    scroll_start = time.perf_counter()
     last_height = driver.execute_script("return document.body.scrollHeight")
     while True:
+        # Incremental mode: extract while scrolling and stop at the first known project
+        if scan and scan.feed(extract_cards(driver)):
+            reached_known = True
+            break
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         try:
             wait.until(lambda d: driver.execute_script("return document.body.scrollHeight") > last_height)
@@ -131,167 +253,137 @@ def find_projects():
         if new_height == last_height:
             break
         last_height = new_height
+    observe_stage("discovery.scroll", time.perf_counter() - scroll_start, reached_known=reached_known)
 
-    projects = []
-
-    # --- Old format (ProjectCard) ---
-    old_cards = driver.find_elements(By.CLASS_NAME, "ProjectCard")
-    for c in old_cards:
-        try:
-            title_el = c.find_element(By.CSS_SELECTOR, ".Title-text")
-            link_el = c.find_element(By.XPATH, ".//ancestor::a[1]")
-            title = title_el.text.strip()
-            link = link_el.get_attribute("href")
-
-            try:
-                budget_el = c.find_element(By.CSS_SELECTOR, ".BudgetUpgradeWrapper-budget .text-foreground")
-                budget = budget_el.text.strip()
-            except:
-                budget = "N/A"
-
-            try:
-                desc_el = c.find_element(By.CSS_SELECTOR, "p[data-margin-bottom]")
-                description = desc_el.get_attribute("innerText").split("\n")[0].strip()
-            except:
-                description = ""
-
-            try:
-                skill_els = c.find_elements(By.CSS_SELECTOR, ".SkillsWrapper .Content")
-                skills = [s.text.strip() for s in skill_els if s.text.strip()]
-            except:
-                skills = []
-
-            # Combine title + skills for filtering
-            title_clean = title.lower().strip()
-            skills_clean = [s.lower().strip() for s in skills if s.strip()]
-            combined_text = " ".join([title_clean] + skills_clean)
-
-            skip_project = False
-            for keyword in exclude_keywords:
-                if keyword in combined_text:
-                    print(f"❌ Skipping project (excluded by filter): {title} (matched: {keyword})")
-                    skip_project = True
-                    break
+    if scan:
+        if not reached_known:
+            scan.feed(extract_cards(driver))
+        return scan.finish()
 
-                
-            if skip_project:
-                continue  # Skip this project entirely
-            
-            projects.append({
-                "title": title,
-                "link": link,
-                "budget": budget,
-                "description": description,
-                "skills": skills,
-            })
-        except:
-            continue
+    # Extract all cards (old and new layouts) in one round trip
+    return extract_cards(driver)
 
-    # --- New format (search-result-list) ---
-    new_cards = driver.find_elements(By.CSS_SELECTOR, "ul.search-result-list li")
-    for c in new_cards:
+def find_projects(driver, discovery=None, scan=None, wait_for_driver=None):
+    """
+    wait_for_driver is called before the browser is used when HTTP discovery fails, since the
+    driver is shared with a bidding worker that may be mid-bid (WebDriver is not thread-safe).
+    """
+    cards = None
+    if discovery:
         try:
-            title_el = c.find_element(By.CSS_SELECTOR, ".info-card-title a")
-            title = title_el.text.strip()
-            link = title_el.get_attribute("href")
-            
-            try:
-                budget_span = c.find_element(By.CSS_SELECTOR, ".info-card-price span")
-                budget = budget_span.text.strip() if budget_span else "N/A"
-            except:
-                budget = "N/A"
+            with timed("discovery.http"):
+                cards = discovery.fetch_projects()
+        except Exception as e:
+            log.warning(f"⚠️ HTTP discovery failed, falling back to browser: {e}")
+            if wait_for_driver:
+                wait_for_driver()
+    if cards is None:
+        cards = scrape_projects(driver, scan)
+        if discovery:
+            # The session may have rotated since startup; the next poll sends the browser's current cookies
+            discovery.load_cookies(driver.get_cookies())
+
+    with timed("discovery.filter", cards=len(cards)):
+        # All cards are matched against the compiled rule set in one pass
+        projects = []
+        for p, rule in zip(cards, get_filter().evaluate_batch(cards)):
+            if rule:
+                log.info(f"❌ Skipping project (excluded by filter): {p.get('title', 'N/A')} (matched: {rule})",
+                         extra={"link": p.get("link", ""), "rule": rule})
+            elif parse_budget(p.get("budget")).below_floor():
+                log.info(f"💸 Skipping low-budget project: {p.get('title', 'N/A')} ({p.get('budget', 'N/A')})",
+                         extra={"link": p.get("link", ""), "budget": p.get("budget", "")})
+                inc("bidder_cards_below_budget_total", help="Cards rejected by the budget floor.")
+            else:
+                projects.append(p)
+
+        finalProjects = []
+        dedupe = get_dedupe_index()
+        reposts = get_repost_index() if REPOST_DETECTION else None
+        for p in projects:
+            status = dedupe.status(p)
+            if status == SUBMITTED:
+                mark_skipped(p, "Already bid previously")
+                continue
+            elif status == SKIPPED:
+                continue
+            # Same job reposted under another title/link: caught by description before any navigation
+            repost = reposts.match(p) if reposts else None
+            if repost:
+                similarity, original = repost
+                log.info(f"♊ Skipping repost of {original['status']} project '{original['title']}': "
+                         f"{p.get('title', 'N/A')} (similarity {similarity:.2f})",
+                         extra={"link": p.get("link", ""), "original": original["link"]})
+                mark_skipped(p, "Near-duplicate of a previous project")
+                continue
+            finalProjects.append(p)
 
-            try:
-                description = c.find_element(By.CSS_SELECTOR, ".info-card-description").text.strip()
-            except:
-                description = ""
+    if RESTRICT_PREDICTION and finalProjects:
+        # Likely restricted projects would cost a page load and a wait for a bid form that never appears
+        with timed("discovery.restrict", projects=len(finalProjects)):
+            finalProjects = get_restriction_predictor().filter(finalProjects)
 
-            try:
-                skill_els = c.find_elements(By.CSS_SELECTOR, ".info-card-skills span")
-                skills = [s.text.strip() for s in skill_els if s.text.strip()]
-            except:
-                skills = []
-
-            # Filter using exclude_keywords
-            title_clean = title.lower().strip()
-            skills_clean = [s.lower().strip() for s in skills if s.strip()]
-            combined_text = " ".join([title_clean] + skills_clean)
-
-            skip_project = False
-            for keyword in exclude_keywords:
-                if keyword in combined_text:
-                    print(f"❌ Skipping project (excluded by filter): {title} (matched: {keyword})")
-                    skip_project = True
-                    break
-                
-            if skip_project:
-                continue  # Skip this project entirely
-            
-            projects.append({
-                "title": title,
-                "link": link,
-                "budget": budget,
-                "description": description,
-                "skills": skills,
-            })
-        except:
-            continue
-
-    finalProjects = []
-    submitted_bids = load_submitted_bids()
-    skipped_bids = load_skipped_bids()
-    for p in projects:
-        pTitle = p.get("title", "N/A")
-        if pTitle in submitted_bids:
-            mark_skipped(p, "Already bid previously")
-            continue
-        elif pTitle in skipped_bids:
-            continue
-        else:
-            finalProjects.append(p)
+    if RANKING and finalProjects:
+        # Best-fit projects first; low scorers never cost a page visit or an LLM call
+        with timed("discovery.rank", projects=len(finalProjects)):
+            finalProjects = get_ranker().rank(finalProjects)
 
-    print(f"🔍 Found {len(finalProjects)} projects after filtering.")
+    inc("bidder_cards_seen_total", len(cards), help="Project cards returned by discovery.")
+    inc("bidder_projects_new_total", len(finalProjects), help="Unseen projects left after filtering.")
+    log.info(f"🔍 Found {len(finalProjects)} projects after filtering.", extra={"cards": len(cards), "new": len(finalProjects)})
     return finalProjects
 
-def prefill_bid(project):
-    # Load existing bids
+def prefill_bid(driver, project, pipeline=None):
+    # Check existing bids
     daysState = True
-    submitted_bids = load_submitted_bids()
-    skipped_bids = load_skipped_bids()
+    status = get_dedupe_index().status(project)
     title = project.get("title", "N/A")
 
-    if title in submitted_bids:
+    if status == SUBMITTED:
         mark_skipped(project, "Already bid previously")
+        if pipeline:
+            pipeline.discard(project)
         return False
-    elif title in skipped_bids:
+    elif status == SKIPPED:
+        if pipeline:
+            pipeline.discard(project)
         return False
 
-    driver.get(project["link"])
+    link = project.get("link", "")
+    nav_start = time.perf_counter()
+    with timed("bid.navigate", link=link):
+        driver.get(project["link"])
     wait = WebDriverWait(driver, 10)
 
     # Print project details beautifully
-    print("\n" + "="*60)
-    print("📌 Project Details")
-    print("="*60)
-    print(f"Title      : {title}")
-    print(f"Budget     : {project.get('budget', 'N/A')}")
-    print(f"Description: {project.get('description', 'N/A')}")
-    print("="*60 + "\n")
+    log.info("\n" + "\n".join([
+        "="*60,
+        "📌 Project Details",
+        "="*60,
+        f"Title      : {title}",
+        f"Budget     : {project.get('budget', 'N/A')}",
+        f"Description: {project.get('description', 'N/A')}",
+        "="*60,
+    ]), extra={"link": link})
 
     # Extract full description from page
     try:
-        full_desc_el = wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "app-project-details-description .ProjectDescription fl-interactive-text .ContentWrapper span")
+        with timed("bid.full_description", link=link):
+            full_desc_el = wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "app-project-details-description .ProjectDescription fl-interactive-text .ContentWrapper span")
+                )
             )
-        )
         full_description = full_desc_el.get_attribute("innerText").strip()
     except:
         full_description = project.get("description", "N/A")
 
     # Check that all required input fields exist
     try:
-        amount_el = wait.until(EC.presence_of_element_located((By.ID, "bidAmountInput")))
+        with timed("bid.form_wait", link=link):
+            amount_el = wait.until(EC.presence_of_element_located((By.ID, "bidAmountInput")))
+        form_ms = (time.perf_counter() - nav_start) * 1000
+        log.info(f"⏱ Bid form ready in {form_ms:.0f}ms", extra={"link": link, "form_ready_ms": round(form_ms)})
         try:
             period_el = driver.find_element(By.ID, "periodInput")
             period_type = "days"
@@ -300,58 +392,92 @@ def prefill_bid(project):
             period_type = "hours"
         desc_el = driver.find_element(By.ID, "descriptionTextArea")
     except Exception as e:
-        print("⚠️ Proposal restricted!")
+        log.warning("⚠️ Proposal restricted!", extra={"link": link})
         mark_skipped(project, "Cannot bid on this project due to restrictions")
+        if pipeline:
+            pipeline.discard(project)
         return False
 
     min_budget = get_min_budget(project.get("budget", "0"))
-    proposal = generate_bid(
-        project_title=title,
-        project_desc=full_description,
-        budget=min_budget
-    )
+    if pipeline:
+        # Pre-generated from card data while the browser was busy; may still be streaming
+        chunks = pipeline.take_stream(project)
+    else:
+        chunks = generate_proposal(project, full_description)
 
     try:
-        # Fill Bid Amount
-        driver.execute_script("""
-            const input = arguments[0];
-            const value = arguments[1];
-            input.value = value;
-            input.dispatchEvent(new Event('input', { bubbles: true }));
-            input.dispatchEvent(new Event('change', { bubbles: true }));
-        """, amount_el, min_budget)
-
-        # Fill Period / Weekly
+        fill_start = time.perf_counter()
         if period_type == "days":
             days = 5
-            period_el.clear()
-            period_el.send_keys(str(days))
+            period_field, period_value = period_el, days
         else:
             daysState = False
-            weekly_el.clear()
-            weekly_el.send_keys(str(50))
-
-        # Fill Proposal / Description
-        desc_el.clear()
-        desc_el.send_keys(proposal)
+            period_field, period_value = weekly_el, 50
+
+        proposal, waited, fast = "", 0.0, False
+        if BID_FAST_FILL:
+            # One script needs the whole proposal, so wait for it instead of typing sentence by sentence
+            wait_start = time.perf_counter()
+            proposal = "".join(chunks).strip()
+            waited = time.perf_counter() - wait_start
+            fast = fast_fill(driver, [amount_el, period_field, desc_el], [min_budget, period_value, proposal])
+            if not fast:
+                log.info("↩️ Fast fill rejected by the form, typing instead", extra={"link": link})
+                chunks = [proposal]
+
+        if not fast:
+            # Fill Bid Amount
+            driver.execute_script("""
+                const input = arguments[0];
+                const value = arguments[1];
+                input.value = value;
+                input.dispatchEvent(new Event('input', { bubbles: true }));
+                input.dispatchEvent(new Event('change', { bubbles: true }));
+            """, amount_el, min_budget)
+
+            # Fill Period / Weekly
+            period_field.clear()
+            period_field.send_keys(str(period_value))
+
+            # Fill Proposal / Description, typing each sentence as soon as it is generated
+            desc_el.clear()
+            proposal = ""
+            chunks = iter(chunks)
+            while True:
+                wait_start = time.perf_counter()
+                chunk = next(chunks, None)
+                waited += time.perf_counter() - wait_start
+                if chunk is None:
+                    break
+                desc_el.send_keys(chunk)
+                proposal += chunk
+            proposal = proposal.strip()
+        observe_stage("bid.proposal_wait", waited, link=link, pipelined=bool(pipeline))
+        observe_stage("bid.fill", time.perf_counter() - fill_start - waited, link=link, chars=len(proposal), fast=fast)
         
         try:
             # Wait until the Place Bid button is clickable and click it
-            place_bid_btn = WebDriverWait(driver, 20).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//fl-button[@fltrackinglabel='PlaceBidButton']//button[contains(text(),'Place Bid')]")
+            with timed("bid.click", link=link):
+                place_bid_btn = WebDriverWait(driver, 20).until(
+                    EC.element_to_be_clickable(
+                        (By.XPATH, "//fl-button[@fltrackinglabel='PlaceBidButton']//button[contains(text(),'Place Bid')]")
+                    )
                 )
-            )
-            place_bid_btn.click()
+                if PERFORMANCE_LOG:
+                    drain_performance_log(driver)  # only traffic after the click matters
+                place_bid_btn.click()
 
-            # Wait for redirection (URL change)
+            # Wait for the bid creation response (or the redirect)
             try:
-                WebDriverWait(driver, 10).until(lambda d: "bidCreated=true" in d.current_url)
-                print(f"✅ Proposal submitted successfully! Budget: {min_budget}, Time: {'5 days' if period_type == 'days' else '50 hours'}")
+                with timed("bid.confirm", link=link):
+                    if not confirm_bid(driver):
+                        raise TimeoutException("bid creation not confirmed")
+                log.info(f"✅ Proposal submitted successfully! Budget: {min_budget}, Time: {'5 days' if period_type == 'days' else '50 hours'}",
+                         extra={"link": link, "min_budget": min_budget})
 
                 # Save submitted bid
                 if daysState:
-                    submitted_bids[title] = {
+                    bid = {
                         "title": title,
                         "budget": project.get("budget", "N/A"),
                         "description": project.get("description", "N/A"),
@@ -362,7 +488,7 @@ def prefill_bid(project):
                         "link": project.get("link", "")
                     }
                 else:
-                    submitted_bids[title] = {
+                    bid = {
                         "title": title,
                         "budget": project.get("budget", "N/A"),
                         "description": project.get("description", "N/A"),
@@ -372,21 +498,21 @@ def prefill_bid(project):
                         "hours": 50,
                         "link": project.get("link", "")
                     }
-                save_submitted_bids(submitted_bids)
+                save_submitted_bid(bid)
                 return True
 
             except TimeoutException:
-                print("⚠️ Bid submission not confirmed. Retrying or marking skipped.")
+                log.warning("⚠️ Bid submission not confirmed. Retrying or marking skipped.", extra={"link": link})
                 mark_skipped(project, "Bid not confirmed (no redirect with bidCreated=true)")
                 return False
 
         except Exception as e:
-            print("⚠️ Could not click Place Bid button:", e)
+            log.warning(f"⚠️ Could not click Place Bid button: {e}", extra={"link": link})
             mark_skipped(project, "Could not place bid due to exception")
             return False
 
     except Exception as e:
-        print("❌ Proposal skipped successfully!")
+        log.error("❌ Proposal skipped successfully!", extra={"link": link})
         mark_skipped(project, "Unhandled exception during prefill")
         return False
 
@@ -394,25 +520,61 @@ def prefill_bid(project):
 def main():
     EMAIL = os.getenv("EMAIL")
     PASSWORD = os.getenv("PSSWD")
-    session_bids = 0
 
-    login_freelancer(EMAIL, PASSWORD)
+    start_http_server()
+    pipeline = ProposalPipeline(generate_proposal, generate_batch=generate_proposals) if PIPELINE_WORKERS > 0 else None
 
-    while True:  # Loop indefinitely
-        print("\n🔄 Fetching new projects...")
-        print_bid_stats(session_bids)
-        projects = find_projects()
+    discovery = HttpDiscovery(DISCOVERY_URL) if DISCOVERY_BACKEND == "http" else None
 
-        for p in projects:
-            ok = prefill_bid(p)
-            if ok:
-                session_bids += 1
-                print_bid_stats(session_bids)
-                time.sleep(1)
-                continue
+    def start_session(i):
+        driver = create_driver(f"worker-{i}")
+        if has_valid_session(driver):
+            log.info(f"✅ Reusing saved session (worker {i})")
+        else:
+            login_freelancer(driver, EMAIL, PASSWORD)
+        return driver
+
+    # One logged-in browser session per bidding worker, started in parallel
+    workers = max(1, BID_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        drivers = list(executor.map(start_session, range(workers)))
+    if discovery:
+        discovery.load_cookies(drivers[0].get_cookies())
+
+    def place_bid(driver, project):
+        with timed("bid.total", link=project.get("link", "")):
+            ok = prefill_bid(driver, project, pipeline)
+        if ok:
+            time.sleep(1)
+        return ok
+
+    def evicted(project, reason):
+        if pipeline:
+            pipeline.discard(project)
+
+    # Every project a worker finishes frees its pipeline slot, so failures before take_stream cannot leak it
+    pool = BidWorkerPool(drivers, place_bid, on_placed=print_bid_stats, bid_queue=BidQueue(on_evict=evicted),
+                         on_release=pipeline.discard if pipeline else None)
+    scan = IncrementalScan(get_dedupe_index()) if INCREMENTAL_DISCOVERY else None
+    poller = AdaptivePoller()
 
-        print("⏱ Waiting 1000ms before checking for new projects...")
-        time.sleep(1)
+    while True:  # Loop indefinitely
+        log.info("🔄 Fetching new projects...")
+        print_bid_stats(pool.placed)
+        # drivers[0] also belongs to a bidding worker, so a browser fallback waits for the queue to drain
+        projects = find_projects(drivers[0], discovery, scan, wait_for_driver=pool.join)
+        added = pool.submit(projects)
+        if pipeline:
+            # Pre-generate in queue order so a fresher, higher-value arrival is generated next
+            pipeline.feed(pool.queue.snapshot())
+
+        if not discovery:
+            # Browser discovery reuses the first worker's session, so let the queue drain first.
+            # HTTP discovery keeps polling while workers bid, and new arrivals preempt pending ones.
+            pool.join()
+        write_textfile()
+
+        poller.wait(added)
 
 
 if __name__ == "__main__":
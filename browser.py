@@ -0,0 +1,165 @@
+# browser.py
+import os
+import json
+import time
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.options import Options
+
+DRIVER_CACHE_FILE = os.getenv("DRIVER_CACHE_FILE", ".chromedriver.json")
+DRIVER_CACHE_TTL = float(os.getenv("DRIVER_CACHE_TTL", str(7 * 24 * 3600)))
+# Persistent Chrome profiles keep cookies between runs; set to "" to use throwaway profiles
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", "chrome-profile")
+CHROME_HEADLESS = os.getenv("CHROME_HEADLESS", "0") == "1"
+SESSION_CHECK_URL = os.getenv("SESSION_CHECK_URL", "https://www.freelancer.com/robots.txt")
+SESSION_COOKIE = os.getenv("SESSION_COOKIE", "GETAFREE_AUTH_HASH_V2")
+# Page that needs a login and redirects to /login without one; an expired server-side session
+# keeps its cookie, so the cookie alone does not prove the login is still valid
+SESSION_VALIDATE_URL = os.getenv("SESSION_VALIDATE_URL", "https://www.freelancer.com/dashboard")
+SESSION_REDIRECT_WAIT = float(os.getenv("SESSION_REDIRECT_WAIT", "3"))  # seconds to wait for a client-side redirect
+
+# "fast" = eager page loads + DevTools blocking of images/fonts/media/trackers, "full" = browser defaults
+PAGE_LOAD_PROFILE = os.getenv("PAGE_LOAD_PROFILE", "fast")
+BLOCKED_URL_PATTERNS = [
+    # images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    # fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # media
+    "*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav",
+    # analytics, ads and trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*clarity.ms*", "*segment.io*",
+    "*nr-data.net*", "*bat.bing.com*", "*linkedin.com/px*", "*sentry.io*",
+]
+# Comma-separated substrings; any blocked pattern containing one of them is allowed again (e.g. "*.svg,hotjar")
+RESOURCE_ALLOWLIST = [a.strip() for a in os.getenv("RESOURCE_ALLOWLIST", "").split(",") if a.strip()]
+# Buffer DevTools Network events in Chrome's performance log so responses can be observed directly
+PERFORMANCE_LOG = os.getenv("PERFORMANCE_LOG", "1") == "1"
+
+_driver_path = None
+_driver_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """Resolve the chromedriver binary once, caching the path on disk between runs."""
+    global _driver_path
+    with _driver_lock:
+        if _driver_path:
+            return _driver_path
+        try:
+            with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if os.path.exists(cached["path"]) and time.time() - cached["resolved_at"] < DRIVER_CACHE_TTL:
+                _driver_path = cached["path"]
+                return _driver_path
+        except (OSError, ValueError, KeyError):
+            pass
+        _driver_path = ChromeDriverManager().install()
+        with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"path": _driver_path, "resolved_at": time.time()}, f)
+        return _driver_path
+
+
+def blocked_url_patterns(allowlist=None) -> list:
+    """Return the DevTools block list minus anything matched by the allow-list."""
+    allowlist = RESOURCE_ALLOWLIST if allowlist is None else allowlist
+    return [p for p in BLOCKED_URL_PATTERNS if not any(a in p for a in allowlist)]
+
+
+def create_driver(profile: str = "default", page_load: str = PAGE_LOAD_PROFILE, headless: bool = CHROME_HEADLESS):
+    """Launch a new Chrome session, reusing the named persistent profile if enabled."""
+    # --- configure Selenium ---
+    options = Options()
+    options.add_argument("--start-maximized")
+    if headless:
+        options.add_argument("--headless=new")
+    if CHROME_PROFILE_DIR:
+        # Each concurrent session needs its own user-data-dir
+        options.add_argument(f"--user-data-dir={os.path.abspath(os.path.join(CHROME_PROFILE_DIR, profile))}")
+    if page_load == "fast":
+        # Return from driver.get() at DOMContentLoaded; callers already wait for the elements they need
+        options.page_load_strategy = "eager"
+    if PERFORMANCE_LOG:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    if page_load == "fast":
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+    return driver
+
+
+def drain_performance_log(driver):
+    """Return and clear the DevTools events buffered since the last call; None if the log is unavailable."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+    events = []
+    for entry in entries:
+        try:
+            events.append(json.loads(entry["message"])["message"])
+        except (ValueError, KeyError, TypeError):
+            continue
+    return events
+
+
+def wait_for_response(driver, url_part: str, method: str = "POST", timeout: float = 10.0, poll: float = 0.05,
+                      done=None):
+    """
+    Watch the performance log for a `method` request to a URL containing url_part and return
+    (status, body) once its response has finished loading. Status is 0 when the request failed
+    or its response headers were not logged. None if the log is unavailable, done(driver) turns
+    true first, or nothing matching completes within timeout. Call drain_performance_log() first
+    to skip older traffic.
+    """
+    deadline = time.monotonic() + timeout
+    requests = {}  # requestId -> status (None until the response headers arrive)
+    while time.monotonic() < deadline:
+        if done and done(driver):
+            return None
+        events = drain_performance_log(driver)
+        if events is None:
+            return None
+        for event in events:
+            params = event.get("params", {})
+            rid = params.get("requestId")
+            name = event.get("method")
+            if name == "Network.requestWillBeSent":
+                request = params.get("request", {})
+                if request.get("method") == method and url_part in request.get("url", ""):
+                    requests[rid] = None
+            elif name == "Network.responseReceived" and rid in requests:
+                requests[rid] = params.get("response", {}).get("status")
+            elif name in ("Network.loadingFinished", "Network.loadingFailed") and rid in requests:
+                if name == "Network.loadingFailed":
+                    return 0, ""
+                try:
+                    body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": rid}).get("body", "")
+                except Exception:
+                    body = ""
+                return requests[rid] or 0, body
+        time.sleep(poll)
+    return None
+
+
+def has_valid_session(driver) -> bool:
+    """
+    Login check: look for the auth cookie on a tiny page first, then confirm the session with
+    an authenticated page that would redirect to /login.
+    """
+    try:
+        driver.get(SESSION_CHECK_URL)
+        if driver.get_cookie(SESSION_COOKIE) is None:
+            return False
+        driver.get(SESSION_VALIDATE_URL)
+        deadline = time.monotonic() + SESSION_REDIRECT_WAIT
+        while time.monotonic() < deadline:
+            if "/login" in driver.current_url:
+                return False
+            time.sleep(0.1)
+        return "/login" not in driver.current_url
+    except Exception:
+        return False
@@ -0,0 +1,101 @@
+# budget.py
+import os
+import re
+import json
+import functools
+from logger import get_logger
+
+BUDGET_CURRENCY = os.getenv("BUDGET_CURRENCY", "USD")  # base currency for comparisons
+# Floors in the base currency, checked on card data before any page visit; 0 disables them
+BUDGET_MIN_FIXED = float(os.getenv("BUDGET_MIN_FIXED", "0"))    # against the top of a fixed-price range
+BUDGET_MIN_HOURLY = float(os.getenv("BUDGET_MIN_HOURLY", "0"))  # against the top of an hourly rate range
+BUDGET_RATES_FILE = os.getenv("BUDGET_RATES_FILE", "")  # optional JSON {"CODE": USD per unit} overriding RATES
+
+# Offline table of USD per unit of each currency; approximate, only used to rank and filter
+RATES = {
+    "USD": 1.0, "EUR": 1.08, "GBP": 1.27, "INR": 0.012, "AUD": 0.66, "CAD": 0.73, "NZD": 0.60,
+    "SGD": 0.74, "HKD": 0.128, "JPY": 0.0067, "CHF": 1.13, "SEK": 0.095, "NOK": 0.094, "DKK": 0.145,
+    "PLN": 0.25, "ZAR": 0.055, "AED": 0.27, "SAR": 0.27, "MXN": 0.055, "BRL": 0.19, "PHP": 0.018,
+    "PKR": 0.0036, "BDT": 0.0084, "IDR": 0.000063, "MYR": 0.22, "CNY": 0.14, "KRW": 0.00074,
+}
+# Used when a card shows a symbol but no currency code
+SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR", "¥": "JPY"}
+
+_AMOUNT = r"\d[\d,]*(?:\.\d+)?"
+_RANGE_RE = re.compile(rf"(?P<symbol>[$€£₹¥])?\s*(?P<min>{_AMOUNT})\s*(?:(?P<open>\+)|[–—-]\s*[$€£₹¥]?\s*(?P<max>{_AMOUNT}))?")
+_CODE_RE = re.compile(r"\b[A-Z]{3}\b")
+_HOURLY_RE = re.compile(r"(?:\bper hour\b|/\s*h(?:ou)?r\b|\bhourly\b)", re.I)
+
+log = get_logger("budget")
+
+
+def load_rates(path: str = BUDGET_RATES_FILE) -> dict:
+    rates = dict(RATES)
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                rates.update({k.upper(): float(v) for k, v in json.load(f).items()})
+        except (OSError, ValueError, AttributeError) as e:
+            log.warning(f"⚠️ Could not load currency rates from {path}: {e}")
+    return rates
+
+
+_rates = load_rates()
+
+
+class Budget:
+    """
+    A card budget such as 'Budget ₹12,500 – 37,500 INR' or 'Budget $15+ USD per hour'.
+    Amounts are in the project's currency (what the bid form expects); to_base() converts them.
+    """
+
+    def __init__(self, text: str, currency, minimum, maximum, hourly: bool):
+        self.text = text
+        self.currency = currency  # ISO code, None if unknown
+        self.minimum = minimum    # None if the text has no amount
+        self.maximum = maximum    # None for open-ended ranges like '$15+'
+        self.hourly = hourly
+
+    def to_base(self, amount, base: str = BUDGET_CURRENCY):
+        """Amount converted to the base currency; None if the amount or either rate is unknown."""
+        if amount is None or self.currency not in _rates or base not in _rates:
+            return None
+        return amount * _rates[self.currency] / _rates[base]
+
+    @property
+    def top(self):
+        return self.maximum if self.maximum is not None else self.minimum
+
+    def value(self, hourly_hours: float = 1.0) -> float:
+        """Top of the range in the base currency (raw amount if the currency is unknown), hourly scaled."""
+        top = self.top or 0.0
+        converted = self.to_base(top)
+        amount = converted if converted is not None else top
+        return amount * hourly_hours if self.hourly else amount
+
+    def below_floor(self, min_fixed: float = BUDGET_MIN_FIXED, min_hourly: float = BUDGET_MIN_HOURLY) -> bool:
+        """True only if the budget is known and even its top is under the applicable floor."""
+        floor = min_hourly if self.hourly else min_fixed
+        top = self.to_base(self.top)
+        return floor > 0 and top is not None and top < floor
+
+    def __repr__(self):
+        return (f"Budget({self.minimum}-{self.maximum} {self.currency}"
+                f"{' hourly' if self.hourly else ''}, text={self.text!r})")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_budget(text) -> Budget:
+    text = (text or "").strip()
+    m = _RANGE_RE.search(text)
+    if not m:
+        return Budget(text, None, None, None, bool(_HOURLY_RE.search(text)))
+    minimum = float(m.group("min").replace(",", ""))
+    maximum = float(m.group("max").replace(",", "")) if m.group("max") else None
+    if maximum is None and not m.group("open"):
+        maximum = minimum
+    codes = _CODE_RE.findall(text)
+    known = [c for c in codes if c in _rates]
+    # An unlisted code still beats guessing from a '$' shared by many currencies
+    currency = known[0] if known else codes[0] if codes else SYMBOLS.get(m.group("symbol"))
+    return Budget(text, currency, minimum, maximum, bool(_HOURLY_RE.search(text)))
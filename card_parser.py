@@ -0,0 +1,272 @@
+# card_parser.py
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from selenium.webdriver.common.by import By
+
+# Extracts every card (old ProjectCard layout and new search-result-list layout)
+# in a single round trip to chromedriver.
+EXTRACT_CARDS_JS = r"""
+const text = (el) => el ? (el.innerText || el.textContent || "").trim() : "";
+const texts = (els) => Array.from(els).map(text).filter(Boolean);
+// Posting age ("5 minutes ago") and bid count ("12 bids") from the card text, if shown
+const meta = (el) => {
+    const t = text(el);
+    const age = t.match(/\b(?:just now|(?:\d+|an?|a few)\s+(?:second|minute|hour|day|week)s?\s+ago)\b/i);
+    const bids = t.match(/\b(\d+)\s+bids?\b/i);
+    return {posted: age ? age[0] : "", bid_count: bids ? parseInt(bids[1], 10) : null};
+};
+const projects = [];
+
+document.querySelectorAll(".ProjectCard").forEach((c) => {
+    const titleEl = c.querySelector(".Title-text");
+    const linkEl = c.closest("a") || c.querySelector("a");
+    if (!titleEl || !linkEl) return;
+    const budgetEl = c.querySelector(".BudgetUpgradeWrapper-budget .text-foreground");
+    const descEl = c.querySelector("p[data-margin-bottom]");
+    projects.push({
+        title: text(titleEl),
+        link: linkEl.href,
+        budget: budgetEl ? text(budgetEl) : "N/A",
+        description: descEl ? (descEl.innerText || "").split("\n")[0].trim() : "",
+        skills: texts(c.querySelectorAll(".SkillsWrapper .Content")),
+        ...meta(c),
+    });
+});
+
+document.querySelectorAll("ul.search-result-list li").forEach((c) => {
+    const titleEl = c.querySelector(".info-card-title a");
+    if (!titleEl) return;
+    const budgetEl = c.querySelector(".info-card-price span");
+    projects.push({
+        title: text(titleEl),
+        link: titleEl.href,
+        budget: budgetEl ? text(budgetEl) : "N/A",
+        description: text(c.querySelector(".info-card-description")),
+        skills: texts(c.querySelectorAll(".info-card-skills span")),
+        ...meta(c),
+    });
+});
+
+return projects;
+"""
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+              "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav",
+              "ol", "p", "pre", "section", "table", "tr", "ul"}
+SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+
+_POSTED_RE = re.compile(r"\b(?:just now|(?:\d+|an?|a few)\s+(?:second|minute|hour|day|week)s?\s+ago)\b", re.I)
+_BIDS_RE = re.compile(r"\b(\d+)\s+bids?\b", re.I)
+
+
+def card_meta(text: str) -> dict:
+    """Posting age text and bid count from a card's text (same rules as EXTRACT_CARDS_JS)."""
+    posted = _POSTED_RE.search(text or "")
+    bids = _BIDS_RE.search(text or "")
+    return {"posted": posted.group(0) if posted else "", "bid_count": int(bids.group(1)) if bids else None}
+
+
+class Node:
+    __slots__ = ("tag", "attrs", "classes", "children", "parent")
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.classes = set((self.attrs.get("class") or "").split())
+        self.children = []
+        self.parent = parent
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds a minimal element tree; tolerant of unclosed tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#root", [], None)
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.stack[-1].children.append(Node(tag, attrs, self.stack[-1]))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def _iter(node):
+    for child in node.children:
+        if isinstance(child, Node):
+            yield child
+            yield from _iter(child)
+
+def _find_all(node, pred):
+    return [n for n in _iter(node) if pred(n)]
+
+def _find(node, pred):
+    return next((n for n in _iter(node) if pred(n)), None)
+
+def _has_class(name):
+    return lambda n: name in n.classes
+
+def _text(node) -> str:
+    """Approximate innerText: block elements break lines, whitespace is collapsed."""
+    parts = []
+
+    def walk(n):
+        for child in n.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag not in SKIP_TEXT_TAGS:
+                if child.tag in BLOCK_TAGS:
+                    parts.append("\n")
+                walk(child)
+                if child.tag in BLOCK_TAGS:
+                    parts.append("\n")
+
+    if node is not None:
+        walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line).strip()
+
+def _closest(node, tag):
+    while node is not None and node.tag != "#root":
+        if node.tag == tag:
+            return node
+        node = node.parent
+    return None
+
+
+def parse_cards_html(html: str, base_url: str = "") -> list:
+    """Parse a page_source snapshot offline into the same project dicts as EXTRACT_CARDS_JS."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    root = builder.root
+    projects = []
+
+    # --- Old format (ProjectCard) ---
+    for c in _find_all(root, _has_class("ProjectCard")):
+        title_el = _find(c, _has_class("Title-text"))
+        link_el = _closest(c, "a") or _find(c, lambda n: n.tag == "a")
+        if title_el is None or link_el is None:
+            continue
+        wrapper = _find(c, _has_class("BudgetUpgradeWrapper-budget"))
+        budget_el = _find(wrapper, _has_class("text-foreground")) if wrapper else None
+        desc_el = _find(c, lambda n: n.tag == "p" and "data-margin-bottom" in n.attrs)
+        skills = []
+        for wrapper in _find_all(c, _has_class("SkillsWrapper")):
+            skills += [t for t in (_text(s) for s in _find_all(wrapper, _has_class("Content"))) if t]
+        projects.append({
+            "title": _text(title_el),
+            "link": urljoin(base_url, link_el.attrs.get("href") or ""),
+            "budget": _text(budget_el) if budget_el else "N/A",
+            "description": _text(desc_el).split("\n")[0].strip() if desc_el else "",
+            "skills": skills,
+            **card_meta(_text(c)),
+        })
+
+    # --- New format (search-result-list) ---
+    for ul in _find_all(root, lambda n: n.tag == "ul" and "search-result-list" in n.classes):
+        for c in _find_all(ul, lambda n: n.tag == "li"):
+            title_box = _find(c, _has_class("info-card-title"))
+            title_el = _find(title_box, lambda n: n.tag == "a") if title_box else None
+            if title_el is None:
+                continue
+            price = _find(c, _has_class("info-card-price"))
+            budget_el = _find(price, lambda n: n.tag == "span") if price else None
+            skills = []
+            for wrapper in _find_all(c, _has_class("info-card-skills")):
+                skills += [t for t in (_text(s) for s in _find_all(wrapper, lambda n: n.tag == "span")) if t]
+            projects.append({
+                "title": _text(title_el),
+                "link": urljoin(base_url, title_el.attrs.get("href") or ""),
+                "budget": _text(budget_el) if budget_el else "N/A",
+                "description": _text(_find(c, _has_class("info-card-description"))),
+                "skills": skills,
+                **card_meta(_text(c)),
+            })
+
+    return projects
+
+
+def extract_cards_script(driver) -> list:
+    """All cards in one execute_script round trip."""
+    return driver.execute_script(EXTRACT_CARDS_JS) or []
+
+def extract_cards_html(driver) -> list:
+    """All cards from one page_source snapshot, parsed offline."""
+    return parse_cards_html(driver.page_source, driver.current_url)
+
+def extract_cards_webdriver(driver) -> list:
+    """Legacy per-element extraction (several chromedriver round trips per card)."""
+    projects = []
+
+    # --- Old format (ProjectCard) ---
+    for c in driver.find_elements(By.CLASS_NAME, "ProjectCard"):
+        try:
+            title = c.find_element(By.CSS_SELECTOR, ".Title-text").text.strip()
+            link = c.find_element(By.XPATH, ".//ancestor::a[1]").get_attribute("href")
+
+            try:
+                budget = c.find_element(By.CSS_SELECTOR, ".BudgetUpgradeWrapper-budget .text-foreground").text.strip()
+            except Exception:
+                budget = "N/A"
+
+            try:
+                desc_el = c.find_element(By.CSS_SELECTOR, "p[data-margin-bottom]")
+                description = desc_el.get_attribute("innerText").split("\n")[0].strip()
+            except Exception:
+                description = ""
+
+            skill_els = c.find_elements(By.CSS_SELECTOR, ".SkillsWrapper .Content")
+            skills = [s.text.strip() for s in skill_els if s.text.strip()]
+        except Exception:
+            continue
+        projects.append({"title": title, "link": link, "budget": budget, "description": description, "skills": skills,
+                         **card_meta(c.text)})
+
+    # --- New format (search-result-list) ---
+    for c in driver.find_elements(By.CSS_SELECTOR, "ul.search-result-list li"):
+        try:
+            title_el = c.find_element(By.CSS_SELECTOR, ".info-card-title a")
+            title = title_el.text.strip()
+            link = title_el.get_attribute("href")
+
+            try:
+                budget = c.find_element(By.CSS_SELECTOR, ".info-card-price span").text.strip()
+            except Exception:
+                budget = "N/A"
+
+            try:
+                description = c.find_element(By.CSS_SELECTOR, ".info-card-description").text.strip()
+            except Exception:
+                description = ""
+
+            skill_els = c.find_elements(By.CSS_SELECTOR, ".info-card-skills span")
+            skills = [s.text.strip() for s in skill_els if s.text.strip()]
+        except Exception:
+            continue
+        projects.append({"title": title, "link": link, "budget": budget, "description": description, "skills": skills,
+                         **card_meta(c.text)})
+
+    return projects
+
+
+EXTRACTORS = {
+    "script": extract_cards_script,
+    "html": extract_cards_html,
+    "webdriver": extract_cards_webdriver,
+}
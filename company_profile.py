@@ -0,0 +1,26 @@
+# company_profile.py
+
+# AlphaFusion Corporation profile
+
+ALPHAFUSION_PROFILE = """
+AlphaFusion Corporation is a next-generation technology company that bridges the power of Artificial Intelligence, Machine Learning, and Advanced Software Engineering to build intelligent solutions for the modern world. Our expertise spans finance, cybersecurity, automation, data analytics, cloud infrastructure, and full-stack development — empowering global businesses to innovate, scale, and lead with confidence.
+
+We engineer intelligence into everything we build. Our teams combine deep technical expertise with a strong understanding of real-world business needs to deliver AI-powered software systems, custom applications, and next-generation digital platforms that drive measurable impact.
+
+Core Domains:
+1) AI & ML – Predictive modeling, NLP, computer vision, recommendation systems, autonomous decision engines.
+2) Software & Web Development – Full-stack apps, APIs, enterprise-grade platforms (React, Next.js, Node.js, Python, etc.).
+3) Fintech & Data Analytics – Advanced trading dashboards, AI-powered market forecasting (TradeShark engine), global data visualization.
+4) Cybersecurity – Zero Trust architectures, threat detection, encryption, AI-driven security automation.
+5) Automation & Cloud – Scalable cloud deployments (AWS, Azure, GCP), Kubernetes, DevOps, intelligent process automation.
+
+Vision:
+Redefine how businesses interact with technology — fusing AI, automation, and human creativity to empower innovation, trust, and transformation. Deliver intelligent systems that evolve with business needs.
+
+Why Work With Us:
+- Cross-disciplinary expertise across AI, enterprise platforms, and cloud systems.
+- Custom-built solutions tailored to every business.
+- End-to-end delivery from concept to deployment.
+- Innovation-driven culture leveraging emerging technologies.
+- Trusted by clients worldwide across finance, defense, healthcare, retail, and smart infrastructure.
+"""
@@ -0,0 +1,120 @@
+# dedupe.py
+import os
+import math
+import hashlib
+import threading
+from bid_store import get_store, project_key
+
+DEDUPE_BLOOM = os.getenv("DEDUPE_BLOOM", "0") == "1"
+DEDUPE_EXPECTED_ITEMS = int(os.getenv("DEDUPE_EXPECTED_ITEMS", "1000000"))
+DEDUPE_FP_RATE = float(os.getenv("DEDUPE_FP_RATE", "0.001"))
+
+SUBMITTED = "submitted"
+SKIPPED = "skipped"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a single blake2b digest."""
+
+    def __init__(self, expected_items: int, fp_rate: float):
+        self.size = max(8, int(-expected_items * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class DedupeIndex:
+    """
+    In-memory "seen?" index over submitted and skipped projects, loaded once per process.
+    With use_bloom=True only Bloom filters are kept in memory and positives are confirmed
+    against the bid store, which bounds memory for very large histories.
+    """
+
+    def __init__(self, store=None, use_bloom: bool = DEDUPE_BLOOM,
+                 expected_items: int = DEDUPE_EXPECTED_ITEMS, fp_rate: float = DEDUPE_FP_RATE):
+        self.store = store or get_store()
+        self.use_bloom = use_bloom
+        self.lock = threading.Lock()
+        self.in_flight = set()  # keys currently being bid on by a worker
+        if use_bloom:
+            self.keys = {SUBMITTED: BloomFilter(expected_items, fp_rate), SKIPPED: BloomFilter(expected_items, fp_rate)}
+        else:
+            self.keys = {SUBMITTED: set(), SKIPPED: set()}
+        self._load()
+
+    def _load(self):
+        for status, table in ((SUBMITTED, "submitted_bids"), (SKIPPED, "skipped_bids")):
+            for link, title in self.store.iter_keys(table):
+                self.keys[status].add(project_key({"link": link, "title": title}))
+
+    def _contains(self, status: str, key: str) -> bool:
+        if key not in self.keys[status]:
+            return False
+        if not self.use_bloom:
+            return True
+        # Bloom positive: confirm with a primary-key lookup to rule out false positives
+        table = "submitted_bids" if status == SUBMITTED else "skipped_bids"
+        return self.store.has_project_id(table, key)
+
+    def status(self, project: dict):
+        """Return 'submitted', 'skipped' or None for a project."""
+        key = project_key(project)
+        with self.lock:
+            if self._contains(SUBMITTED, key):
+                return SUBMITTED
+            if self._contains(SKIPPED, key):
+                return SKIPPED
+        return None
+
+    def seen(self, project: dict) -> bool:
+        return self.status(project) is not None
+
+    def claim(self, project: dict) -> bool:
+        """Reserve a project for one worker. Returns False if another worker holds it."""
+        key = project_key(project)
+        with self.lock:
+            if key in self.in_flight:
+                return False
+            self.in_flight.add(key)
+        return True
+
+    def is_claimed(self, project: dict) -> bool:
+        with self.lock:
+            return project_key(project) in self.in_flight
+
+    def release(self, project: dict):
+        with self.lock:
+            self.in_flight.discard(project_key(project))
+
+    def add_submitted(self, project: dict):
+        with self.lock:
+            self.keys[SUBMITTED].add(project_key(project))
+
+    def add_skipped(self, project: dict):
+        with self.lock:
+            self.keys[SKIPPED].add(project_key(project))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_dedupe_index() -> DedupeIndex:
+    """Return the process-wide dedupe index, building it on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = DedupeIndex()
+        return _index
@@ -0,0 +1,99 @@
+# http_discovery.py
+import os
+import json
+import time
+import urllib3
+from urllib.parse import urljoin
+from card_parser import parse_cards_html
+from logger import get_logger
+
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "4"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+USER_AGENT = os.getenv(
+    "HTTP_USER_AGENT",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0 Safari/537.36",
+)
+
+log = get_logger("http_discovery")
+
+
+def _format_budget(budget: dict, currency: dict, hourly: bool) -> str:
+    """Render an API budget like the cards do, e.g. 'Budget $250 – 750 USD'."""
+    def fmt(n):
+        return f"{int(n):,}" if n is not None else ""
+    minimum, maximum = budget.get("minimum"), budget.get("maximum")
+    amount = f"{fmt(minimum)}+" if not maximum else f"{fmt(minimum)} – {fmt(maximum)}"
+    text = f"Budget {currency.get('sign', '')}{amount} {currency.get('code', '')}".strip()
+    return text + " per hour" if hourly else text
+
+
+def parse_projects_json(data: dict, base_url: str) -> list:
+    """Map a projects API response ({'result': {'projects': [...]}}) to project dicts."""
+    result = data.get("result") if isinstance(data, dict) else None
+    if not isinstance(result, dict) or "projects" not in result:
+        raise ValueError(f"Unexpected projects API response: {str(data)[:200]}")
+    projects = []
+    for p in result["projects"]:
+        seo_url = p.get("seo_url") or ""
+        project = {
+            "title": (p.get("title") or "").strip(),
+            "link": urljoin(base_url, f"/projects/{seo_url}") if seo_url else "",
+            "budget": _format_budget(p.get("budget") or {}, p.get("currency") or {}, p.get("type") == "hourly"),
+            "description": (p.get("preview_description") or "").strip(),
+            "skills": [j.get("name", "") for j in p.get("jobs") or [] if j.get("name")],
+            "skill_ids": [j["id"] for j in p.get("jobs") or [] if "id" in j],
+            "bid_count": (p.get("bid_stats") or {}).get("bid_count"),
+        }
+        if p.get("time_submitted"):
+            project["posted_at"] = float(p["time_submitted"])
+        projects.append(project)
+    return projects
+
+
+class HttpDiscovery:
+    """
+    Browserless project discovery over a keep-alive, connection-pooled HTTP session.
+    Reuses the logged-in browser's cookies and parses either the JSON projects API
+    or the search page HTML into the same project dicts as find_projects.
+    """
+
+    def __init__(self, url: str, pool_size: int = HTTP_POOL_SIZE, timeout: float = HTTP_TIMEOUT):
+        self.url = url
+        self.http = urllib3.PoolManager(
+            num_pools=pool_size,
+            maxsize=pool_size,
+            timeout=urllib3.Timeout(total=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+            headers={"User-Agent": USER_AGENT, "Accept": "application/json, text/html;q=0.9"},
+        )
+        self.cookie_header = ""
+
+    def load_cookies(self, cookies):
+        """Take cookies as returned by driver.get_cookies()."""
+        self.cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+
+    def fetch_projects(self) -> list:
+        """
+        Fetch and parse the discovery URL. A page that parses to no cards raises like an HTTP
+        error, since it is far more likely a login wall or a layout change than an empty market.
+        """
+        headers = {"Cookie": self.cookie_header} if self.cookie_header else {}
+        start = time.perf_counter()
+        resp = self.http.request("GET", self.url, headers=headers)
+        if resp.status != 200:
+            raise RuntimeError(f"Discovery request failed with HTTP {resp.status}")
+        content_type = resp.headers.get("Content-Type", "")
+        if "json" in content_type:
+            projects = parse_projects_json(json.loads(resp.data), self.url)
+        else:
+            page = resp.data.decode("utf-8", errors="replace")
+            projects = parse_cards_html(page, self.url)
+            if not projects and page.strip():
+                raise RuntimeError(f"Discovery page parsed to no project cards ({len(page)} bytes)")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        log.info(f"🌐 HTTP discovery fetched {len(projects)} projects in {elapsed_ms:.0f}ms",
+                 extra={"projects": len(projects), "elapsed_ms": round(elapsed_ms, 1)})
+        return projects
+
+    def close(self):
+        self.http.clear()
@@ -0,0 +1,56 @@
+# incremental.py
+import os
+from dedupe import project_key
+
+INCREMENTAL_DISCOVERY = os.getenv("INCREMENTAL_DISCOVERY", "1") == "1"
+INCREMENTAL_STOP_AFTER = int(os.getenv("INCREMENTAL_STOP_AFTER", "5"))
+
+
+class IncrementalScan:
+    """
+    Tracks the newest project seen by the previous poll so discovery can stop scrolling
+    as soon as it reaches known projects. Results are listed newest first, so everything
+    below the previous poll's newest card (or below a run of already seen cards) is known.
+    """
+
+    def __init__(self, dedupe, stop_after: int = INCREMENTAL_STOP_AFTER):
+        self.dedupe = dedupe
+        self.stop_after = max(1, stop_after)
+        self.newest_key = None
+        self.start()
+
+    def start(self):
+        """Reset per-poll state before a new scan."""
+        self.processed = 0
+        self.known_run = 0
+        self.first_key = None
+        self.fresh = []
+
+    def feed(self, cards) -> bool:
+        """
+        Process the cards currently on the page (cumulative, in page order).
+        Returns True once a known project is reached and scrolling can stop.
+        """
+        for card in cards[self.processed:]:
+            self.processed += 1
+            key = project_key(card)
+            if self.first_key is None:
+                self.first_key = key
+            if key == self.newest_key:
+                return True
+            if self.dedupe.seen(card):
+                self.known_run += 1
+                if self.known_run >= self.stop_after:
+                    return True
+                continue
+            self.known_run = 0
+            self.fresh.append(card)
+        return False
+
+    def finish(self) -> list:
+        """Remember this poll's newest card and return the unseen cards found."""
+        if self.first_key is not None:
+            self.newest_key = self.first_key
+        fresh = self.fresh
+        self.start()
+        return fresh
@@ -0,0 +1,185 @@
+# keyword_filter.py
+import os
+import re
+import json
+import time
+import bisect
+import threading
+from logger import get_logger
+
+FILTER_RULES_FILE = os.getenv("FILTER_RULES_FILE", "filter_rules.json")
+FILTER_RELOAD_INTERVAL = float(os.getenv("FILTER_RELOAD_INTERVAL", "5"))
+FIELDS = ("title", "skills", "description")
+DEFAULT_RULES = {
+    "exclude": [{"keyword": k} for k in ["wordpress", "woocommerce", "template", "shopify", "wix"]],
+    "include": [],
+}
+_FLAGS = re.IGNORECASE | re.MULTILINE
+_INLINE_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+# Neither whitespace nor a word character (unlike \x1e, which \s matches), so \s/\w runs
+# in a rule cannot continue from one card into the next
+_CARD_SEPARATOR = "\n\x00\n"
+
+log = get_logger("keyword_filter")
+
+
+class Rule:
+    """One include/exclude rule: a keyword, a regex, a skill name or a skill ID."""
+
+    def __init__(self, spec: dict, kind: str):
+        self.kind = kind
+        self.fields = tuple(spec.get("fields", FIELDS))
+        self.skill_id = spec.get("skill_id")
+        self.standalone = False  # compiled on its own rather than into the shared alternation
+        if "keyword" in spec:
+            # Keywords match whole words, plurals included: "template" hits "Templates" but not
+            # "contemplate"; lookarounds rather than \b so ".net" and "c++" match too
+            self.label = f"keyword:{spec['keyword']}"
+            self.pattern = r"(?<!\w)" + re.escape(spec["keyword"]) + r"(?:e?s)?(?!\w)"
+        elif "regex" in spec:
+            self.label = f"regex:{spec['regex']}"
+            self.pattern = spec["regex"]
+            # Groups, backreferences and inline flags would clash inside the alternation
+            self.standalone = re.compile(self.pattern, _FLAGS).groups > 0 or bool(_INLINE_FLAGS_RE.match(self.pattern))
+        elif "skill" in spec:
+            self.label = f"skill:{spec['skill']}"
+            self.fields = ("skills",)
+            self.pattern = r"(?:^|\|)" + re.escape(spec["skill"].strip()) + r"(?:\||$)"
+        elif self.skill_id is not None:
+            self.label = f"skill_id:{self.skill_id}"
+            self.pattern = None
+        else:
+            raise ValueError(f"Unsupported filter rule: {spec}")
+
+
+def _field_text(project: dict, field: str) -> str:
+    if field == "skills":
+        return "|".join(s.strip() for s in project.get("skills", []) if s.strip())
+    return " ".join((project.get(field) or "").split())
+
+
+class CompiledRules:
+    """
+    All regex-based rules of one kind compiled into a single case-insensitive alternation per
+    field set; the named group that matched identifies the rule that fired. Regex rules with
+    their own groups or inline flags are compiled separately and scanned over the same text.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.skill_ids = {r.skill_id: r for r in rules if r.skill_id is not None}
+        self.groups = []  # [(fields, [(compiled regex, {group name: rule} or the rule)])]
+        by_fields = {}
+        for rule in rules:
+            if rule.pattern is not None:
+                by_fields.setdefault(rule.fields, []).append(rule)
+        for fields, field_rules in by_fields.items():
+            names = {f"r{i}": rule for i, rule in enumerate(field_rules) if not rule.standalone}
+            regexes = []
+            if names:
+                regexes.append((re.compile("|".join(f"(?P<{name}>{rule.pattern})" for name, rule in names.items()),
+                                           _FLAGS), names))
+            regexes.extend((re.compile(rule.pattern, _FLAGS), rule) for rule in field_rules if rule.standalone)
+            self.groups.append((fields, regexes))
+
+    def match_batch(self, projects: list) -> list:
+        """Return the first rule that fires for each project (or None), scanning each field set once."""
+        fired = [None] * len(projects)
+        for fields, regexes in self.groups:
+            offsets, parts, pos = [], [], 0
+            for p in projects:
+                text = "\n".join(_field_text(p, f) for f in fields)
+                offsets.append(pos)
+                parts.append(text)
+                pos += len(text) + len(_CARD_SEPARATOR)
+            document = _CARD_SEPARATOR.join(parts)
+            for regex, names in regexes:
+                for m in regex.finditer(document):
+                    i = bisect.bisect_right(offsets, m.start()) - 1
+                    if fired[i] is None:
+                        fired[i] = names[m.lastgroup] if isinstance(names, dict) else names
+        if self.skill_ids:
+            for i, p in enumerate(projects):
+                if fired[i] is None:
+                    fired[i] = next((self.skill_ids[s] for s in p.get("skill_ids", []) if s in self.skill_ids), None)
+        return fired
+
+
+class KeywordFilter:
+    """Include/exclude rule engine loaded from a JSON rules file, recompiled when the file changes."""
+
+    def __init__(self, path: str = FILTER_RULES_FILE, reload_interval: float = FILTER_RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.lock = threading.Lock()
+        self.mtime = None
+        self.checked_at = 0.0
+        try:
+            self._compile(self._read() or DEFAULT_RULES)
+        except Exception as e:
+            log.error(f"❌ Invalid filter rules in {self.path}, using the built-in rules: {e}")
+            self._compile(DEFAULT_RULES)
+
+    def _read(self):
+        try:
+            self.mtime = os.path.getmtime(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _compile(self, spec: dict):
+        exclude = CompiledRules([Rule(r, "exclude") for r in spec.get("exclude", [])])
+        include = CompiledRules([Rule(r, "include") for r in spec.get("include", [])])
+        with self.lock:
+            self.exclude, self.include = exclude, include
+
+    def maybe_reload(self):
+        """Recompile if the rules file changed; a broken file keeps the previous rules."""
+        now = time.monotonic()
+        if now - self.checked_at < self.reload_interval:
+            return
+        self.checked_at = now
+        try:
+            if os.path.getmtime(self.path) == self.mtime:
+                return
+            spec = self._read()
+            self._compile(spec)
+            log.info(f"🔁 Reloaded filter rules from {self.path}: "
+                     f"{len(self.exclude.rules)} exclude, {len(self.include.rules)} include")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"⚠️ Ignoring invalid filter rules in {self.path}: {e}")
+
+    def evaluate_batch(self, projects: list) -> list:
+        """Return, per project, the label of the rule that rejects it, or None if it passes."""
+        self.maybe_reload()
+        with self.lock:
+            exclude, include = self.exclude, self.include
+        excluded = exclude.match_batch(projects)
+        included = include.match_batch(projects) if include.rules else None
+        decisions = []
+        for i in range(len(projects)):
+            if excluded[i] is not None:
+                decisions.append(excluded[i].label)
+            elif included is not None and included[i] is None:
+                decisions.append("include:no-match")
+            else:
+                decisions.append(None)
+        return decisions
+
+    def evaluate(self, project: dict):
+        return self.evaluate_batch([project])[0]
+
+
+_filter = None
+_filter_lock = threading.Lock()
+
+def get_filter() -> KeywordFilter:
+    """Return the process-wide keyword filter."""
+    global _filter
+    with _filter_lock:
+        if _filter is None:
+            _filter = KeywordFilter()
+        return _filter
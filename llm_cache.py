@@ -0,0 +1,97 @@
+# llm_cache.py
+import os
+import time
+import json
+import sqlite3
+import hashlib
+import threading
+from logger import get_logger
+from metrics import inc
+
+LLM_CACHE = os.getenv("LLM_CACHE", "1") == "1"
+LLM_CACHE_DB = os.getenv("LLM_CACHE_DB", "llm_cache.db")
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+log = get_logger("llm_cache")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    value       TEXT,
+    created_at  REAL,
+    accessed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses(created_at);
+"""
+
+
+def cache_key(model: str, **inputs) -> str:
+    """SHA-256 over the model and whitespace-normalised inputs, so cosmetic differences still hit."""
+    normalized = {k: " ".join(str(v).split()) if v is not None else "" for k, v in inputs.items()}
+    payload = json.dumps({"model": model, **normalized}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite (WAL) response cache with a TTL and least-recently-used eviction past max_entries."""
+
+    def __init__(self, path: str = LLM_CACHE_DB, ttl: float = LLM_CACHE_TTL,
+                 max_entries: int = LLM_CACHE_MAX_ENTRIES, clock=time.time):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.clock = clock
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def get(self, key: str):
+        now = self.clock()
+        with self.lock:
+            row = self.conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] <= self.ttl:
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                value = row[0]
+            else:
+                self.misses += 1
+                value = None
+        inc("bidder_llm_cache_total", help="LLM response cache lookups.", result="hit" if value is not None else "miss")
+        return value
+
+    def put(self, key: str, value: str):
+        now = self.clock()
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                              (key, value, now, now))
+            self.conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+            excess = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.conn.execute("DELETE FROM responses WHERE key IN "
+                                  "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)", (excess,))
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Return the process-wide response cache, or None when LLM_CACHE=0."""
+    global _cache
+    if not LLM_CACHE:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache()
+        return _cache
@@ -0,0 +1,242 @@
+# llm_router.py
+import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from logger import get_logger
+from metrics import inc, set_gauge, registry
+
+LLM_WINDOW = int(os.getenv("LLM_WINDOW", "50"))                 # rolling samples kept per endpoint
+# Hedge deadline: LLM_HEDGE_FACTOR x the endpoint's rolling p95, clamped to [LLM_HEDGE_MIN, LLM_HEDGE_MAX]
+LLM_HEDGE_FACTOR = float(os.getenv("LLM_HEDGE_FACTOR", "1.0"))
+LLM_HEDGE_MIN = float(os.getenv("LLM_HEDGE_MIN", "2"))
+LLM_HEDGE_MAX = float(os.getenv("LLM_HEDGE_MAX", "30"))
+LLM_HEDGE_DEFAULT = float(os.getenv("LLM_HEDGE_DEFAULT", "10"))  # until there are enough samples for a p95
+LLM_DEADLINE = float(os.getenv("LLM_DEADLINE", "90"))  # overall per request; the caller falls back after it
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "3"))
+LLM_BREAKER_ERROR_RATE = float(os.getenv("LLM_BREAKER_ERROR_RATE", "0.5"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "60"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_MIN_SAMPLES = 5
+
+log = get_logger("llm_router")
+
+
+class NoProviderAvailable(Exception):
+    pass
+
+
+class LLMTimeout(TimeoutError):
+    pass
+
+
+class Endpoint:
+    """One provider/model pair with rolling latency/error statistics and a circuit breaker."""
+
+    def __init__(self, name: str, client, model: str, clock=time.monotonic):
+        self.name = name
+        self.client = client
+        self.model = model
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=LLM_WINDOW)  # seconds, successful calls only
+        self.outcomes = deque(maxlen=LLM_WINDOW)   # True = success
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+
+    def p95(self):
+        with self.lock:
+            if len(self.latencies) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(self.latencies)
+            return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def error_rate(self) -> float:
+        with self.lock:
+            return (self.outcomes.count(False) / len(self.outcomes)) if self.outcomes else 0.0
+
+    def available(self) -> bool:
+        """Closed, or open long enough that one half-open probe is allowed through."""
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.clock() - self.opened_at >= LLM_BREAKER_COOLDOWN:
+                self.state = HALF_OPEN
+                self.probing = False
+            if self.state == HALF_OPEN and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self, seconds: float):
+        with self.lock:
+            self.latencies.append(seconds)
+            self.outcomes.append(True)
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                log.info(f"🟢 LLM endpoint {self.name} recovered, closing circuit breaker")
+            self.state = CLOSED
+            self.probing = False
+        registry.observe("bidder_llm_seconds", seconds, help="LLM latency per endpoint (time to first token when streaming).",
+                         endpoint=self.name)
+        inc("bidder_llm_requests_total", help="LLM requests per endpoint and outcome.", endpoint=self.name, outcome="ok")
+        self._export_state()
+
+    def record_failure(self, error):
+        with self.lock:
+            self.outcomes.append(False)
+            self.consecutive_failures += 1
+            rate = self.outcomes.count(False) / len(self.outcomes)
+            trip = (self.state == HALF_OPEN
+                    or self.consecutive_failures >= LLM_BREAKER_FAILURES
+                    or (len(self.outcomes) >= _MIN_SAMPLES and rate >= LLM_BREAKER_ERROR_RATE))
+            if trip and self.state != OPEN:
+                self.state = OPEN
+                self.opened_at = self.clock()
+                log.warning(f"🔴 Opening circuit breaker for LLM endpoint {self.name}: {error}",
+                            extra={"endpoint": self.name, "error_rate": round(rate, 2)})
+            self.probing = False
+        inc("bidder_llm_requests_total", help="LLM requests per endpoint and outcome.", endpoint=self.name, outcome="error")
+        self._export_state()
+
+    def _export_state(self):
+        set_gauge("bidder_llm_breaker_open", 0 if self.state == CLOSED else 1,
+                  help="1 while an endpoint's circuit breaker is open or half-open.", endpoint=self.name)
+
+
+class RoutedStream:
+    """A won streaming response: replays the first event, records mid-stream failures, closes the response."""
+
+    def __init__(self, endpoint: Endpoint, stream, first_event):
+        self.endpoint = endpoint
+        self.stream = stream
+        self.first_event = first_event
+
+    def __iter__(self):
+        yield self.first_event
+        try:
+            yield from self.stream
+        except Exception as e:
+            self.endpoint.record_failure(e)
+            raise
+
+    def close(self):
+        self.stream.close()
+
+
+class LLMRouter:
+    """
+    Sends each request to the best available endpoint in rank order. If it has not answered by
+    its p95-based deadline, a hedged request goes to the next endpoint and whichever succeeds first wins.
+    Errors fail over immediately; endpoints that keep failing are skipped until their breaker cools down.
+    Once every endpoint has been tried, the request gives up at its overall deadline.
+    """
+
+    def __init__(self, endpoints: list, max_workers: int = 8, overall_deadline: float = LLM_DEADLINE):
+        self.endpoints = endpoints
+        self.overall_deadline = overall_deadline
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+
+    def deadline(self, endpoint: Endpoint) -> float:
+        p95 = endpoint.p95()
+        if p95 is None:
+            return LLM_HEDGE_DEFAULT
+        return min(max(p95 * LLM_HEDGE_FACTOR, LLM_HEDGE_MIN), LLM_HEDGE_MAX)
+
+    def _attempt(self, endpoint: Endpoint, call):
+        start = time.perf_counter()
+        try:
+            result = call(endpoint)
+        except Exception as e:
+            endpoint.record_failure(e)
+            raise
+        endpoint.record_success(time.perf_counter() - start)
+        return result
+
+    def _hedged(self, call, discard=None):
+        """Run call(endpoint) with hedging/failover and return (endpoint, result)."""
+        candidates = iter(self.endpoints)
+        running = {}  # future -> endpoint
+        last_error = None
+        give_up = time.monotonic() + self.overall_deadline
+
+        def discard_running():
+            # Late finishers are discarded when they complete; their endpoints still record the outcome
+            for future in running:
+                if discard:
+                    future.add_done_callback(lambda f: f.exception() is None and discard(f.result()))
+
+        def launch():
+            for endpoint in candidates:
+                if endpoint.available():
+                    running[self.executor.submit(self._attempt, endpoint, call)] = endpoint
+                    return endpoint
+            return None
+
+        current = launch()
+        if current is None:
+            raise NoProviderAvailable("all LLM endpoints have open circuit breakers")
+        deadline = min(time.monotonic() + self.deadline(current), give_up)
+        while running:
+            done, _ = wait(list(running), timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                if time.monotonic() >= give_up:
+                    names = ", ".join(e.name for e in running.values())
+                    inc("bidder_llm_timeouts_total", help="LLM requests abandoned at the overall deadline.")
+                    discard_running()
+                    raise LLMTimeout(f"no LLM answer within {self.overall_deadline:.0f}s (waiting on {names})")
+                # Too slow: hedge on the next endpoint but keep the first request running
+                hedge = launch()
+                if hedge is not None:
+                    inc("bidder_llm_hedges_total", help="Hedged LLM requests sent.", endpoint=hedge.name)
+                    log.info(f"🪁 {current.name} exceeded {self.deadline(current):.1f}s, hedging on {hedge.name}")
+                    current = hedge
+                    deadline = min(time.monotonic() + self.deadline(current), give_up)
+                else:
+                    deadline = give_up  # hedges used up: wait for whichever is running, but not forever
+                continue
+            for future in done:
+                endpoint = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    last_error = e
+                    log.warning(f"⚠️ LLM endpoint {endpoint.name} failed: {e}")
+                    continue
+                discard_running()
+                return endpoint, result
+            if not running and launch() is not None:
+                # Fail over right away instead of waiting for a deadline
+                current = next(iter(running.values()))
+                deadline = min(time.monotonic() + self.deadline(current), give_up)
+        raise last_error or NoProviderAvailable("no LLM endpoint succeeded")
+
+    def complete(self, messages: list, **kwargs):
+        """Non-streaming chat completion; returns (endpoint, completion)."""
+        return self._hedged(lambda e: e.client.chat.completions.create(model=e.model, messages=messages, **kwargs))
+
+    def stream(self, messages: list, **kwargs) -> RoutedStream:
+        """Streaming chat completion; the race is decided by the first content token."""
+        def open_stream(endpoint):
+            stream = endpoint.client.chat.completions.create(model=endpoint.model, messages=messages,
+                                                              stream=True, **kwargs)
+            try:
+                for event in stream:
+                    if event.choices and event.choices[0].delta.content:
+                        return stream, event
+            except Exception:
+                stream.close()
+                raise
+            stream.close()
+            raise ValueError("stream ended without content")
+
+        endpoint, (stream, first) = self._hedged(open_stream, discard=lambda result: result[0].close())
+        return RoutedStream(endpoint, stream, first)
+
+    def snapshot(self) -> list:
+        return [{"endpoint": e.name, "state": e.state, "p95": e.p95(), "error_rate": round(e.error_rate(), 3)}
+                for e in self.endpoints]
@@ -0,0 +1,94 @@
+# logger.py
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # text | json
+LOG_FILE = os.getenv("LOG_FILE", "")
+
+# Attributes every LogRecord has; anything else was passed via extra= and is a structured field
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listeners = []
+_setup_lock = threading.Lock()
+_configured = False
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message plus any extra= fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _start_listener(logger, handlers):
+    """Route a logger through a queue so callers never block on console/file I/O."""
+    q = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    listener = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+
+def _configure():
+    global _configured
+    with _setup_lock:
+        if _configured:
+            return
+        if LOG_FORMAT == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if LOG_FILE:
+            handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8"))
+        for h in handlers:
+            h.setFormatter(formatter)
+
+        root = logging.getLogger("bidder")
+        root.setLevel(LOG_LEVEL)
+        root.propagate = False
+        _start_listener(root, handlers)
+        atexit.register(shutdown)
+        _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a non-blocking structured logger under the 'bidder' namespace."""
+    _configure()
+    return logging.getLogger(f"bidder.{name}")
+
+
+def get_line_writer(name: str, path: str) -> logging.Logger:
+    """Return a non-blocking logger that appends raw lines to a file (used for JSON-lines traces)."""
+    _configure()
+    writer = logging.getLogger(f"lines.{name}")
+    if not writer.handlers:
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        writer.setLevel(logging.INFO)
+        writer.propagate = False
+        _start_listener(writer, [handler])
+    return writer
+
+
+def shutdown():
+    """Flush and stop the background listeners."""
+    while _listeners:
+        _listeners.pop().stop()
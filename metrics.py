@@ -0,0 +1,165 @@
+# metrics.py
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from logger import get_line_writer
+
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", "")  # Prometheus node_exporter textfile, e.g. /var/lib/node_exporter/bidder.prom
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))    # serve /metrics on this port when > 0
+TRACE_FILE = os.getenv("TRACE_FILE", "")              # JSON-lines span trace
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+def _escape(value, quote: bool = False) -> str:
+    """Escape a label value (quote=True) or HELP text for the Prometheus text format."""
+    text = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+class Registry:
+    """Thread-safe counters, gauges and histograms rendered in the Prometheus text format."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.counters = {}    # (name, labels) -> value
+        self.gauges = {}      # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [bucket counts..., sum, count]
+        self.help = {}
+
+    def inc(self, name, amount=1, help="", **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+            self.help.setdefault(name, (help, "counter"))
+
+    def set(self, name, value, help="", **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.gauges[key] = value
+            self.help.setdefault(name, (help, "gauge"))
+
+    def observe(self, name, value, help="", **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            h = self.histograms.get(key)
+            if h is None:
+                h = self.histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+                self.help.setdefault(name, (help, "histogram"))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    h[i] += 1
+            h[-2] += value
+            h[-1] += 1
+
+    def snapshot(self, name, **labels):
+        """Return (count, sum) for a histogram series, or the value of a counter/gauge."""
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            if key in self.histograms:
+                h = self.histograms[key]
+                return h[-1], h[-2]
+            return self.counters.get(key, self.gauges.get(key))
+
+    def render(self) -> str:
+        def fmt_labels(labels, extra=()):
+            items = list(labels) + list(extra)
+            if not items:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape(v, quote=True)}"' for k, v in items) + "}"
+
+        lines = []
+        with self.lock:
+            for name in sorted(self.help):
+                help, kind = self.help[name]
+                lines.append(f"# HELP {name} {_escape(help or name)}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "histogram":
+                    for (n, labels), h in sorted(self.histograms.items()):
+                        if n != name:
+                            continue
+                        for bound, count in zip(self.buckets, h):
+                            lines.append(f"{name}_bucket{fmt_labels(labels, [('le', bound)])} {count}")
+                        lines.append(f"{name}_bucket{fmt_labels(labels, [('le', '+Inf')])} {h[-1]}")
+                        lines.append(f"{name}_sum{fmt_labels(labels)} {h[-2]:.6f}")
+                        lines.append(f"{name}_count{fmt_labels(labels)} {h[-1]}")
+                else:
+                    series = self.counters if kind == "counter" else self.gauges
+                    for (n, labels), value in sorted(series.items()):
+                        if n == name:
+                            lines.append(f"{name}{fmt_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+_trace = get_line_writer("trace", TRACE_FILE) if TRACE_FILE else None
+
+
+def inc(name, amount=1, help="", **labels):
+    registry.inc(name, amount, help, **labels)
+
+def set_gauge(name, value, help="", **labels):
+    registry.set(name, value, help, **labels)
+
+def observe_stage(stage, seconds, **fields):
+    registry.observe("bidder_stage_seconds", seconds, help="Latency of each bidding stage in seconds.", stage=stage)
+    if _trace:
+        span = {"ts": round(time.time(), 3), "stage": stage, "duration_ms": round(seconds * 1000, 2),
+                "thread": threading.current_thread().name}
+        span.update(fields)
+        _trace.info(json.dumps(span, ensure_ascii=False, default=str))
+
+
+@contextmanager
+def timed(stage, **fields):
+    """Record the duration of a block as a stage histogram sample (fields go to the trace span only)."""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        observe_stage(stage, time.perf_counter() - start, outcome=outcome, **fields)
+
+
+def write_textfile(path: str = METRICS_TEXTFILE):
+    """Atomically write the registry for the node_exporter textfile collector."""
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(registry.render())
+    os.replace(tmp, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_http_server(port: int = METRICS_PORT):
+    """Serve /metrics on a daemon thread; returns the server or None when disabled."""
+    if not port:
+        return None
+    server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,167 @@
+# pipeline.py
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from dedupe import project_key
+
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "2"))
+PIPELINE_LOOKAHEAD = int(os.getenv("PIPELINE_LOOKAHEAD", "4"))
+# Up to this many waiting projects share one LLM request when generate_batch is given (1 = off)
+PIPELINE_BATCH = int(os.getenv("PIPELINE_BATCH", "1"))
+
+
+class ChunkStream:
+    """Text produced chunk by chunk on a pipeline thread, readable while it is still being written."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.chunks = []
+        self.done = False
+        self.error = None
+
+    def put(self, chunk: str):
+        with self.cond:
+            self.chunks.append(chunk)
+            self.cond.notify_all()
+
+    def close(self, error=None):
+        with self.cond:
+            self.done = True
+            self.error = error
+            self.cond.notify_all()
+
+    def __iter__(self):
+        """Yield chunks as they arrive; blocks until the next one or the end of the stream."""
+        i = 0
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: len(self.chunks) > i or self.done)
+                if len(self.chunks) > i:
+                    chunk = self.chunks[i]
+                elif self.error:
+                    raise self.error
+                else:
+                    return
+            i += 1
+            yield chunk
+
+
+class ProposalPipeline:
+    """
+    Producer/consumer stage that generates proposals ahead of the browser.
+    Discovered projects are fed in bid order; up to `lookahead` of them are generated
+    on a thread pool while the browser is busy, and `take` hands back the finished proposal.
+    `generate` may return a string or an iterator of chunks; `take_stream` lets the caller
+    consume the chunks while the rest is still being generated. With `generate_batch`
+    (projects -> list of proposals) several waiting projects are generated in one call.
+    """
+
+    def __init__(self, generate, workers: int = PIPELINE_WORKERS, lookahead: int = PIPELINE_LOOKAHEAD,
+                 generate_batch=None, batch_size: int = PIPELINE_BATCH):
+        self.generate = generate
+        self.generate_batch = generate_batch
+        self.batch_size = max(1, batch_size) if generate_batch else 1
+        self.lookahead = max(1, lookahead)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="proposal")
+        self.lock = threading.Lock()
+        self.pending = deque()   # projects waiting for a generation slot
+        self.futures = {}        # project key -> (Future, ChunkStream)
+
+    def feed(self, projects):
+        """
+        Queue projects for pre-generation in the given (bid) order. Projects still waiting
+        for a slot are reordered to match, so a newly arrived high-priority project is generated next.
+        """
+        with self.lock:
+            ordered, keys = [], set(self.futures)
+            for p in projects:
+                key = project_key(p)
+                if key not in keys:
+                    keys.add(key)
+                    ordered.append(p)
+            self.pending = deque(ordered + [p for p in self.pending if project_key(p) not in keys])
+            self._fill()
+
+    def _fill(self):
+        while self.pending and len(self.futures) < self.lookahead:
+            if self.batch_size > 1 and len(self.pending) > 1:
+                group = [self.pending.popleft() for _ in range(min(self.batch_size, len(self.pending)))]
+                entries = [(Future(), ChunkStream()) for _ in group]
+                for p, entry in zip(group, entries):
+                    self.futures[project_key(p)] = entry
+                self.executor.submit(self._run_batch, group, entries)
+                continue
+            p = self.pending.popleft()
+            self.futures[project_key(p)] = self._submit(p)
+
+    def _submit(self, project):
+        stream = ChunkStream()
+        return self.executor.submit(self._run, project, stream), stream
+
+    def _run(self, project, stream) -> str:
+        try:
+            result = self.generate(project)
+            for chunk in ([result] if isinstance(result, str) else result):
+                stream.put(chunk)
+        except Exception as e:
+            stream.close(e)
+            raise
+        stream.close()
+        return "".join(stream.chunks)
+
+    def _run_batch(self, projects, entries):
+        # Projects discarded before the batch started are left out of the request
+        live = [(p, future, stream) for p, (future, stream) in zip(projects, entries)
+                if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        try:
+            proposals = self.generate_batch([p for p, _, _ in live])
+        except Exception as e:
+            for _, future, stream in live:
+                stream.close(e)
+                future.set_exception(e)
+            return
+        for (_, future, stream), proposal in zip(live, proposals):
+            stream.put(proposal)
+            stream.close()
+            future.set_result(proposal)
+
+    def _take(self, project):
+        key = project_key(project)
+        with self.lock:
+            entry = self.futures.pop(key, None)
+            if entry is None:
+                self.pending = deque(p for p in self.pending if project_key(p) != key)
+                entry = self._submit(project)
+            self._fill()
+        return entry
+
+    def take(self, project, timeout=None) -> str:
+        """Return the proposal for a project, generating it now if it was never queued."""
+        future, _ = self._take(project)
+        return future.result(timeout=timeout)
+
+    def take_stream(self, project) -> ChunkStream:
+        """Like take, but returns the chunks as they are generated."""
+        _, stream = self._take(project)
+        return stream
+
+    def discard(self, project):
+        """Drop a project that will not be bid on, cancelling its generation if not started."""
+        key = project_key(project)
+        with self.lock:
+            entry = self.futures.pop(key, None)
+            if entry is not None:
+                entry[0].cancel()
+            self.pending = deque(p for p in self.pending if project_key(p) != key)
+            self._fill()
+
+    def shutdown(self):
+        with self.lock:
+            self.pending.clear()
+            for future, _ in self.futures.values():
+                future.cancel()
+            self.futures.clear()
+        self.executor.shutdown(wait=False)
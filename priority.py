@@ -0,0 +1,159 @@
+# priority.py
+import os
+import re
+import math
+import time
+import heapq
+import queue
+import itertools
+from budget import parse_budget
+from dedupe import project_key
+from logger import get_logger
+from metrics import inc
+
+# Freshness weight halves every PRIORITY_HALF_LIFE seconds of posting age
+PRIORITY_HALF_LIFE = float(os.getenv("PRIORITY_HALF_LIFE", "600"))
+# A project with this many bids counts half as much as an untouched one
+PRIORITY_BID_SCALE = float(os.getenv("PRIORITY_BID_SCALE", "10"))
+# Hourly budgets are valued as this many billed hours
+PRIORITY_HOURLY_HOURS = float(os.getenv("PRIORITY_HOURLY_HOURS", "20"))
+# Pending projects posted longer ago than this are evicted instead of bid on
+PRIORITY_MAX_AGE = float(os.getenv("PRIORITY_MAX_AGE", "3600"))
+PRIORITY_MAX_PENDING = int(os.getenv("PRIORITY_MAX_PENDING", "200"))
+
+_AGE_RE = re.compile(r"\b(\d+|an?|a few)\s+(second|minute|hour|day|week)s?\s+ago\b", re.I)
+_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+
+log = get_logger("priority")
+
+
+def parse_age(text: str):
+    """Seconds since posting from card text like '5 minutes ago' or 'an hour ago'; None if absent."""
+    if not text:
+        return None
+    if "just now" in text.lower():
+        return 0.0
+    m = _AGE_RE.search(text)
+    if not m:
+        return None
+    amount = m.group(1).lower()
+    n = 1 if amount in ("a", "an") else 3 if amount == "a few" else int(amount)
+    return float(n * _UNITS[m.group(2).lower()])
+
+
+def budget_value(project: dict) -> float:
+    """Upper bound of the card's budget in the base currency, scaled for hourly projects."""
+    return parse_budget(project.get("budget")).value(PRIORITY_HOURLY_HOURS)
+
+
+def priority(project: dict) -> float:
+    """
+    Log-priority of a project. Freshness decays exponentially with the posting time, so
+    the relative order of queued projects never changes as they wait and the heap stays valid.
+    """
+    fresh = math.log(2) * project["posted_at"] / PRIORITY_HALF_LIFE
+    value = math.log(math.log10(10 + budget_value(project)))
+    competition = -math.log(1 + (project.get("bid_count") or 0) / PRIORITY_BID_SCALE)
+    relevance = math.log(max(project.get("score", 1.0), 1e-3))
+    return fresh + value + competition + relevance
+
+
+class BidQueue(queue.Queue):
+    """
+    Thread-safe priority queue of pending projects, highest priority first.
+    A fresher, higher-value project put mid-cycle is handed to the next free worker ahead of
+    everything already waiting. Re-discovered projects update their entry instead of duplicating it;
+    entries past PRIORITY_MAX_AGE, or beyond PRIORITY_MAX_PENDING, are evicted.
+    """
+
+    def __init__(self, on_evict=None, max_age: float = PRIORITY_MAX_AGE,
+                 max_pending: int = PRIORITY_MAX_PENDING, clock=time.time):
+        super().__init__()
+        self.on_evict = on_evict  # on_evict(project, reason)
+        self.max_age = max_age
+        self.max_pending = max(1, max_pending)
+        self.clock = clock
+
+    def _init(self, maxsize):
+        self.heap = []      # (-priority, seq, key)
+        self.live = {}      # key -> (seq, project)
+        self.seq = itertools.count()
+
+    def _qsize(self):
+        return len(self.live)
+
+    def _put(self, item):
+        key, project, prio = item
+        seq = next(self.seq)
+        self.live[key] = (seq, project)
+        heapq.heappush(self.heap, (-prio, seq, key))
+
+    def _get(self):
+        while True:
+            _, seq, key = heapq.heappop(self.heap)
+            entry = self.live.get(key)
+            if entry and entry[0] == seq:  # skip entries superseded by a later put
+                del self.live[key]
+                return entry[1]
+
+    def put(self, project, block=True, timeout=None) -> bool:
+        """Queue or refresh a project; returns True if it was not already pending."""
+        if project is None:
+            # Shutdown sentinel: sorts after every real project
+            with self.not_empty:
+                self._put((f"#stop-{next(self.seq)}", None, -math.inf))
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+            return True
+        now = self.clock()
+        key = project_key(project)
+        evicted = []
+        with self.not_empty:
+            pending = self.live.get(key)
+            if pending:
+                # Keep the first estimate of the posting time, refresh bid count and the rest
+                project = dict(project, posted_at=pending[1]["posted_at"])
+            elif "posted_at" not in project:
+                age = parse_age(project.get("posted"))
+                project["posted_at"] = now - (age or 0.0)
+            project["priority"] = round(priority(project), 4)
+            self._put((key, project, project["priority"]))
+            if not pending:
+                self.unfinished_tasks += 1
+                while len(self.live) > self.max_pending:
+                    evicted.append(self._drop_lowest())
+                self.not_empty.notify()
+        for p in evicted:
+            self._evicted(p, "queue full")
+        return not pending
+
+    def _drop_lowest(self):
+        key = min((k for k in self.live if not k.startswith("#stop-")),
+                  key=lambda k: self.live[k][1]["priority"])
+        _, project = self.live.pop(key)
+        self.unfinished_tasks -= 1
+        return project
+
+    def is_stale(self, project) -> bool:
+        return self.clock() - project["posted_at"] > self.max_age
+
+    def evict_if_stale(self, project) -> bool:
+        """Called by a worker after get(); True if the project is too old to bid on."""
+        if not self.is_stale(project):
+            return False
+        self._evicted(project, "stale")
+        return True
+
+    def _evicted(self, project, reason):
+        log.info(f"🗑 Evicted pending project ({reason}): {project.get('title', 'N/A')}",
+                 extra={"link": project.get("link", ""), "reason": reason})
+        inc("bidder_queue_evicted_total", help="Pending projects evicted from the bid queue.", reason=reason)
+        if self.on_evict:
+            self.on_evict(project, reason)
+
+    def snapshot(self) -> list:
+        """Pending projects in the order workers will take them."""
+        with self.mutex:
+            entries = sorted((-self.live[k][1]["priority"], seq, k) for k, (seq, _) in self.live.items()
+                             if not k.startswith("#stop-"))
+            return [self.live[k][1] for _, _, k in entries]
@@ -0,0 +1,175 @@
+# prompt_builder.py
+import os
+import re
+from logger import get_logger
+from metrics import inc
+
+PROMPT_DESC_CHARS = int(os.getenv("PROMPT_DESC_CHARS", "1200"))  # description budget in characters
+PROMPT_EXAMPLE_CHARS = int(os.getenv("PROMPT_EXAMPLE_CHARS", "500"))  # per few-shot example
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # optional: fall back to ~4 characters per token
+    _ENCODING = None
+
+# Skill/title terms that make a profile "Core Domains" entry relevant, keyed by the entry's name
+DOMAIN_KEYWORDS = {
+    "AI & ML": ["ai", "artificial intelligence", "machine learning", "ml", "deep learning", "nlp", "llm", "gpt",
+                "openai", "chatbot", "computer vision", "tensorflow", "pytorch", "data science", "neural",
+                "recommendation", "prediction", "model"],
+    "Software & Web Development": ["web", "website", "api", "backend", "frontend", "full stack", "react", "next.js",
+                                   "node", "python", "django", "fastapi", "flask", "javascript", "typescript", "php",
+                                   "laravel", "mobile", "app", "android", "ios", "flutter", "software", "saas"],
+    "Fintech & Data Analytics": ["finance", "fintech", "trading", "forex", "crypto", "blockchain", "stock",
+                                 "data analysis", "analytics", "dashboard", "visualization", "power bi", "tableau",
+                                 "excel", "statistics", "forecast"],
+    "Cybersecurity": ["security", "cyber", "penetration", "pentest", "encryption", "vulnerability", "malware",
+                      "firewall", "authentication", "zero trust"],
+    "Automation & Cloud": ["automation", "scraping", "scraper", "bot", "aws", "azure", "gcp", "cloud", "devops",
+                           "docker", "kubernetes", "linux", "ci/cd", "serverless", "workflow", "zapier"],
+}
+_DOMAIN_LINE_RE = re.compile(r"^\s*\d+\)\s*(?P<name>.+?)\s+[–-]\s+")
+_REQUIREMENT_RE = re.compile(r"\b(need|must|require|should|deliver|build|develop|integrat|implement|feature|"
+                             r"experience|expert|fix|migrat|deploy|automat)", re.I)
+_BOILERPLATE_RE = re.compile(r"\b(please (include|mention|share|send)|in your (proposal|bid)|looking forward|"
+                             r"thank|contact me|hello|hi there|dear|apply)", re.I)
+_SEGMENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+log = get_logger("prompt_builder")
+
+
+def count_tokens(text: str) -> int:
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return (len(text) + 3) // 4
+
+
+def _contains(text: str, term: str) -> bool:
+    return re.search(r"(?<![a-z0-9])" + re.escape(term) + r"(?![a-z0-9])", text) is not None
+
+
+def summarize(text: str, limit: int = PROMPT_DESC_CHARS, keywords=()) -> str:
+    """
+    Extractive cap on a description: whitespace is collapsed, the opening is kept for context,
+    and the remaining budget goes to the sentences/lines that state requirements or mention
+    the project's skills, in their original order. Polite boilerplate is dropped first.
+    """
+    segments = [" ".join(s.split()) for s in _SEGMENT_SPLIT_RE.split(text or "")]
+    segments = [s for s in segments if s]
+    if sum(len(s) + 1 for s in segments) <= limit:
+        return "\n".join(segments)
+
+    keep, used = set(), 0
+    for i, s in enumerate(segments):  # opening ~40% of the budget
+        if used + len(s) + 1 > limit * 0.4:
+            break
+        keep.add(i)
+        used += len(s) + 1
+
+    keywords = [k.lower() for k in keywords]
+    def score(i):
+        s = segments[i].lower()
+        hits = sum(1 for k in keywords if _contains(s, k))
+        return 2 * hits + bool(_REQUIREMENT_RE.search(s)) - 2 * bool(_BOILERPLATE_RE.search(s))
+
+    for i in sorted((i for i in range(len(segments)) if i not in keep), key=lambda i: (-score(i), len(segments[i]))):
+        if score(i) < 0:
+            break
+        if used + len(segments[i]) + 1 <= limit:
+            keep.add(i)
+            used += len(segments[i]) + 1
+    return "\n".join(segments[i] for i in sorted(keep)) + "\n(…)"
+
+
+class PromptBuilder:
+    """
+    Builds chat messages with every static part (system prompt, rules, company profile minus
+    "Core Domains") in one unchanging system message, so providers can serve it from their
+    prompt prefix cache. The user message carries only the per-project parts: the relevant
+    Core Domains entries and the (capped) project details.
+    """
+
+    def __init__(self, profile: str, system_prompt: str, rules: str, desc_chars: int = PROMPT_DESC_CHARS):
+        self.desc_chars = desc_chars
+        self.domains = []  # (name, line)
+        static = []
+        in_domains = False
+        for line in profile.strip().splitlines():
+            if line.strip() == "Core Domains:":
+                in_domains = True
+                continue
+            m = _DOMAIN_LINE_RE.match(line)
+            if in_domains and m:
+                self.domains.append((m.group("name"), line.strip()))
+                continue
+            in_domains = False
+            static.append(line)
+        self.system = f"{system_prompt}\n\n{rules.strip()}\n\nCompany profile:\n" + "\n".join(static).strip()
+        self.system_tokens = count_tokens(self.system)
+
+    def select_domains(self, title: str, skills) -> list:
+        """Core Domains entries whose keywords appear in the skills or title; all of them if none match."""
+        text = " ".join([title or ""] + list(skills or [])).lower()
+        selected = [line for name, line in self.domains
+                    if any(_contains(text, k) for k in DOMAIN_KEYWORDS.get(name, []))]
+        return selected or [line for _, line in self.domains]
+
+    def _project_block(self, title, description, budget, skills, domains, examples=None) -> str:
+        keywords = list(skills or []) + [k for name, line in self.domains if line in domains
+                                         for k in DOMAIN_KEYWORDS.get(name, [])]
+        lines = [
+            f"Title: {title}",
+            f"Description: {summarize(description, self.desc_chars, keywords)}",
+            f"Budget: {budget or 'Not specified'}",
+        ]
+        for e in examples or []:
+            # Past proposals for similar projects ({'title', 'proposal'}), trimmed to keep the prompt small
+            lines += ["", f"Our proposal for a similar past project ({e['title']}), for reference only - do not copy:",
+                      summarize(e["proposal"], PROMPT_EXAMPLE_CHARS)]
+        return "\n".join(lines)
+
+    def _messages(self, user: str) -> list:
+        user_tokens = count_tokens(user)
+        inc("bidder_prompt_tokens_total", self.system_tokens, help="Estimated prompt tokens sent.", part="static")
+        inc("bidder_prompt_tokens_total", user_tokens, help="Estimated prompt tokens sent.", part="dynamic")
+        log.debug(f"🧾 Prompt ~{self.system_tokens + user_tokens} tokens "
+                  f"({self.system_tokens} cacheable prefix, {user_tokens} per request)",
+                  extra={"static_tokens": self.system_tokens, "dynamic_tokens": user_tokens})
+        return [{"role": "system", "content": self.system}, {"role": "user", "content": user}]
+
+    def build(self, title: str, description: str, budget=None, skills=None, examples=None) -> list:
+        domains = self.select_domains(title, skills)
+        return self._messages("\n".join([
+            "Relevant core domains:",
+            *domains,
+            "",
+            "Write a professional, institution-grade proposal for the following project:",
+            "",
+            self._project_block(title, description, budget, skills, domains, examples),
+        ]))
+
+    def build_batch(self, projects: list) -> list:
+        """
+        One request for several projects ({'id', 'title', 'description', 'budget', 'skills', 'examples'} dicts),
+        answered as JSON: {"proposals": [{"id": ..., "proposal": ...}, ...]}.
+        """
+        domains, blocks = [], []
+        for p in projects:
+            selected = self.select_domains(p["title"], p.get("skills"))
+            domains += [d for d in selected if d not in domains]
+            blocks.append(f"Project ID: {p['id']}\n"
+                          + self._project_block(p["title"], p["description"], p.get("budget"), p.get("skills"), selected,
+                                              p.get("examples")))
+        ordered = [line for _, line in self.domains if line in domains]
+        return self._messages("\n".join([
+            "Relevant core domains:",
+            *ordered,
+            "",
+            f"Write a separate professional, institution-grade proposal for each of the {len(projects)} projects below.",
+            "Every proposal must follow all of the rules above on its own.",
+            'Return only a JSON object of the form {"proposals": [{"id": "<Project ID>", "proposal": "<text>"}]} '
+            "with exactly one entry per Project ID and no other text.",
+            "",
+            "\n\n---\n\n".join(blocks),
+        ]))
@@ -0,0 +1,176 @@
+# proposal_index.py
+import os
+import re
+import json
+import math
+import zlib
+import threading
+from collections import Counter
+import numpy as np
+from bid_generator import clean_proposal
+from bid_store import get_store, project_key
+from text_utils import tokenize, project_text
+from logger import get_logger
+from metrics import inc
+
+PROPOSAL_REUSE = os.getenv("PROPOSAL_REUSE", "1") == "1"
+# At or above this cosine similarity the closest past proposal is adapted instead of calling the model
+PROPOSAL_REUSE_THRESHOLD = float(os.getenv("PROPOSAL_REUSE_THRESHOLD", "0.85"))
+# Below it, up to PROPOSAL_FEWSHOT_K matches scoring at least PROPOSAL_FEWSHOT_MIN become prompt examples
+PROPOSAL_FEWSHOT_K = int(os.getenv("PROPOSAL_FEWSHOT_K", "2"))
+PROPOSAL_FEWSHOT_MIN = float(os.getenv("PROPOSAL_FEWSHOT_MIN", "0.2"))
+PROPOSAL_INDEX_DIM = int(os.getenv("PROPOSAL_INDEX_DIM", "4096"))
+PROPOSAL_INDEX_FILE = os.getenv("PROPOSAL_INDEX_FILE", "proposal_index.f32")  # rows of float32, memory-mapped
+
+_GREETING_RE = re.compile(r"^\s*(?:subject:[^\n]*\n+)?\s*(?:dear|hello|hi)\b[^\n]*\n", re.I)
+_MONEY_RE = re.compile(r"[$€£₹]\s?\d|\d[\d,.]*\s?(?:usd|eur|gbp|inr|aud|cad)\b|\bbudget\b", re.I)
+_SENTENCE_RE = re.compile(r"[^.!?\n]*(?:[.!?]+(?=\s|$)|\n|$)")
+
+log = get_logger("proposal_index")
+
+
+def hash_vector(text: str, dim: int = PROPOSAL_INDEX_DIM) -> np.ndarray:
+    """
+    L2-normalised signed feature-hashing vector of the text's unigrams and bigrams
+    (1 + log tf weights). No vocabulary is kept, so new bids are added without refitting.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for term, tf in Counter(tokenize(text)).items():
+        h = zlib.crc32(term.encode("utf-8"))
+        vector[h % dim] += (1.0 + math.log(tf)) * (1.0 if h & 0x80000000 else -1.0)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def adapt_proposal(proposal: str, old_title: str, new_title: str) -> str:
+    """
+    Cheap local rewrite of a past proposal for a near-identical project: the greeting follows the
+    current rules, the old title is swapped for the new one and budget sentences are dropped.
+    """
+    text = _GREETING_RE.sub("Hello,\n", proposal.strip(), count=1)
+    if not text.startswith("Hello,"):
+        text = "Hello,\n\n" + text
+    if old_title and new_title:
+        text = re.sub(re.escape(old_title), lambda _: new_title, text, flags=re.I)
+    sentences = [s for s in _SENTENCE_RE.findall(text) if s and not _MONEY_RE.search(s)]
+    text = re.sub(r"\n{3,}", "\n\n", "".join(sentences))
+    return clean_proposal(text)
+
+
+class ProposalIndex:
+    """
+    Nearest-neighbour index over submitted bids. Vectors live in a memory-mapped float32 file,
+    one row per bid, with the project key, title and proposal of each row in a JSON-lines sidecar.
+    Rows are appended as bids are saved; a batch of queries is one matrix product.
+    """
+
+    def __init__(self, path: str = PROPOSAL_INDEX_FILE, dim: int = PROPOSAL_INDEX_DIM):
+        self.path = path
+        self.meta_path = os.path.splitext(path)[0] + ".jsonl"
+        self.dim = dim
+        self.lock = threading.Lock()
+        self.entries = []  # {'key', 'title', 'proposal'} per row
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self._open()
+
+    def _open(self):
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            if os.path.getsize(self.path) != len(entries) * self.dim * 4:
+                raise ValueError("index and metadata are out of sync")
+            if any("key" not in e for e in entries):
+                raise ValueError("index predates project keys")  # rebuilt from the bid store
+        except (OSError, ValueError):
+            entries = []
+            for p in (self.path, self.meta_path):
+                open(p, "wb").close()
+        self.entries = entries
+        self._map()
+
+    def _map(self):
+        if self.entries:
+            self.vectors = np.memmap(self.path, dtype=np.float32, mode="r", shape=(len(self.entries), self.dim))
+        else:
+            self.vectors = np.zeros((0, self.dim), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add_many(self, bids: list) -> int:
+        """
+        Append submitted bids (dicts with title, link, full_description/description, proposal)
+        whose project is not indexed yet.
+        """
+        with self.lock:
+            known = {e["key"] for e in self.entries}
+            new = []
+            for b in bids:
+                key = project_key(b)
+                if b.get("proposal") and b.get("title") and key not in known:
+                    known.add(key)
+                    new.append(dict(b, key=key))
+            if not new:
+                return 0
+            matrix = np.stack([hash_vector(project_text(b), self.dim) for b in new])
+            with open(self.path, "ab") as f:
+                f.write(matrix.astype(np.float32).tobytes())
+            entries = [{"key": b["key"], "title": b["title"], "proposal": b["proposal"]} for b in new]
+            with open(self.meta_path, "a", encoding="utf-8") as f:
+                for e in entries:
+                    f.write(json.dumps(e, ensure_ascii=False) + "\n")
+            self.entries.extend(entries)
+            self._map()
+            return len(new)
+
+    def add(self, bid: dict) -> bool:
+        return self.add_many([bid]) > 0
+
+    def nearest(self, texts: list, k: int = 1) -> list:
+        """For each text, up to k (similarity, entry) pairs, most similar first."""
+        with self.lock:
+            vectors, entries = self.vectors, list(self.entries)
+        if not texts:
+            return []
+        if not entries:
+            return [[] for _ in texts]
+        queries = np.stack([hash_vector(t, self.dim) for t in texts])
+        similarity = queries @ vectors.T
+        k = min(k, len(entries))
+        top = np.argsort(-similarity, axis=1)[:, :k]
+        return [[(float(similarity[r, i]), entries[i]) for i in row] for r, row in enumerate(top)]
+
+    def lookup(self, project: dict, description: str = None):
+        """
+        (proposal, examples) for a project: an adapted past proposal when the closest match clears
+        PROPOSAL_REUSE_THRESHOLD (examples empty), otherwise (None, few-shot examples).
+        """
+        text = project_text(dict(project, full_description=description or project.get("description", "")))
+        matches = self.nearest([text], max(1, PROPOSAL_FEWSHOT_K))[0]
+        if matches and matches[0][0] >= PROPOSAL_REUSE_THRESHOLD:
+            similarity, entry = matches[0]
+            proposal = adapt_proposal(entry["proposal"], entry["title"], project.get("title", ""))
+            if proposal:
+                inc("bidder_proposal_reuse_total", help="Proposal index lookups by outcome.", result="adapted")
+                log.info(f"♻️ Reusing proposal of '{entry['title']}' (similarity {similarity:.2f}) "
+                         f"for: {project.get('title', 'N/A')}", extra={"link": project.get("link", "")})
+                return proposal, []
+        examples = [entry for similarity, entry in matches[:PROPOSAL_FEWSHOT_K] if similarity >= PROPOSAL_FEWSHOT_MIN]
+        inc("bidder_proposal_reuse_total", help="Proposal index lookups by outcome.",
+            result="few_shot" if examples else "none")
+        return None, examples
+
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_proposal_index() -> ProposalIndex:
+    """Return the process-wide index, catching up with bids saved since it was last written."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ProposalIndex()
+            added = _index.add_many(list(get_store().load_submitted().values()))
+            if added:
+                log.info(f"📇 Indexed {added} submitted proposals ({len(_index)} total)")
+        return _index
@@ -0,0 +1,157 @@
+# ranking.py
+import os
+import hashlib
+import threading
+import numpy as np
+from company_profile import ALPHAFUSION_PROFILE
+from bid_store import get_store
+from text_utils import tokenize, project_text
+from logger import get_logger
+
+RANKING = os.getenv("RANKING", "1") == "1"
+# Projects scoring below this are dropped before any page visit or LLM call
+RANK_MIN_SCORE = float(os.getenv("RANK_MIN_SCORE", "0.05"))
+# Weight of the company profile vs. the most similar previously submitted bid
+RANK_PROFILE_WEIGHT = float(os.getenv("RANK_PROFILE_WEIGHT", "0.5"))
+RANK_MODEL_FILE = os.getenv("RANK_MODEL_FILE", "ranking_model.npz")
+# New bids are appended to the cached model with its fitted vocabulary and IDF; the model is
+# refitted once the corpus has grown by this fraction since the last fit
+RANK_REFIT_GROWTH = float(os.getenv("RANK_REFIT_GROWTH", "0.25"))
+
+log = get_logger("ranking")
+
+
+class RelevanceModel:
+    """
+    TF-IDF model fitted on the company profile plus the submitted-bid corpus.
+    A batch of projects is scored with one matrix product against all reference vectors:
+    score = w * cos(project, profile) + (1 - w) * max cos(project, past bid).
+    """
+
+    def __init__(self, vocab: list, idf: np.ndarray, references: np.ndarray, fingerprint: str = "",
+                 fitted: int = 0):
+        self.vocab = {term: i for i, term in enumerate(vocab)}
+        self.idf = idf.astype(np.float32)
+        self.references = references.astype(np.float32)  # row 0 = profile, rows 1.. = past bids
+        self.fingerprint = fingerprint  # hash of the documents behind the reference rows
+        self.fitted = fitted  # documents the vocabulary and IDF were fitted on
+
+    @classmethod
+    def fit(cls, documents: list, fingerprint: str = "") -> "RelevanceModel":
+        counts = {}
+        for d in documents:
+            for term in set(tokenize(d)):
+                counts[term] = counts.get(term, 0) + 1
+        # Bigrams seen in a single document only bloat the matrices
+        vocab = sorted(t for t, n in counts.items() if n > 1 or " " not in t)
+        df = np.array([counts[t] for t in vocab], dtype=np.float32)
+        idf = np.log((1 + len(documents)) / (1 + df)) + 1
+        model = cls(vocab, idf, np.zeros((0, len(vocab))), fingerprint, len(documents))
+        model.references = model.transform(documents)
+        return model
+
+    def extend(self, documents: list, fingerprint: str):
+        """Append reference rows for new documents without refitting the vocabulary or IDF."""
+        self.references = np.vstack([self.references, self.transform(documents)])
+        self.fingerprint = fingerprint
+
+    def transform(self, texts: list) -> np.ndarray:
+        """L2-normalised TF-IDF rows; terms outside the fitted vocabulary are ignored."""
+        rows, cols = [], []
+        for r, text in enumerate(texts):
+            for term in tokenize(text):
+                i = self.vocab.get(term)
+                if i is not None:
+                    rows.append(r)
+                    cols.append(i)
+        matrix = np.zeros((len(texts), len(self.vocab)), dtype=np.float32)
+        np.add.at(matrix, (rows, cols), 1.0)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-9)
+
+    def score(self, texts: list, profile_weight: float = RANK_PROFILE_WEIGHT) -> np.ndarray:
+        if not texts:
+            return np.zeros(0, dtype=np.float32)
+        similarity = self.transform(texts) @ self.references.T
+        profile = similarity[:, 0]
+        history = similarity[:, 1:].max(axis=1) if similarity.shape[1] > 1 else profile
+        return profile_weight * profile + (1 - profile_weight) * history
+
+    def save(self, path: str):
+        vocab = np.array(sorted(self.vocab, key=self.vocab.get), dtype=object)
+        with open(path, "wb") as f:
+            np.savez(f, vocab=vocab, idf=self.idf, references=self.references, fingerprint=self.fingerprint,
+                     fitted=self.fitted)
+
+    @classmethod
+    def load(cls, path: str) -> "RelevanceModel":
+        with np.load(path, allow_pickle=True) as data:
+            return cls(list(data["vocab"]), data["idf"], data["references"], str(data["fingerprint"]),
+                       int(data["fitted"]))
+
+
+def _corpus(store=None) -> list:
+    bids = (store or get_store()).load_submitted()
+    return [ALPHAFUSION_PROFILE] + [project_text(b) for b in bids.values()]
+
+
+def _fingerprint(documents: list) -> str:
+    return hashlib.sha1("\x00".join(documents).encode("utf-8")).hexdigest()
+
+
+def load_model(path: str = RANK_MODEL_FILE, store=None) -> RelevanceModel:
+    """
+    Load the cached model and append the bids submitted since it was saved. The bid history only
+    grows, so the cache stays valid while its documents are still the start of the corpus;
+    otherwise, or once the corpus outgrows RANK_REFIT_GROWTH, refit and cache the model.
+    """
+    corpus = _corpus(store)
+    try:
+        model = RelevanceModel.load(path)
+        covered = len(model.references)
+        if (covered <= len(corpus) <= model.fitted * (1 + RANK_REFIT_GROWTH)
+                and model.fingerprint == _fingerprint(corpus[:covered])):
+            if covered < len(corpus):
+                model.extend(corpus[covered:], _fingerprint(corpus))
+                model.save(path)
+            return model
+    except (OSError, ValueError, KeyError):
+        pass
+    model = RelevanceModel.fit(corpus, _fingerprint(corpus))
+    model.save(path)
+    log.info(f"📐 Fitted relevance model on {len(corpus)} documents ({len(model.vocab)} terms)")
+    return model
+
+
+class Ranker:
+    """Scores discovered projects, drops the ones below the threshold and orders the rest best-first."""
+
+    def __init__(self, model: RelevanceModel = None, min_score: float = RANK_MIN_SCORE):
+        self.model = model or load_model()
+        self.min_score = min_score
+
+    def rank(self, projects: list) -> list:
+        scores = self.model.score([project_text(p) for p in projects])
+        ranked = []
+        for p, s in zip(projects, scores):
+            p["score"] = round(float(s), 4)
+            if p["score"] < self.min_score:
+                log.info(f"📉 Skipping low-relevance project: {p.get('title', 'N/A')} (score {p['score']})",
+                         extra={"link": p.get("link", ""), "score": p["score"]})
+                continue
+            ranked.append(p)
+        ranked.sort(key=lambda p: p["score"], reverse=True)
+        return ranked
+
+
+_ranker = None
+_ranker_lock = threading.Lock()
+
+def get_ranker() -> Ranker:
+    """Return the process-wide ranker, loading or fitting the model on first use."""
+    global _ranker
+    with _ranker_lock:
+        if _ranker is None:
+            _ranker = Ranker()
+        return _ranker
@@ -0,0 +1,192 @@
+# repost.py
+import os
+import re
+import json
+import zlib
+import argparse
+import threading
+import numpy as np
+from bid_store import get_store, project_key, BIDS_FILE, SKIPPED_FILE
+from dedupe import SUBMITTED, SKIPPED
+from restriction import RESTRICTED_REASON
+from logger import get_logger
+
+REPOST_DETECTION = os.getenv("REPOST_DETECTION", "1") == "1"
+# Estimated Jaccard similarity of description shingles at which a card counts as a repost
+REPOST_THRESHOLD = float(os.getenv("REPOST_THRESHOLD", "0.7"))
+REPOST_NUM_PERM = int(os.getenv("REPOST_NUM_PERM", "128"))
+REPOST_SHINGLE = int(os.getenv("REPOST_SHINGLE", "3"))      # words per shingle
+# Cards only show the start of a description, so every text is compared on its first N words
+REPOST_MAX_WORDS = int(os.getenv("REPOST_MAX_WORDS", "50"))
+REPOST_MIN_WORDS = int(os.getenv("REPOST_MIN_WORDS", "12"))  # shorter texts are too generic to match
+# Skipped projects are indexed only for outcomes a repost would share. Transient failures would
+# block a repost for good, and indexing near-duplicate skips would chain them onto each other.
+REPOST_SKIP_REASONS = (RESTRICTED_REASON,)
+
+_PRIME = (1 << 61) - 1
+_WORD_RE = re.compile(r"\w+")
+_MORE_RE = re.compile(r"…\s*more\s*$")
+
+log = get_logger("repost")
+
+
+def _words(text: str) -> list:
+    return _WORD_RE.findall(_MORE_RE.sub("", text or "").lower())[:REPOST_MAX_WORDS]
+
+
+def shingles(text: str, k: int = REPOST_SHINGLE) -> np.ndarray:
+    """32-bit hashes of the text's word k-grams; empty if the text is shorter than REPOST_MIN_WORDS."""
+    words = _words(text)
+    if len(words) < max(REPOST_MIN_WORDS, k):
+        return np.zeros(0, dtype=np.uint64)
+    grams = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def lsh_params(threshold: float, num_perm: int):
+    """(bands, rows) with bands * rows <= num_perm whose S-curve midpoint (1/b)^(1/r) is closest to threshold."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class RepostIndex:
+    """
+    MinHash signatures of project descriptions, banded into LSH buckets. A card is looked up
+    by hashing its bands, and only the projects sharing a bucket are compared, so a query costs
+    one signature plus a handful of dictionary lookups however large the history grows.
+    """
+
+    def __init__(self, threshold: float = REPOST_THRESHOLD, num_perm: int = REPOST_NUM_PERM, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = np.random.RandomState(seed)
+        # a, b < 2^32 and 32-bit shingle hashes keep a * x + b below 2^64
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.lock = threading.Lock()
+        self.buckets = [{} for _ in range(self.bands)]  # band -> {band bytes: [record ids]}
+        self.signatures = []
+        self.records = []  # {'title', 'link', 'status'}
+        self.keys = set()  # project keys already indexed
+
+    def signature(self, text: str):
+        hashes = shingles(text)
+        if not len(hashes):
+            return None
+        permuted = (np.outer(hashes, self.a) + self.b) % _PRIME
+        return (permuted.min(axis=0) & 0xFFFFFFFF).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        for i in range(self.bands):
+            yield i, signature[i * self.rows:(i + 1) * self.rows].tobytes()
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, project: dict, status: str) -> bool:
+        """
+        Index a project's description (card text, else the full description). False if the
+        project is already indexed or its description is too short.
+        """
+        key = project_key(project)
+        with self.lock:
+            if key in self.keys:
+                return False
+        signature = self.signature(project.get("description") or project.get("full_description") or "")
+        if signature is None:
+            return False
+        with self.lock:
+            if key in self.keys:
+                return False
+            self.keys.add(key)
+            rid = len(self.records)
+            self.records.append({"title": project.get("title", ""), "link": project.get("link", ""), "status": status})
+            self.signatures.append(signature)
+            for i, key in self._band_keys(signature):
+                self.buckets[i].setdefault(key, []).append(rid)
+        return True
+
+    def match(self, project: dict):
+        """(similarity, record) of the closest indexed project at or above the threshold, else None."""
+        signature = self.signature(project.get("description") or project.get("full_description") or "")
+        if signature is None:
+            return None
+        best = None
+        with self.lock:
+            candidates = set()
+            for i, key in self._band_keys(signature):
+                candidates.update(self.buckets[i].get(key, ()))
+            for rid in candidates:
+                similarity = float(np.mean(self.signatures[rid] == signature))
+                if similarity >= self.threshold and (best is None or similarity > best[0]):
+                    best = (similarity, self.records[rid])
+        return best
+
+    @classmethod
+    def from_store(cls, store=None, **kwargs) -> "RepostIndex":
+        store = store or get_store()
+        index = cls(**kwargs)
+        for bid in store.load_submitted().values():
+            index.add(bid, SUBMITTED)
+        for project in store.load_skipped().values():
+            if project["reason"] in REPOST_SKIP_REASONS:
+                index.add(project, SKIPPED)
+        return index
+
+    @classmethod
+    def from_json(cls, bids_file: str = BIDS_FILE, skipped_file: str = SKIPPED_FILE, **kwargs) -> "RepostIndex":
+        """Rebuild from the legacy JSON history instead of the bid store."""
+        index = cls(**kwargs)
+        for path, status in ((bids_file, SUBMITTED), (skipped_file, SKIPPED)):
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    for title, record in json.load(f).items():
+                        if status == SUBMITTED or record.get("reason") in REPOST_SKIP_REASONS:
+                            index.add(dict(record, title=record.get("title", title)), status)
+        return index
+
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_repost_index() -> RepostIndex:
+    """Return the process-wide repost index, building it from the bid store on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = RepostIndex.from_store()
+            log.info(f"🧬 Indexed {len(_index)} project descriptions for repost detection "
+                     f"({_index.bands} bands x {_index.rows} rows)")
+        return _index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the repost index from history and list near-duplicate projects.")
+    parser.add_argument("--json", action="store_true", help="rebuild from the JSON history instead of the bid store")
+    parser.add_argument("--bids-file", default=BIDS_FILE)
+    parser.add_argument("--skipped-file", default=SKIPPED_FILE)
+    parser.add_argument("--threshold", type=float, default=REPOST_THRESHOLD)
+    args = parser.parse_args()
+
+    if args.json:
+        index = RepostIndex.from_json(args.bids_file, args.skipped_file, threshold=args.threshold)
+    else:
+        index = RepostIndex.from_store(threshold=args.threshold)
+    pairs = 0
+    for rid, signature in enumerate(index.signatures):
+        for other in range(rid + 1, len(index.signatures)):
+            similarity = float(np.mean(index.signatures[other] == signature))
+            if similarity >= args.threshold:
+                pairs += 1
+                print(f"{similarity:.2f}  {index.records[rid]['title']}  <->  {index.records[other]['title']}")
+    print(f"🧬 {len(index)} descriptions indexed, {pairs} near-duplicate pairs at Jaccard >= {args.threshold}")
+
+
+if __name__ == "__main__":
+    main()
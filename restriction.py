@@ -0,0 +1,289 @@
+# restriction.py
+import os
+import re
+import math
+import time
+import zlib
+import argparse
+import threading
+import numpy as np
+from bid_store import get_store
+from budget import parse_budget
+from dedupe import project_key
+from text_utils import tokenize
+from logger import get_logger
+from metrics import inc, set_gauge
+
+RESTRICT_PREDICTION = os.getenv("RESTRICT_PREDICTION", "1") == "1"
+# Cards predicted restricted with at least this probability are skipped without a page visit
+RESTRICT_THRESHOLD = float(os.getenv("RESTRICT_THRESHOLD", "0.7"))
+# The model only skips cards while its cross-validated precision at the threshold stays this high
+RESTRICT_MIN_PRECISION = float(os.getenv("RESTRICT_MIN_PRECISION", "0.85"))
+RESTRICT_MIN_POSITIVES = int(os.getenv("RESTRICT_MIN_POSITIVES", "20"))  # below this the model stays off
+# Title/description tokens overfit while there are only a few dozen restricted examples
+RESTRICT_TEXT_FEATURES = os.getenv("RESTRICT_TEXT_FEATURES", "0") == "1"
+RESTRICT_FOLDS = 5
+RESTRICT_RETRAIN_INTERVAL = float(os.getenv("RESTRICT_RETRAIN_INTERVAL", "3600"))
+RESTRICT_MODEL_FILE = os.getenv("RESTRICT_MODEL_FILE", "restriction_model.npz")
+RESTRICT_DIM = 1 << 12
+# A restricted project costs a page load plus the wait for a bid form that never appears
+RESTRICTED_VISIT_SECONDS = float(os.getenv("RESTRICTED_VISIT_SECONDS", "12"))
+
+RESTRICTED_REASON = "Cannot bid on this project due to restrictions"
+# Skip reasons recorded after the bid form was found, i.e. the project was not restricted
+BIDDABLE_REASONS = ("Could not place bid", "Could not place bid due to exception",
+                    "Bid not confirmed (no redirect with bidCreated=true)")
+
+_SLUG_ID_RE = re.compile(r"-\d{5,}$")
+
+log = get_logger("restriction")
+
+
+def features(project: dict, text: bool = RESTRICT_TEXT_FEATURES) -> list:
+    """
+    Card features: budget shape, link category and slug form, plus title/description tokens if enabled.
+    Skills are left out because the submitted-bid history does not record them, so they would
+    only ever appear on skipped projects and leak the label.
+    """
+    feats = []
+    if text:
+        feats += [f"t:{w}" for w in set(tokenize(project.get("title", ""))) if " " not in w]
+        feats += [f"d:{w}" for w in set(tokenize(project.get("description", ""))) if " " not in w]
+    budget = parse_budget(project.get("budget"))
+    top = budget.to_base(budget.top)
+    feats += [f"currency:{budget.currency}", f"hourly:{budget.hourly}", f"open:{budget.maximum is None}",
+              f"size:{int(math.log2(1 + top)) if top is not None else 'na'}"]
+    parts = (project.get("link") or "").split("?", 1)[0].rstrip("/").split("/")
+    if len(parts) >= 2:
+        feats += [f"category:{parts[-2].lower()}", f"slug_id:{bool(_SLUG_ID_RE.search(parts[-1]))}"]
+    return feats
+
+
+def vectorize(projects: list, dim: int = RESTRICT_DIM) -> np.ndarray:
+    matrix = np.zeros((len(projects), dim), dtype=np.float32)
+    for r, p in enumerate(projects):
+        for f in features(p):
+            matrix[r, zlib.crc32(f.encode("utf-8")) % dim] = 1.0
+    return matrix
+
+
+def training_data(store=None):
+    """(projects, labels) from the bid store: 1 = restricted, 0 = the bid form was reachable."""
+    store = store or get_store()
+    projects, labels = [], []
+    for bid in store.load_submitted().values():
+        projects.append(bid)
+        labels.append(0)
+    for p in store.load_skipped().values():
+        if p["reason"] == RESTRICTED_REASON or p["reason"] in BIDDABLE_REASONS:
+            projects.append(p)
+            labels.append(int(p["reason"] == RESTRICTED_REASON))
+    return projects, np.array(labels, dtype=np.float32)
+
+
+class RestrictionModel:
+    """
+    L2-regularised logistic regression over hashed binary card features, trained with
+    class-balanced full-batch gradient descent. Refitting takes well under a second.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float, fingerprint: str = "", positives: int = 0,
+                 precision: float = 0.0, recall: float = 0.0):
+        self.weights = weights.astype(np.float32)
+        self.bias = float(bias)
+        self.fingerprint = fingerprint
+        self.positives = positives
+        self.precision = precision  # cross-validated, at the threshold it was trained for
+        self.recall = recall
+
+    @classmethod
+    def fit(cls, projects: list, labels: np.ndarray, fingerprint: str = "",
+            l2: float = 1e-2, rate: float = 0.5, epochs: int = 1000) -> "RestrictionModel":
+        x = vectorize(projects)
+        y = labels.astype(np.float32)
+        n_pos = float(y.sum())
+        n_neg = len(y) - n_pos
+        sample = np.where(y == 1, len(y) / (2 * max(n_pos, 1)), len(y) / (2 * max(n_neg, 1))).astype(np.float32)
+        w = np.zeros(x.shape[1], dtype=np.float32)
+        b = 0.0
+        for _ in range(epochs):
+            p = 1 / (1 + np.exp(-(x @ w + b)))
+            g = sample * (p - y) / len(y)
+            w -= rate * (x.T @ g + l2 * w)
+            b -= rate * float(g.sum())
+        return cls(w, b, fingerprint, int(n_pos))
+
+    def predict(self, projects: list) -> np.ndarray:
+        if not projects:
+            return np.zeros(0, dtype=np.float32)
+        return 1 / (1 + np.exp(-(vectorize(projects) @ self.weights + self.bias)))
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            np.savez(f, weights=self.weights, bias=self.bias, fingerprint=self.fingerprint, positives=self.positives,
+                     precision=self.precision, recall=self.recall)
+
+    @classmethod
+    def load(cls, path: str) -> "RestrictionModel":
+        with np.load(path) as data:
+            return cls(data["weights"], float(data["bias"]), str(data["fingerprint"]), int(data["positives"]),
+                       float(data["precision"]), float(data["recall"]))
+
+
+def cross_validate(projects: list, labels: np.ndarray, folds: int = RESTRICT_FOLDS) -> np.ndarray:
+    """Out-of-fold restricted probabilities for every training example."""
+    order = np.random.RandomState(0).permutation(len(projects))
+    probs = np.zeros(len(projects), dtype=np.float32)
+    for k in range(folds):
+        test = order[k::folds]
+        train = np.setdiff1d(order, test)
+        model = RestrictionModel.fit([projects[i] for i in train], labels[train])
+        probs[test] = model.predict([projects[i] for i in test])
+    return probs
+
+
+def precision_recall(probs: np.ndarray, labels: np.ndarray, threshold: float):
+    flagged = probs >= threshold
+    hits = int((flagged & (labels == 1)).sum())
+    return hits / max(int(flagged.sum()), 1), hits / max(int(labels.sum()), 1)
+
+
+def is_active(model: RestrictionModel) -> bool:
+    """Enough restricted examples and a precise enough model to act on its predictions."""
+    return model.positives >= RESTRICT_MIN_POSITIVES and model.precision >= RESTRICT_MIN_PRECISION
+
+
+def _fingerprint(projects: list, labels: np.ndarray) -> str:
+    return f"{len(projects)}:{int(labels.sum())}:{RESTRICT_TEXT_FEATURES}:{RESTRICT_THRESHOLD}"
+
+
+def load_model(path: str = RESTRICT_MODEL_FILE, store=None, train: bool = True):
+    """
+    Load the cached model if it was trained on the current outcomes, otherwise retrain and cache it.
+    Fitting plus cross-validation takes seconds, so with train=False a stale cache gives None instead.
+    """
+    projects, labels = training_data(store)
+    fingerprint = _fingerprint(projects, labels)
+    try:
+        model = RestrictionModel.load(path)
+        if model.fingerprint == fingerprint:
+            return model
+    except (OSError, ValueError, KeyError):
+        pass
+    if not train:
+        return None
+    model = RestrictionModel.fit(projects, labels, fingerprint)
+    if model.positives >= RESTRICT_MIN_POSITIVES:
+        model.precision, model.recall = precision_recall(cross_validate(projects, labels), labels, RESTRICT_THRESHOLD)
+    model.save(path)
+    log.info(f"🚧 Trained restriction model on {len(projects)} outcomes ({model.positives} restricted, "
+             f"cross-validated precision {model.precision:.2f} / recall {model.recall:.2f} at p>={RESTRICT_THRESHOLD})")
+    return model
+
+
+class RestrictionPredictor:
+    """
+    Drops cards that are very likely restricted and keeps count of the page visits that saves.
+    Models are trained on a background thread; discovery keeps using the previous model (or skips
+    nothing before the first one is ready) instead of waiting for the fit.
+    """
+
+    def __init__(self, threshold: float = RESTRICT_THRESHOLD, retrain_interval: float = RESTRICT_RETRAIN_INTERVAL,
+                 path: str = RESTRICT_MODEL_FILE, store=None):
+        self.threshold = threshold
+        self.retrain_interval = retrain_interval
+        self.path = path
+        self.store = store
+        self.lock = threading.Lock()
+        self.avoided = set()  # project keys skipped on a prediction
+        self.training = None  # background training thread, if one is running
+        self.model = load_model(path, store, train=False)
+        self.trained_at = time.monotonic()
+        if self.model is None:
+            self.train()
+
+    def train(self) -> threading.Thread:
+        """Start refitting in the background unless a fit is already running; returns its thread."""
+        with self.lock:
+            if self.training is None:
+                self.training = threading.Thread(target=self._train, name="restriction-train", daemon=True)
+                self.training.start()
+            return self.training
+
+    def _train(self):
+        try:
+            model = load_model(self.path, self.store)
+        except Exception as e:
+            log.warning(f"⚠️ Restriction model training failed, keeping the previous model: {e}")
+            model = None
+        with self.lock:
+            if model is not None:
+                self.model = model
+            self.training = None
+
+    def maybe_retrain(self):
+        """Refit from the bid store once per retrain interval if new outcomes were recorded."""
+        with self.lock:
+            if time.monotonic() - self.trained_at < self.retrain_interval:
+                return
+            self.trained_at = time.monotonic()
+        self.train()
+
+    def filter(self, projects: list) -> list:
+        self.maybe_retrain()
+        model = self.model
+        if model is None or not is_active(model):
+            return projects
+        kept = []
+        for p, prob in zip(projects, model.predict(projects)):
+            if prob < self.threshold:
+                kept.append(p)
+                continue
+            with self.lock:
+                self.avoided.add(project_key(p))
+                avoided = len(self.avoided)
+            inc("bidder_restricted_predicted_total", help="Cards skipped as likely restricted.")
+            set_gauge("bidder_restricted_visits_avoided", avoided, help="Distinct projects not visited because "
+                                                                       "they were predicted restricted.")
+            log.info(f"🚧 Skipping likely restricted project: {p.get('title', 'N/A')} (p={prob:.2f}, "
+                     f"{avoided} page loads / ~{avoided * RESTRICTED_VISIT_SECONDS:.0f}s avoided so far)",
+                     extra={"link": p.get("link", ""), "probability": round(float(prob), 3)})
+        return kept
+
+
+_predictor = None
+_predictor_lock = threading.Lock()
+
+def get_restriction_predictor() -> RestrictionPredictor:
+    """Return the process-wide predictor, loading the cached model or starting its training on first use."""
+    global _predictor
+    with _predictor_lock:
+        if _predictor is None:
+            _predictor = RestrictionPredictor()
+        return _predictor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the restricted-project classifier on the skip history.")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=RESTRICT_THRESHOLD)
+    args = parser.parse_args()
+
+    projects, labels = training_data()
+    probs = cross_validate(projects, labels, args.folds)
+    print(f"🚧 {len(projects)} outcomes, {int(labels.sum())} restricted ({args.folds}-fold cross-validation)")
+    for t in sorted({0.5, 0.6, 0.7, 0.8, 0.9, args.threshold}):
+        flagged = probs >= t
+        hits = int((flagged & (labels == 1)).sum())
+        precision, recall = precision_recall(probs, labels, t)
+        print(f"   p >= {t:.2f}: {hits:3d} restricted page loads avoided (~{hits * RESTRICTED_VISIT_SECONDS:.0f}s), "
+              f"{int((flagged & (labels == 0)).sum()):3d} biddable projects wrongly skipped, "
+              f"precision {precision:.2f}, recall {recall:.2f}")
+    model = load_model()
+    state = "skipping" if is_active(model) else "not skipping (below thresholds)"
+    print(f"   deployed model at p >= {RESTRICT_THRESHOLD}: precision {model.precision:.2f}, "
+          f"recall {model.recall:.2f} -> {state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# scheduler.py
+import os
+import time
+import random
+from logger import get_logger
+from metrics import set_gauge
+
+POLL_MIN_INTERVAL = float(os.getenv("POLL_MIN_INTERVAL", "1"))
+POLL_MAX_INTERVAL = float(os.getenv("POLL_MAX_INTERVAL", "60"))
+POLL_BACKOFF = float(os.getenv("POLL_BACKOFF", "1.6"))
+POLL_JITTER = float(os.getenv("POLL_JITTER", "0.2"))
+POLL_TARGET_PER_POLL = float(os.getenv("POLL_TARGET_PER_POLL", "1"))
+# Time-of-day profiles as "start-end:multiplier" hour ranges, e.g. "0-7:4,22-24:2" polls 4x slower at night
+POLL_PROFILES = os.getenv("POLL_PROFILES", "")
+
+log = get_logger("scheduler")
+
+
+def parse_profiles(spec: str) -> list:
+    """Parse 'start-end:multiplier,...' into [(start_hour, end_hour, multiplier)]."""
+    profiles = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        hours, multiplier = part.split(":")
+        start, end = (int(h) for h in hours.split("-"))
+        profiles.append((start, end, float(multiplier)))
+    return profiles
+
+
+class FakeClock:
+    """Deterministic clock for driving the poller in tests and benchmarks."""
+
+    def __init__(self, start: float = 0.0, hour: int = 12):
+        self.now = start
+        self.hour = hour
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+    def current_hour(self) -> int:
+        return self.hour
+
+
+class AdaptivePoller:
+    """
+    Adapts the poll interval to the observed arrival rate of new projects.
+    While projects are flowing the interval aims for ~POLL_TARGET_PER_POLL new projects per poll;
+    empty polls back off exponentially with jitter. Bounds are scaled by the time-of-day profile.
+    """
+
+    def __init__(self, min_interval: float = POLL_MIN_INTERVAL, max_interval: float = POLL_MAX_INTERVAL,
+                 backoff: float = POLL_BACKOFF, jitter: float = POLL_JITTER,
+                 target_per_poll: float = POLL_TARGET_PER_POLL, profiles=None,
+                 clock=time.monotonic, sleep=time.sleep, current_hour=None, rng=random.random):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.target_per_poll = target_per_poll
+        self.profiles = parse_profiles(POLL_PROFILES) if profiles is None else profiles
+        self.clock = clock
+        self.sleep = sleep
+        self.current_hour = current_hour or (lambda: time.localtime().tm_hour)
+        self.rng = rng
+
+        self.rate = 0.0          # EWMA of new projects per second
+        self.interval = min_interval
+        self.last_poll = None
+        self.last_decision = {}
+
+    def profile_multiplier(self) -> float:
+        hour = self.current_hour()
+        for start, end, multiplier in self.profiles:
+            if start <= hour < end:
+                return multiplier
+        return 1.0
+
+    def record(self, new_count: int) -> float:
+        """Record how many new projects the last poll found and return the next interval."""
+        now = self.clock()
+        elapsed = (now - self.last_poll) if self.last_poll is not None else None
+        self.last_poll = now
+
+        if elapsed:
+            sample = new_count / elapsed
+            self.rate = sample if self.rate == 0 else 0.3 * sample + 0.7 * self.rate
+
+        multiplier = self.profile_multiplier()
+        low, high = self.min_interval * multiplier, self.max_interval * multiplier
+        if new_count > 0:
+            # Postings are flowing: poll often enough to catch ~target_per_poll each time
+            base = self.target_per_poll / self.rate if self.rate > 0 else low
+            reason = "arrivals"
+        else:
+            base = self.interval * self.backoff
+            reason = "idle-backoff"
+        base = min(max(base, low), high)
+        self.interval = base
+        interval = min(max(base * (1 + self.jitter * (2 * self.rng() - 1)), low), high)
+
+        self.last_decision = {
+            "new_projects": new_count,
+            "rate_per_min": round(self.rate * 60, 2),
+            "profile_multiplier": multiplier,
+            "reason": reason,
+            "interval": round(interval, 2),
+        }
+        return interval
+
+    def wait(self, new_count: int) -> float:
+        """Record the poll result, log the decision and sleep for the chosen interval."""
+        interval = self.record(new_count)
+        d = self.last_decision
+        log.info(f"⏱ Waiting {interval:.1f}s before checking for new projects... "
+                 f"({d['reason']}, {d['rate_per_min']}/min, x{d['profile_multiplier']})", extra=d)
+        set_gauge("bidder_poll_interval_seconds", interval, help="Next poll interval chosen by the scheduler.")
+        set_gauge("bidder_arrival_rate_per_minute", d["rate_per_min"], help="EWMA of new projects per minute.")
+        self.sleep(interval)
+        return interval
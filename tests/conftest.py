@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+import pathlib
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
@@ -0,0 +1,31 @@
+# tests/test_bid_generator.py
+from bid_generator import ProposalCutter, clean_proposal
+
+
+def stream(cutter, deltas):
+    return [cutter.feed(d) for d in deltas] + [cutter.finish()]
+
+
+def test_releases_whole_sentences_as_they_complete():
+    chunks = stream(ProposalCutter(limit=1000), ["Hello there. How", " are you? Fine", " thanks."])
+    assert chunks == ["Hello there.", " How are you?", "", " Fine thanks."]
+
+
+def test_strips_special_tokens_split_across_deltas():
+    chunks = stream(ProposalCutter(limit=1000), ["<begin_of", "_sentence>Hi. I can", " help<|eot|>."])
+    assert "".join(chunks) == "Hi. I can help."
+    assert "<" not in "".join(chunks)
+
+
+def test_stops_at_the_last_sentence_before_the_limit():
+    cutter = ProposalCutter(limit=30)
+    chunks = stream(cutter, ["First sentence here. ", "Second one is long enough to overflow. ", "Third."])
+    assert "".join(chunks) == "First sentence here."
+    assert cutter.full
+
+
+def test_matches_clean_proposal_on_the_whole_text():
+    text = "Dear client. " + "We build robust APIs and dashboards. " * 60
+    cutter = ProposalCutter()
+    streamed = "".join(stream(cutter, [text[i:i + 7] for i in range(0, len(text), 7)]))
+    assert streamed.strip() == clean_proposal(text)
@@ -0,0 +1,107 @@
+# tests/test_bid_store.py
+import json
+import sqlite3
+import pytest
+from bid_store import BidStore, project_key
+
+LINK = "https://www.freelancer.com/projects/python/Data-Pipeline-{}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    yield store
+    store.close()
+
+
+def bid(n, title="Data pipeline", **fields):
+    return dict({"title": title, "link": LINK.format(39900000 + n), "budget": "$250 - 750 USD",
+                 "description": "ETL job", "proposal": "Hello,\nI can help.", "min_budget": 250}, **fields)
+
+
+def test_project_key():
+    assert project_key(bid(1)) == "39900001"
+    assert project_key({"title": "Booking app", "link": "https://x/projects/flutter/Booking-App"}) == "flutter/booking-app"
+    assert project_key({"title": "  No link  "}) == "title:No link"
+
+
+def test_submitted_round_trip(store):
+    assert store.add_submitted(bid(1, days=3))
+    assert not store.add_submitted(bid(1))
+    assert store.count_submitted() == 1
+    assert store.load_submitted() == {"39900001": {
+        "title": "Data pipeline", "budget": "$250 - 750 USD", "description": "ETL job", "full_description": "",
+        "proposal": "Hello,\nI can help.", "min_budget": 250, "days": 3, "link": LINK.format(39900001),
+    }}
+
+
+def test_skipped_round_trip(store):
+    assert store.add_skipped(bid(1, skills=["Python", "ETL"]), "Cannot bid on this project due to restrictions")
+    entry = store.load_skipped()["39900001"]
+    assert entry["skills"] == ["Python", "ETL"]
+    assert entry["reason"] == "Cannot bid on this project due to restrictions"
+    assert store.has_project_id("skipped_bids", "39900001")
+    assert not store.has_project_id("submitted_bids", "39900001")
+
+
+def test_same_title_different_projects_are_both_stored(store):
+    assert store.add_submitted(bid(1))
+    assert store.add_submitted(bid(2))
+    assert store.add_skipped(bid(3), "Could not place bid")
+    assert store.add_skipped(bid(4), "Could not place bid")
+    assert sorted(store.load_submitted()) == ["39900001", "39900002"]
+    assert sorted(store.load_skipped()) == ["39900003", "39900004"]
+    assert store.has_project_id("submitted_bids", "39900002") and store.has_project_id("skipped_bids", "39900004")
+
+
+def test_json_export_and_import_round_trip(store, tmp_path):
+    store.add_submitted(bid(1))
+    store.add_submitted(bid(2))
+    store.add_skipped(bid(3, skills=["SQL"]), "Could not place bid")
+    bids_file, skipped_file = str(tmp_path / "bids.json"), str(tmp_path / "skipped.json")
+    store.export_json(bids_file, skipped_file)
+
+    copy = BidStore(str(tmp_path / "copy.db"))
+    assert copy.import_json(bids_file, skipped_file) == (2, 1)
+    assert copy.import_json(bids_file, skipped_file) == (0, 0)
+    assert copy.load_submitted() == store.load_submitted()
+    assert copy.load_skipped() == store.load_skipped()
+    copy.close()
+
+
+def test_legacy_title_keyed_store_is_migrated(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE submitted_bids (title TEXT PRIMARY KEY, project_id TEXT, link TEXT, budget TEXT,
+            description TEXT, full_description TEXT, proposal TEXT, min_budget INTEGER, days INTEGER,
+            hours INTEGER, created_at REAL);
+        CREATE INDEX idx_submitted_project_id ON submitted_bids(project_id);
+        CREATE TABLE skipped_bids (title TEXT PRIMARY KEY, project_id TEXT, link TEXT, budget TEXT,
+            reason TEXT, description TEXT, skills TEXT, created_at REAL);
+        CREATE INDEX idx_skipped_project_id ON skipped_bids(project_id);
+    """)
+    conn.execute("INSERT INTO submitted_bids (title, project_id, link, proposal, created_at) VALUES (?, ?, ?, ?, ?)",
+                 ("Data pipeline", "39900001", LINK.format(39900001), "Hello", 1.0))
+    conn.execute("INSERT INTO skipped_bids (title, project_id, link, reason, skills, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                 ("Logo", "", "", "Could not place bid", json.dumps(["Design"]), 2.0))
+    conn.commit()
+    conn.close()
+
+    store = BidStore(path)
+    assert store.load_submitted()["39900001"]["proposal"] == "Hello"
+    assert store.load_skipped()["title:Logo"]["skills"] == ["Design"]
+    assert store.add_submitted(bid(2))
+    store.close()
+    store = BidStore(path)  # already migrated: opens as is
+    assert store.count_submitted() == 2
+    store.close()
+
+
+def test_failed_import_rolls_back_and_releases_the_lock(store, tmp_path):
+    bids_file = tmp_path / "bids.json"
+    bids_file.write_text(json.dumps({"Data pipeline": bid(1), "Broken": "not a record"}), encoding="utf-8")
+    with pytest.raises(AttributeError):
+        store.import_json(str(bids_file), str(tmp_path / "missing.json"))
+    assert store.load_submitted() == {}
+    assert store.add_submitted(bid(1))
@@ -0,0 +1,77 @@
+# tests/test_bot.py
+import json
+import time
+import bot
+from bot import confirm_bid
+
+
+class BidDriver:
+    """
+    Stand-in for a WebDriver after the Place Bid click: the bid POST shows up in the performance
+    log after `response_after` seconds and the page redirects after `redirect_after` seconds.
+    """
+
+    def __init__(self, status=200, body='{"status": "success"}', response_after=None, redirect_after=None,
+                 failed=False):
+        self.start = time.monotonic()
+        self.status, self.body, self.failed = status, body, failed
+        self.response_after, self.redirect_after = response_after, redirect_after
+        self.logged = False
+
+    def elapsed(self):
+        return time.monotonic() - self.start
+
+    @property
+    def current_url(self):
+        done = self.redirect_after is not None and self.elapsed() >= self.redirect_after
+        return "https://www.freelancer.com/projects/x/details?bidCreated=true" if done else "https://x/details"
+
+    def get_log(self, name):
+        if self.logged or self.response_after is None or self.elapsed() < self.response_after:
+            return []
+        self.logged = True
+        events = [
+            {"method": "Network.requestWillBeSent",
+             "params": {"requestId": "1", "request": {"method": "POST", "url": "https://x" + bot.BID_CREATE_URL}}},
+            {"method": "Network.responseReceived", "params": {"requestId": "1", "response": {"status": self.status}}},
+            {"method": "Network.loadingFailed" if self.failed else "Network.loadingFinished",
+             "params": {"requestId": "1"}},
+        ]
+        return [{"message": json.dumps({"message": e})} for e in events]
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {"body": self.body}
+
+
+def timed_confirm(driver, timeout=2):
+    start = time.monotonic()
+    return confirm_bid(driver, timeout), time.monotonic() - start
+
+
+def test_accepted_response_confirms_without_the_redirect(monkeypatch):
+    monkeypatch.setattr(bot, "PERFORMANCE_LOG", True)
+    ok, seconds = timed_confirm(BidDriver(response_after=0.1))
+    assert ok and seconds < 1
+
+
+def test_rejected_response(monkeypatch):
+    monkeypatch.setattr(bot, "PERFORMANCE_LOG", True)
+    assert not confirm_bid(BidDriver(status=409, response_after=0), 1)
+    assert not confirm_bid(BidDriver(body='{"status": "error"}', response_after=0), 1)
+
+
+def test_redirect_confirms_at_once_when_the_response_is_never_logged(monkeypatch):
+    monkeypatch.setattr(bot, "PERFORMANCE_LOG", True)
+    ok, seconds = timed_confirm(BidDriver(redirect_after=0.1))
+    assert ok and seconds < 1
+
+
+def test_failed_request_falls_back_to_the_redirect(monkeypatch):
+    monkeypatch.setattr(bot, "PERFORMANCE_LOG", True)
+    assert confirm_bid(BidDriver(failed=True, response_after=0, redirect_after=0.3), 2)
+
+
+def test_nothing_observed_times_out(monkeypatch):
+    monkeypatch.setattr(bot, "PERFORMANCE_LOG", True)
+    ok, seconds = timed_confirm(BidDriver(), timeout=0.5)
+    assert not ok and seconds >= 0.5
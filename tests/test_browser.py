@@ -0,0 +1,39 @@
+# tests/test_browser.py
+import browser
+from browser import has_valid_session
+
+
+class SessionDriver:
+    """Stand-in for a WebDriver on a site that redirects to /login without a live session."""
+
+    def __init__(self, cookie=True, logged_in=True):
+        self.cookie = cookie
+        self.logged_in = logged_in
+        self.current_url = "about:blank"
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        redirect = url == browser.SESSION_VALIDATE_URL and not self.logged_in
+        self.current_url = "https://www.freelancer.com/login" if redirect else url
+
+    def get_cookie(self, name):
+        return {"name": name, "value": "x"} if self.cookie else None
+
+
+def test_live_session_is_reused(monkeypatch):
+    monkeypatch.setattr(browser, "SESSION_REDIRECT_WAIT", 0.1)
+    driver = SessionDriver()
+    assert has_valid_session(driver)
+    assert driver.visited == [browser.SESSION_CHECK_URL, browser.SESSION_VALIDATE_URL]
+
+
+def test_expired_session_with_a_leftover_cookie_is_rejected(monkeypatch):
+    monkeypatch.setattr(browser, "SESSION_REDIRECT_WAIT", 0.1)
+    assert not has_valid_session(SessionDriver(logged_in=False))
+
+
+def test_missing_cookie_skips_the_authenticated_page():
+    driver = SessionDriver(cookie=False)
+    assert not has_valid_session(driver)
+    assert driver.visited == [browser.SESSION_CHECK_URL]
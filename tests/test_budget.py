@@ -0,0 +1,55 @@
+# tests/test_budget.py
+import pytest
+from budget import parse_budget
+
+
+def test_fixed_range_in_a_listed_currency():
+    budget = parse_budget("Budget ₹12,500 – 37,500 INR")
+    assert (budget.currency, budget.minimum, budget.maximum, budget.hourly) == ("INR", 12500, 37500, False)
+    assert budget.value() == pytest.approx(450)
+
+
+def test_open_ended_hourly_rate():
+    budget = parse_budget("$15+ USD per hour")
+    assert (budget.currency, budget.minimum, budget.maximum, budget.hourly) == ("USD", 15, None, True)
+    assert budget.top == 15
+    assert budget.value(hourly_hours=20) == 300
+
+
+@pytest.mark.parametrize("text, currency, minimum, maximum", [
+    ("$15 – 25 USD / hour", "USD", 15, 25),
+    ("$8 - 15 AUD / hr", "AUD", 8, 15),
+    ("$15/hr", "USD", 15, 15),
+])
+def test_slash_hour_suffixes(text, currency, minimum, maximum):
+    budget = parse_budget(text)
+    assert (budget.currency, budget.minimum, budget.maximum, budget.hourly) == (currency, minimum, maximum, True)
+
+
+def test_single_amount_and_symbol_only():
+    budget = parse_budget("€250")
+    assert (budget.currency, budget.minimum, budget.maximum) == ("EUR", 250, 250)
+
+
+def test_missing_budget():
+    for text in ("N/A", "", None):
+        budget = parse_budget(text)
+        assert budget.minimum is None and budget.maximum is None
+        assert budget.value() == 0
+        assert not budget.below_floor(min_fixed=100)
+
+
+def test_unlisted_currency_code_is_kept_but_not_converted():
+    budget = parse_budget("$500 - 1,000 TWD")
+    assert budget.currency == "TWD"
+    assert budget.to_base(budget.top) is None
+    assert budget.value() == 1000
+    assert not budget.below_floor(min_fixed=10000)
+
+
+def test_below_floor_uses_the_top_of_the_range_and_the_matching_floor():
+    assert parse_budget("$10 - 30 USD").below_floor(min_fixed=50)
+    assert not parse_budget("$10 - 80 USD").below_floor(min_fixed=50)
+    assert not parse_budget("$10 - 30 USD").below_floor(min_fixed=0)
+    assert parse_budget("$8 - 12 USD per hour").below_floor(min_fixed=0, min_hourly=15)
+    assert not parse_budget("$8 - 12 USD per hour").below_floor(min_fixed=1000, min_hourly=0)
@@ -0,0 +1,75 @@
+# tests/test_card_parser.py
+import pathlib
+import pytest
+from card_parser import card_meta, parse_cards_html
+
+FIXTURES = pathlib.Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+BASE_URL = "https://www.freelancer.com/search/projects"
+
+NEW_LAYOUT = """
+<ul class="search-result-list">
+  <li>
+    <div class="info-card-title"><a href="/projects/python/Scraper-Fix">Fix my   Python scraper</a></div>
+    <div class="info-card-price"><span>$30 – 250 USD</span></div>
+    <p class="info-card-description">Scraper breaks on page two.</p>
+    <div class="info-card-skills"><span>Python</span><span>Web Scraping</span><span> </span></div>
+    <div>Posted 5 minutes ago · 7 bids</div>
+  </li>
+  <li><div class="info-card-title">No link here</div></li>
+</ul>
+"""
+
+OLD_LAYOUT = """
+<a href="/projects/php/Laravel-Bug">
+  <div class="ProjectCard">
+    <span class="Title-text">Laravel bug</span>
+    <div class="BudgetUpgradeWrapper-budget"><span class="text-foreground">₹600 – 1,500 INR</span></div>
+    <p data-margin-bottom="m">Login fails after upgrade.
+    Second line is dropped.</p>
+    <div class="SkillsWrapper"><span class="Content">PHP</span><span class="Content">Laravel</span></div>
+    <span>just now</span><script>var x = "99 bids";</script>
+  </div>
+</a>
+"""
+
+
+def test_new_layout_card():
+    [project] = parse_cards_html(NEW_LAYOUT, BASE_URL)
+    assert project == {
+        "title": "Fix my Python scraper",
+        "link": "https://www.freelancer.com/projects/python/Scraper-Fix",
+        "budget": "$30 – 250 USD",
+        "description": "Scraper breaks on page two.",
+        "skills": ["Python", "Web Scraping"],
+        "posted": "5 minutes ago",
+        "bid_count": 7,
+    }
+
+
+def test_old_layout_card_ignores_script_text():
+    [project] = parse_cards_html(OLD_LAYOUT, BASE_URL)
+    assert project["title"] == "Laravel bug"
+    assert project["link"] == "https://www.freelancer.com/projects/php/Laravel-Bug"
+    assert project["budget"] == "₹600 – 1,500 INR"
+    assert project["description"] == "Login fails after upgrade."
+    assert project["skills"] == ["PHP", "Laravel"]
+    assert (project["posted"], project["bid_count"]) == ("just now", None)
+
+
+@pytest.mark.parametrize("layout", ["new", "old"])
+def test_saved_search_pages(layout):
+    projects = parse_cards_html((FIXTURES / f"search_{layout}_layout.html").read_text(encoding="utf-8"), BASE_URL)
+    assert len(projects) == 60
+    assert len({p["link"] for p in projects}) == 60
+    assert all(p["title"] and p["budget"].startswith("Budget") for p in projects)
+
+
+@pytest.mark.parametrize("text, posted, bids", [
+    ("Posted an hour ago, 1 bid", "an hour ago", 1),
+    ("a few seconds ago 23 Bids", "a few seconds ago", 23),
+    ("3 days ago", "3 days ago", None),
+    ("", "", None),
+    (None, "", None),
+])
+def test_card_meta(text, posted, bids):
+    assert card_meta(text) == {"posted": posted, "bid_count": bids}
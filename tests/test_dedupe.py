@@ -0,0 +1,42 @@
+# tests/test_dedupe.py
+import pytest
+from bid_store import BidStore
+from dedupe import DedupeIndex, SUBMITTED, SKIPPED
+
+LINK = "https://www.freelancer.com/projects/python/Data-Pipeline-{}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    yield store
+    store.close()
+
+
+def bid(n, title="Data pipeline"):
+    return {"title": title, "link": LINK.format(39900000 + n), "budget": "$250 - 750 USD", "proposal": "Hello"}
+
+
+@pytest.mark.parametrize("use_bloom", [False, True])
+def test_dedupe_index_round_trip(store, use_bloom):
+    store.add_submitted(bid(1))
+    store.add_skipped({"title": "Logo design"}, "Could not place bid")
+    index = DedupeIndex(store, use_bloom=use_bloom, expected_items=1000)
+    assert index.status(bid(1)) == SUBMITTED
+    assert index.status({"title": "Logo design"}) == SKIPPED
+    assert index.status(bid(2)) is None  # same title, new project
+
+    store.add_skipped(bid(2), "Could not place bid")
+    index.add_skipped(bid(2))
+    assert index.status(bid(2)) == SKIPPED
+    # A restart sees the same history
+    assert DedupeIndex(store, use_bloom=use_bloom, expected_items=1000).status(bid(2)) == SKIPPED
+
+
+def test_dedupe_claims(store):
+    index = DedupeIndex(store)
+    assert index.claim(bid(1))
+    assert not index.claim(bid(1))
+    assert index.is_claimed(bid(1))
+    index.release(bid(1))
+    assert index.claim(bid(1))
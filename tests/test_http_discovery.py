@@ -0,0 +1,100 @@
+# tests/test_http_discovery.py
+import json
+import pathlib
+import pytest
+import bot
+from http_discovery import HttpDiscovery, parse_projects_json
+
+FIXTURES = pathlib.Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+BASE_URL = "https://www.freelancer.com/search/projects"
+
+
+class FakeResponse:
+    def __init__(self, status, data, content_type):
+        self.status, self.data, self.headers = status, data, {"Content-Type": content_type}
+
+
+class FakeHttp:
+    """Stand-in for the urllib3 pool: serves one canned response and records request headers."""
+
+    def __init__(self, status=200, data=b"", content_type="text/html; charset=utf-8"):
+        self.response = FakeResponse(status, data, content_type)
+        self.requests = []
+
+    def request(self, method, url, headers=None):
+        self.requests.append(headers or {})
+        return self.response
+
+    def clear(self):
+        pass
+
+
+def discovery_for(**response):
+    discovery = HttpDiscovery(BASE_URL)
+    discovery.http = FakeHttp(**response)
+    return discovery
+
+
+@pytest.mark.parametrize("layout", ["new", "old"])
+def test_search_page_cards_are_parsed(layout):
+    discovery = discovery_for(data=(FIXTURES / f"search_{layout}_layout.html").read_bytes())
+    projects = discovery.fetch_projects()
+    assert len(projects) == 60
+    assert all(p["title"] and "/projects/" in p["link"] for p in projects)
+
+
+def test_api_response_is_parsed_and_cookies_are_sent():
+    discovery = discovery_for(data=(FIXTURES / "projects_active.json").read_bytes(), content_type="application/json")
+    discovery.load_cookies([{"name": "session", "value": "abc"}, {"name": "csrf", "value": "xyz"}])
+    projects = discovery.fetch_projects()
+    assert len(projects) == 60
+    first = projects[0]
+    assert first["title"] == "Minecraft Weapon Models & NEXO Coding"
+    assert first["link"] == "https://www.freelancer.com/projects/3d-animation/Minecraft-Weapon-Models-NEXO-Coding"
+    assert first["budget"] == "Budget $250 – 750 SGD"
+    assert "Unity 3D" in first["skills"]
+    assert discovery.http.requests[-1]["Cookie"] == "session=abc; csrf=xyz"
+
+
+def test_hourly_api_budget_is_rendered_like_a_card():
+    data = {"result": {"projects": [{"title": "Support", "seo_url": "php/support", "type": "hourly",
+                                     "budget": {"minimum": 15}, "currency": {"code": "USD", "sign": "$"}}]}}
+    [project] = parse_projects_json(data, BASE_URL)
+    assert project["budget"] == "Budget $15+ USD per hour"
+
+
+@pytest.mark.parametrize("response", [
+    {"status": 503},
+    {"data": b"<html><body><form id='login'>Log in</form></body></html>"},
+    {"data": json.dumps({"status": "error", "message": "Not authenticated"}).encode(), "content_type": "application/json"},
+])
+def test_failures_raise_so_the_browser_fallback_runs(response):
+    with pytest.raises((RuntimeError, ValueError)):
+        discovery_for(**response).fetch_projects()
+
+
+def test_empty_api_result_is_not_a_failure():
+    discovery = discovery_for(data=b'{"result": {"projects": []}}', content_type="application/json")
+    assert discovery.fetch_projects() == []
+
+
+class CookieDriver:
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def get_cookies(self):
+        return self.cookies
+
+
+def test_browser_fallback_resyncs_cookies(monkeypatch):
+    waited = []
+    monkeypatch.setattr(bot, "scrape_projects", lambda driver, scan: [])
+    monkeypatch.setattr(bot, "get_dedupe_index", lambda: None)
+    monkeypatch.setattr(bot, "get_repost_index", lambda: None)
+    discovery = discovery_for(data=b"<html><body>Please log in</body></html>")
+    discovery.load_cookies([{"name": "session", "value": "stale"}])
+
+    assert bot.find_projects(CookieDriver([{"name": "session", "value": "fresh"}]), discovery,
+                             wait_for_driver=lambda: waited.append(True)) == []
+    assert waited == [True]
+    assert discovery.cookie_header == "session=fresh"
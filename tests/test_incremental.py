@@ -0,0 +1,43 @@
+# tests/test_incremental.py
+from incremental import IncrementalScan
+
+
+class Seen:
+    def __init__(self, titles=()):
+        self.titles = set(titles)
+
+    def seen(self, project):
+        return project["title"] in self.titles
+
+
+def cards(*numbers):
+    return [{"title": f"P{n}", "link": f"https://www.freelancer.com/projects/php/P-{5000000 + n}"} for n in numbers]
+
+
+def test_first_poll_scans_until_a_run_of_known_cards():
+    scan = IncrementalScan(Seen({"P3", "P4"}), stop_after=2)
+    page = cards(1, 2, 3, 5)
+    assert not scan.feed(page)
+    # The page grows as it scrolls; only the new cards are processed
+    page += cards(6, 3, 4)
+    assert scan.feed(page)
+    assert [c["title"] for c in scan.finish()] == ["P1", "P2", "P5", "P6"]
+
+
+def test_next_poll_stops_at_the_previous_newest_card():
+    scan = IncrementalScan(Seen(), stop_after=5)
+    scan.feed(cards(10, 9, 8))
+    scan.finish()
+    assert scan.feed(cards(12, 11, 10, 9, 8))
+    assert [c["title"] for c in scan.finish()] == ["P12", "P11"]
+    assert scan.newest_key == "5000012"
+
+
+def test_empty_page_keeps_the_previous_newest_card():
+    scan = IncrementalScan(Seen())
+    scan.feed(cards(3, 2))
+    scan.finish()
+    assert not scan.feed([])
+    assert scan.finish() == []
+    assert scan.feed(cards(4, 3))
+    assert [c["title"] for c in scan.finish()] == ["P4"]
@@ -0,0 +1,96 @@
+# tests/test_keyword_filter.py
+import os
+import json
+from keyword_filter import KeywordFilter
+
+
+def write_rules(path, rules, mtime=None):
+    path.write_text(json.dumps(rules), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_default_rules_when_the_file_is_missing(tmp_path):
+    rules = KeywordFilter(str(tmp_path / "missing.json"))
+    assert rules.evaluate({"title": "Fix my WordPress site"}) == "keyword:wordpress"
+    assert rules.evaluate({"title": "Build a REST API"}) is None
+
+
+def test_exclude_and_include_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, {
+        "exclude": [{"keyword": "template"}, {"regex": r"\bphp\s*5\b"}, {"skill": "Wix"}, {"skill_id": 17}],
+        "include": [{"keyword": "python"}, {"skill": "Django", "fields": ["skills"]}],
+    })
+    rules = KeywordFilter(str(path))
+    projects = [
+        {"title": "Python scraper", "description": "Need HTML Templates", "skills": []},
+        {"title": "Contemplate a python bot", "skills": []},
+        {"title": "Python upgrade", "description": "legacy PHP 5 code", "skills": []},
+        {"title": "Python site", "skills": ["Wix", "SEO"]},
+        {"title": "Python app", "skills": [], "skill_ids": [17]},
+        {"title": "Web app", "skills": ["Django"]},
+        {"title": "Go service", "skills": ["Go"]},
+    ]
+    assert rules.evaluate_batch(projects) == [
+        "keyword:template", None, r"regex:\bphp\s*5\b", "skill:Wix", "skill_id:17", None, "include:no-match",
+    ]
+
+
+def test_matches_do_not_run_across_cards(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, {"exclude": [{"regex": r"alpha\s+beta"}]})
+    rules = KeywordFilter(str(path))
+    assert rules.evaluate_batch([{"title": "alpha"}, {"title": "beta"}]) == [None, None]
+
+
+def test_reloads_changed_rules_and_keeps_them_on_a_broken_file(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, {"exclude": [{"keyword": "shopify"}]}, mtime=1000)
+    rules = KeywordFilter(str(path), reload_interval=0)
+    assert rules.evaluate({"title": "Shopify store"}) == "keyword:shopify"
+
+    write_rules(path, {"exclude": [{"keyword": "wix"}]}, mtime=2000)
+    assert rules.evaluate({"title": "Shopify store"}) is None
+    assert rules.evaluate({"title": "Wix store"}) == "keyword:wix"
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, (3000, 3000))
+    assert rules.evaluate({"title": "Wix store"}) == "keyword:wix"
+
+
+def test_keywords_with_punctuation_and_plurals(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, {"exclude": [{"keyword": ".net"}, {"keyword": "c++"}, {"keyword": "java"}]})
+    rules = KeywordFilter(str(path))
+    assert rules.evaluate_batch([
+        {"title": "Port an ASP .NET app"}, {"title": "Fix C++ crash"}, {"title": "JavaScript widget"},
+        {"title": "Two Javas"}, {"title": "Kotlin app"},
+    ]) == ["keyword:.net", "keyword:c++", None, "keyword:java", None]
+
+
+def test_regex_rules_see_original_case_and_keep_their_groups(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, {"exclude": [
+        {"regex": r"\bPHP\s*5\b"},
+        {"regex": r"(?P<word>\w+) (?P=word)"},
+        {"regex": r"(\d+)x\1"},
+        {"regex": r"(?s)legacy.+cobol"},
+        {"keyword": "wix"},
+    ]})
+    rules = KeywordFilter(str(path))
+    assert rules.evaluate_batch([
+        {"title": "Upgrade php 5 code"}, {"title": "very very urgent"}, {"title": "Render 4x4 grid"},
+        {"title": "Render 4x5 grid"}, {"title": "Legacy banking in COBOL"}, {"title": "Wix site"},
+    ]) == [r"regex:\bPHP\s*5\b", r"regex:(?P<word>\w+) (?P=word)", r"regex:(\d+)x\1", None,
+           "regex:(?s)legacy.+cobol", "keyword:wix"]
+
+
+def test_invalid_rules_file_at_startup_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text("{not json", encoding="utf-8")
+    rules = KeywordFilter(str(path))
+    assert rules.evaluate({"title": "Shopify theme"}) == "keyword:shopify"
+
+    write_rules(path, {"exclude": [{"regex": "(unclosed"}]})
+    assert KeywordFilter(str(path)).evaluate({"title": "Wix store"}) == "keyword:wix"
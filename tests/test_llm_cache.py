@@ -0,0 +1,62 @@
+# tests/test_llm_cache.py
+import pytest
+from llm_cache import LLMCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = LLMCache(str(tmp_path / "cache.db"), ttl=100, max_entries=2, clock=clock)
+    yield cache
+    cache.close()
+
+
+def test_cache_key_ignores_cosmetic_whitespace_only():
+    key = cache_key("m", title="Fix  bug", description="Line one\n line two", budget=None)
+    assert key == cache_key("m", title="Fix bug", description="Line one line two", budget="")
+    assert key != cache_key("other-model", title="Fix bug", description="Line one line two", budget=None)
+    assert key != cache_key("m", title="Fix bugs", description="Line one line two", budget=None)
+
+
+def test_hits_misses_and_ttl(cache, clock):
+    assert cache.get("a") is None
+    cache.put("a", "proposal")
+    assert cache.get("a") == "proposal"
+    clock.now += 101
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    cache.put("a", "A")
+    clock.now += 1
+    cache.put("b", "B")
+    clock.now += 1
+    assert cache.get("a") == "A"  # "b" is now the least recently used
+    clock.now += 1
+    cache.put("c", "C")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+
+
+def test_entries_survive_a_reopen(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    first = LLMCache(path, clock=clock)
+    first.put("k", "kept")
+    first.close()
+    second = LLMCache(path, clock=clock)
+    assert second.get("k") == "kept"
+    second.close()
@@ -0,0 +1,133 @@
+# tests/test_llm_router.py
+import time
+import threading
+from types import SimpleNamespace
+import pytest
+import bid_generator
+import llm_router
+from llm_router import Endpoint, LLMRouter, LLMTimeout, NoProviderAvailable, CLOSED, OPEN
+
+
+class FakeClient:
+    """Stand-in for an OpenAI client: answers `text` after `delay` seconds, or raises `error`."""
+
+    def __init__(self, text="ok", delay=0.0, error=None):
+        self.text, self.delay, self.error = text, delay, error
+        self.calls = 0
+        self.streams = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, stream=False, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        if stream:
+            self.streams.append(FakeStream(self.text))
+            return self.streams[-1]
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.text))])
+
+
+class FakeStream:
+    def __init__(self, text):
+        self.events = iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=w))])
+                            for w in text.split(" ")])
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        return self.events
+
+    def close(self):
+        self.closed.set()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def short_deadlines(monkeypatch):
+    monkeypatch.setattr(llm_router, "LLM_HEDGE_DEFAULT", 0.1)
+    monkeypatch.setattr(llm_router, "LLM_HEDGE_MAX", 0.1)
+
+
+def router(*clients, overall_deadline=5.0):
+    return LLMRouter([Endpoint(f"e{i}", c, "m") for i, c in enumerate(clients)], overall_deadline=overall_deadline)
+
+
+def content(completion):
+    return completion.choices[0].message.content
+
+
+def test_fast_primary_answers_without_a_hedge():
+    primary, backup = FakeClient("primary"), FakeClient("backup")
+    endpoint, completion = router(primary, backup).complete([])
+    assert (endpoint.name, content(completion)) == ("e0", "primary")
+    assert backup.calls == 0
+
+
+def test_slow_primary_is_hedged_and_the_backup_wins():
+    primary, backup = FakeClient("primary", delay=1.0), FakeClient("backup")
+    start = time.monotonic()
+    endpoint, completion = router(primary, backup).complete([])
+    assert (endpoint.name, content(completion)) == ("e1", "backup")
+    assert time.monotonic() - start < 0.8
+    assert primary.calls == 1 and backup.calls == 1
+
+
+def test_errors_fail_over_immediately():
+    primary, backup = FakeClient(error=RuntimeError("503")), FakeClient("backup")
+    endpoint, completion = router(primary, backup).complete([])
+    assert (endpoint.name, content(completion)) == ("e1", "backup")
+    assert primary.calls == 1
+    with pytest.raises(RuntimeError, match="503"):
+        router(FakeClient(error=RuntimeError("503"))).complete([])
+
+
+def test_overall_deadline_once_hedges_are_used_up():
+    slow = router(FakeClient(delay=2.0), FakeClient(delay=2.0), overall_deadline=0.4)
+    start = time.monotonic()
+    with pytest.raises(LLMTimeout):
+        slow.complete([])
+    assert time.monotonic() - start < 1.0
+
+
+def test_losing_stream_is_closed():
+    slow, fast = FakeClient("slow answer", delay=0.5), FakeClient("fast answer")
+    routed = router(slow, fast).stream([])
+    assert " ".join(e.choices[0].delta.content for e in routed) == "fast answer"
+    routed.close()
+    deadline = time.monotonic() + 2  # the slow endpoint opens its stream after the race is decided
+    while not slow.streams and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert slow.streams and slow.streams[0].closed.wait(2)
+
+
+def test_breaker_opens_and_half_opens_after_the_cooldown(monkeypatch):
+    monkeypatch.setattr(llm_router, "LLM_BREAKER_FAILURES", 3)
+    monkeypatch.setattr(llm_router, "LLM_BREAKER_COOLDOWN", 60)
+    clock = FakeClock()
+    endpoint = Endpoint("e0", FakeClient(), "m", clock=clock)
+    for _ in range(3):
+        endpoint.record_failure(RuntimeError("boom"))
+    assert endpoint.state == OPEN and not endpoint.available()
+    with pytest.raises(NoProviderAvailable):
+        LLMRouter([endpoint]).complete([])
+
+    clock.now = 61
+    assert endpoint.available()       # one half-open probe
+    assert not endpoint.available()
+    endpoint.record_success(0.1)
+    assert endpoint.state == CLOSED and endpoint.available()
+
+
+def test_default_providers_do_not_add_a_paid_hedge(monkeypatch):
+    monkeypatch.setattr(bid_generator, "LLM_PROVIDERS", "")
+    monkeypatch.setattr(bid_generator, "API_KEY", "sk-test")
+    assert bid_generator.provider_spec() == f"openrouter:{bid_generator.MODEL}"
+    monkeypatch.setattr(bid_generator, "LLM_PROVIDERS", "openrouter:a,openai:gpt-4o-mini")
+    assert bid_generator.provider_spec() == "openrouter:a,openai:gpt-4o-mini"
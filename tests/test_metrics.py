@@ -0,0 +1,49 @@
+# tests/test_metrics.py
+import pytest
+import metrics
+from metrics import Registry
+
+
+def test_counters_gauges_and_histograms_render_in_text_format():
+    registry = Registry(buckets=(0.1, 1))
+    registry.inc("jobs_total", help="Jobs run.", outcome="ok")
+    registry.inc("jobs_total", 2, outcome="ok")
+    registry.set("queue_depth", 3, help="Pending jobs.")
+    registry.observe("job_seconds", 0.05, help="Job latency.", stage="fill")
+    registry.observe("job_seconds", 0.5, stage="fill")
+    assert registry.render().splitlines() == [
+        "# HELP job_seconds Job latency.",
+        "# TYPE job_seconds histogram",
+        'job_seconds_bucket{stage="fill",le="0.1"} 1',
+        'job_seconds_bucket{stage="fill",le="1"} 2',
+        'job_seconds_bucket{stage="fill",le="+Inf"} 2',
+        'job_seconds_sum{stage="fill"} 0.550000',
+        'job_seconds_count{stage="fill"} 2',
+        "# HELP jobs_total Jobs run.",
+        "# TYPE jobs_total counter",
+        'jobs_total{outcome="ok"} 3',
+        "# HELP queue_depth Pending jobs.",
+        "# TYPE queue_depth gauge",
+        "queue_depth 3",
+    ]
+    assert registry.snapshot("job_seconds", stage="fill") == (2, pytest.approx(0.55))
+
+
+def test_label_values_and_help_are_escaped():
+    registry = Registry()
+    registry.inc("errors_total", help="Errors\nby \\ message.", message='bad "quote" \\ path\nnext')
+    lines = registry.render().splitlines()
+    assert lines[0] == "# HELP errors_total Errors\\nby \\\\ message."
+    assert lines[2] == 'errors_total{message="bad \\"quote\\" \\\\ path\\nnext"} 1'
+
+
+def test_timed_records_blocks_that_raise(monkeypatch):
+    registry = Registry()
+    monkeypatch.setattr(metrics, "registry", registry)
+    with pytest.raises(ValueError):
+        with metrics.timed("submit"):
+            raise ValueError("boom")
+    with metrics.timed("submit"):
+        pass
+    count, total = registry.snapshot("bidder_stage_seconds", stage="submit")
+    assert count == 2 and total >= 0
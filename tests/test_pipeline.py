@@ -0,0 +1,125 @@
+# tests/test_pipeline.py
+import time
+import threading
+import pytest
+from pipeline import ProposalPipeline, ChunkStream
+
+
+def card(n):
+    return {"title": f"Project {n}", "link": f"https://www.freelancer.com/projects/python/p-{6000000 + n}"}
+
+
+@pytest.fixture
+def make_pipeline():
+    pipelines = []
+
+    def make(generate, **kwargs):
+        pipeline = ProposalPipeline(generate, **kwargs)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield make
+    for p in pipelines:
+        p.shutdown()
+
+
+def test_chunk_stream_is_readable_while_written():
+    stream = ChunkStream()
+    seen = []
+    reader = threading.Thread(target=lambda: seen.extend(stream))
+    reader.start()
+    stream.put("Hello. ")
+    stream.put("Bye.")
+    stream.close()
+    reader.join(1)
+    assert seen == ["Hello. ", "Bye."]
+
+
+def test_chunk_stream_reraises_the_generation_error():
+    stream = ChunkStream()
+    stream.put("partial")
+    stream.close(RuntimeError("model down"))
+    with pytest.raises(RuntimeError):
+        list(stream)
+
+
+def test_feeds_up_to_lookahead_and_hands_back_proposals(make_pipeline):
+    started = []
+    pipeline = make_pipeline(lambda p: started.append(p["title"]) or f"Proposal for {p['title']}",
+                             workers=1, lookahead=2)
+    pipeline.feed([card(1), card(2), card(3)])
+    assert len(pipeline.futures) == 2 and len(pipeline.pending) == 1
+    assert pipeline.take(card(1), timeout=1) == "Proposal for Project 1"
+    assert pipeline.take(card(3), timeout=1) == "Proposal for Project 3"
+    assert "".join(pipeline.take_stream(card(2))) == "Proposal for Project 2"
+    assert started.count("Project 1") == 1
+
+
+def test_unqueued_project_is_generated_on_take(make_pipeline):
+    pipeline = make_pipeline(lambda p: iter(["Hello. ", p["title"]]), workers=1, lookahead=1)
+    assert list(pipeline.take_stream(card(9))) == ["Hello. ", "Project 9"]
+
+
+def test_feed_reorders_waiting_projects(make_pipeline):
+    gate = threading.Event()
+    pipeline = make_pipeline(lambda p: gate.wait(1) and p["title"], workers=1, lookahead=1)
+    pipeline.feed([card(1), card(2), card(3)])
+    pipeline.feed([card(3), card(2)])
+    assert [p["title"] for p in pipeline.pending] == ["Project 3", "Project 2"]
+    gate.set()
+
+
+def test_discard_frees_the_slot_for_the_next_project(make_pipeline):
+    gate = threading.Event()
+    pipeline = make_pipeline(lambda p: gate.wait(1) and p["title"], workers=1, lookahead=1)
+    pipeline.feed([card(1), card(2)])
+    pipeline.discard(card(1))
+    assert list(pipeline.futures) == ["6000002"] and not pipeline.pending
+    pipeline.discard(card(5))  # unknown projects are ignored
+    gate.set()
+    assert pipeline.take(card(2), timeout=1) == "Project 2"
+
+
+def test_waiting_projects_share_one_batched_request(make_pipeline):
+    batches = []
+
+    def generate_batch(projects):
+        batches.append([p["title"] for p in projects])
+        return [f"Batch proposal for {p['title']}" for p in projects]
+
+    pipeline = make_pipeline(lambda p: f"Single proposal for {p['title']}", workers=1, lookahead=4,
+                             generate_batch=generate_batch, batch_size=3)
+    pipeline.feed([card(1), card(2), card(3), card(4)])
+    assert [pipeline.take(card(n), timeout=1) for n in (1, 2, 3)] == [
+        "Batch proposal for Project 1", "Batch proposal for Project 2", "Batch proposal for Project 3"]
+    assert pipeline.take(card(4), timeout=1) == "Single proposal for Project 4"
+    assert batches == [["Project 1", "Project 2", "Project 3"]]
+
+
+def test_failed_batch_fails_each_of_its_projects(make_pipeline):
+    def generate_batch(projects):
+        raise RuntimeError("bad JSON")
+
+    pipeline = make_pipeline(lambda p: "single", workers=1, lookahead=2, generate_batch=generate_batch, batch_size=2)
+    pipeline.feed([card(1), card(2)])
+    for n in (1, 2):
+        with pytest.raises(RuntimeError):
+            pipeline.take(card(n), timeout=1)
+
+
+def test_discarded_project_is_left_out_of_a_batch(make_pipeline):
+    gate = threading.Event()
+    batches = []
+
+    def generate_batch(projects):
+        batches.append([p["title"] for p in projects])
+        return [p["title"] for p in projects]
+
+    pipeline = make_pipeline(lambda p: gate.wait(1) and p["title"], workers=1, lookahead=3,
+                             generate_batch=generate_batch, batch_size=2)
+    pipeline.feed([card(1)])          # occupies the only thread
+    pipeline.feed([card(2), card(3)])  # queued behind it as one batch
+    pipeline.discard(card(2))
+    gate.set()
+    assert pipeline.take(card(3), timeout=1) == "Project 3"
+    assert batches == [["Project 3"]]
@@ -0,0 +1,85 @@
+# tests/test_priority.py
+from priority import BidQueue, parse_age
+
+
+class Clock:
+    def __init__(self, now=100000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def card(n, **fields):
+    return dict({"title": f"Project {n}", "link": f"https://www.freelancer.com/projects/python/Project-{n}-4000000{n}",
+                 "budget": "$100 - 200 USD", "posted": "just now"}, **fields)
+
+
+def drain(q):
+    out = []
+    while q.qsize():
+        out.append(q.get()["title"])
+        q.task_done()
+    return out
+
+
+def test_parse_age():
+    assert parse_age("Posted 5 minutes ago") == 300
+    assert parse_age("an hour ago") == 3600
+    assert parse_age("just now") == 0
+    assert parse_age("") is None
+
+
+def test_fresher_and_more_valuable_projects_come_first():
+    q = BidQueue(clock=Clock())
+    q.put(card(1, posted="2 hours ago"))
+    q.put(card(2, budget="$10 - 20 USD"))
+    q.put(card(3))
+    q.put(card(4, bid_count=50))
+    # Two hours of age outweighs budget and competition; fifty bids outweigh a small budget
+    assert [p["title"] for p in q.snapshot()] == ["Project 3", "Project 2", "Project 4", "Project 1"]
+    assert drain(q) == ["Project 3", "Project 2", "Project 4", "Project 1"]
+
+
+def test_rediscovered_project_refreshes_its_entry():
+    clock = Clock()
+    q = BidQueue(clock=clock)
+    assert q.put(card(1))
+    assert q.put(card(2, budget="$150 - 250 USD"))
+    clock.now += 60
+    # Seen again a minute later: the posting time is kept, the new bid count lowers its priority
+    assert not q.put(card(2, posted="just now", budget="$150 - 250 USD", bid_count=40))
+    assert q.qsize() == 2
+    assert q.snapshot()[1]["posted_at"] == Clock().now
+    assert drain(q) == ["Project 1", "Project 2"]
+
+
+def test_queue_full_evicts_the_lowest_priority():
+    evicted = []
+    q = BidQueue(on_evict=lambda p, reason: evicted.append((p["title"], reason)), max_pending=2, clock=Clock())
+    q.put(card(1, budget="$1000 USD"))
+    q.put(card(2, budget="$10 USD"))
+    q.put(card(3, budget="$500 USD"))
+    assert evicted == [("Project 2", "queue full")]
+    assert drain(q) == ["Project 1", "Project 3"]
+
+
+def test_stale_projects_are_evicted_by_the_worker():
+    clock = Clock()
+    evicted = []
+    q = BidQueue(on_evict=lambda p, reason: evicted.append(reason), max_age=600, clock=clock)
+    q.put(card(1, posted="5 minutes ago"))
+    project = q.get()
+    assert not q.evict_if_stale(project)
+    clock.now += 600
+    assert q.evict_if_stale(project)
+    assert evicted == ["stale"]
+
+
+def test_stop_sentinel_sorts_last():
+    q = BidQueue(clock=Clock())
+    q.put(None)
+    q.put(card(1))
+    assert q.get()["title"] == "Project 1"
+    assert q.get() is None
+    assert q.snapshot() == []
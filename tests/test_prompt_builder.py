@@ -0,0 +1,57 @@
+# tests/test_prompt_builder.py
+from company_profile import ALPHAFUSION_PROFILE
+from prompt_builder import PromptBuilder, count_tokens, summarize
+
+SYSTEM, RULES = "You write proposals.", "Rules:\n- Start with Hello."
+
+
+def builder(desc_chars=1200):
+    return PromptBuilder(ALPHAFUSION_PROFILE, SYSTEM, RULES, desc_chars=desc_chars)
+
+
+def test_short_descriptions_are_only_whitespace_normalised():
+    assert summarize("Need a   scraper.\n\nDaily  runs.") == "Need a scraper.\nDaily runs."
+
+
+def test_long_descriptions_keep_the_opening_and_requirements():
+    filler = " ".join(f"Our company story part {i} is long and winding." for i in range(40))
+    text = ("We sell shoes online. " + filler + " You must integrate Stripe payments. "
+            "Please mention your favourite colour in your proposal.")
+    summary = summarize(text, 300, keywords=["stripe"])
+    assert len(summary) <= 300 + len("\n(…)")
+    assert summary.startswith("We sell shoes online.")
+    assert "You must integrate Stripe payments." in summary
+    assert "favourite colour" not in summary
+    assert summary.endswith("(…)")
+
+
+def test_static_prefix_is_identical_across_projects():
+    prompts = builder()
+    a = prompts.build("Django API", "Build a REST API.", "$500", ["Python", "Django"])
+    b = prompts.build("Pentest", "Audit our firewall.", None, ["Security"])
+    assert a[0] == b[0] and a[0]["role"] == "system"
+    assert "Core Domains" not in a[0]["content"] and "Vision:" in a[0]["content"]
+    assert a[1]["content"] != b[1]["content"]
+    assert "Budget: Not specified" in b[1]["content"]
+
+
+def test_domains_follow_skills_and_title():
+    prompts = builder()
+    assert [d.split(")")[0] for d in prompts.select_domains("Pentest of our web app", ["Security"])] == ["2", "4"]
+    assert len(prompts.select_domains("Logo design", ["Illustrator"])) == 5  # nothing matched: all of them
+
+
+def test_examples_are_trimmed_into_the_user_message():
+    example = {"title": "Old API", "proposal": "Hello,\n\n" + "We built it. " * 200}
+    user = builder().build("New API", "Build an API.", examples=[example])[1]["content"]
+    assert "similar past project (Old API)" in user
+    assert len(user) < 1500
+
+
+def test_batch_prompt_lists_every_project_once():
+    projects = [{"id": "1", "title": "Django API", "description": "Build an API.", "skills": ["Django"]},
+                {"id": "2", "title": "AWS setup", "description": "Kubernetes on AWS.", "skills": ["AWS"]}]
+    user = builder().build_batch(projects)[1]["content"]
+    assert user.count("Project ID: 1") == 1 and user.count("Project ID: 2") == 1
+    assert "exactly one entry per Project ID" in user
+    assert count_tokens(user) > 0
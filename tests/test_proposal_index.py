@@ -0,0 +1,76 @@
+# tests/test_proposal_index.py
+import json
+import numpy as np
+import proposal_index
+from proposal_index import ProposalIndex, adapt_proposal, hash_vector
+
+DESCRIPTION = ("Build a Django REST API for a booking app with Stripe payments, PostgreSQL storage "
+               "and a React admin dashboard for managing reservations")
+PROPOSAL = ("Dear Client,\n\nI have built several Django booking platforms with Stripe payments. "
+            "My budget estimate is $500. I can start on the Booking API today.\n\nBest regards")
+
+
+def bid(n, title="Booking API", description=DESCRIPTION, proposal=PROPOSAL):
+    return {"title": title, "link": f"https://www.freelancer.com/projects/django/booking-{9000000 + n}",
+            "full_description": description, "proposal": proposal}
+
+
+def test_hash_vector_is_normalised_and_deterministic():
+    vector = hash_vector(DESCRIPTION, 256)
+    assert vector.dtype == np.float32
+    assert abs(np.linalg.norm(vector) - 1.0) < 1e-5
+    assert np.array_equal(vector, hash_vector(DESCRIPTION, 256))
+    assert not hash_vector("", 256).any()
+
+
+def test_adapt_proposal_swaps_title_and_drops_budget_sentences():
+    text = adapt_proposal(PROPOSAL, "Booking API", "Hotel booking backend")
+    assert text.startswith("Hello,")
+    assert "Hotel booking backend" in text and "Booking API" not in text
+    assert "$500" not in text
+    assert "Stripe" in text
+
+
+def test_same_title_projects_are_indexed_separately(tmp_path):
+    index = ProposalIndex(str(tmp_path / "index.f32"), dim=256)
+    assert index.add_many([bid(1), bid(2), bid(1)]) == 2
+    assert index.add(bid(2)) is False
+    assert len(index) == 2
+    assert index.vectors.shape == (2, 256)
+
+
+def test_index_is_reopened_from_disk(tmp_path):
+    path = str(tmp_path / "index.f32")
+    ProposalIndex(path, dim=256).add_many([bid(1), bid(2, title="Other", description="Logo design for a bakery")])
+    reopened = ProposalIndex(path, dim=256)
+    assert [e["title"] for e in reopened.entries] == ["Booking API", "Other"]
+    [(similarity, entry)] = reopened.nearest([DESCRIPTION], k=1)[0]
+    assert entry["title"] == "Booking API" and similarity > 0.9
+
+
+def test_index_without_project_keys_is_rebuilt(tmp_path):
+    path = tmp_path / "index.f32"
+    path.write_bytes(hash_vector(DESCRIPTION, 256).tobytes())
+    (tmp_path / "index.jsonl").write_text(json.dumps({"title": "Booking API", "proposal": PROPOSAL}) + "\n")
+    index = ProposalIndex(str(path), dim=256)
+    assert len(index) == 0
+    assert index.add(bid(1))
+
+
+def test_lookup_reuses_close_match_and_falls_back_to_examples(tmp_path, monkeypatch):
+    monkeypatch.setattr(proposal_index, "PROPOSAL_REUSE_THRESHOLD", 0.85)
+    monkeypatch.setattr(proposal_index, "PROPOSAL_FEWSHOT_MIN", 0.2)
+    index = ProposalIndex(str(tmp_path / "index.f32"), dim=1024)
+    index.add(bid(1))
+
+    proposal, examples = index.lookup({"title": "Booking backend", "description": DESCRIPTION})
+    assert examples == []
+    assert proposal.startswith("Hello,") and "Booking backend" in proposal
+
+    related = "Django REST API with PostgreSQL for an inventory app, no payments needed"
+    proposal, examples = index.lookup({"title": "Inventory API", "description": related})
+    assert proposal is None
+    assert [e["title"] for e in examples] == ["Booking API"]
+
+    proposal, examples = index.lookup({"title": "Logo", "description": "Design a watercolour logo for a bakery"})
+    assert proposal is None and examples == []
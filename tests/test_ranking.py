@@ -0,0 +1,72 @@
+# tests/test_ranking.py
+import pytest
+import ranking
+from bid_store import BidStore
+from ranking import RelevanceModel, Ranker, load_model
+from text_utils import tokenize
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    yield store
+    store.close()
+
+
+def submit(store, n, title, description):
+    store.add_submitted({"title": title, "link": f"https://www.freelancer.com/projects/python/p-{7000000 + n}",
+                         "description": description, "full_description": description, "proposal": "Hello"})
+
+
+def test_tokenize_keeps_tech_terms_and_adds_bigrams():
+    assert tokenize("Need a C++ and Node.js developer") == [
+        "c++", "node.js", "developer", "c++ node.js", "node.js developer"]
+
+
+def test_scores_similar_projects_higher():
+    model = RelevanceModel.fit(["machine learning python models", "react dashboard frontend",
+                                "python scraping pipeline"])
+    scores = model.score(["python machine learning", "logo design for a bakery"])
+    assert scores[0] > 0.3
+    assert scores[1] == 0
+
+
+def test_ranker_drops_low_scores_and_orders_best_first():
+    model = RelevanceModel.fit(["python machine learning api", "python data pipeline"])
+    ranked = Ranker(model, min_score=0.05).rank([
+        {"title": "Logo design"},
+        {"title": "Python API", "description": "machine learning api in python"},
+        {"title": "Python data work"},
+    ])
+    assert [p["title"] for p in ranked] == ["Python API", "Python data work"]
+    assert ranked[0]["score"] >= ranked[1]["score"]
+
+
+def test_cached_model_is_extended_with_new_bids(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(ranking, "RANK_REFIT_GROWTH", 0.5)
+    path = str(tmp_path / "ranking_model.npz")
+    for n in range(4):
+        submit(store, n, f"Python project {n}", "python api backend")
+    fitted = load_model(path, store)
+    assert (fitted.fitted, len(fitted.references)) == (5, 5)
+
+    submit(store, 4, "Kubernetes cluster", "kubernetes devops")
+    extended = load_model(path, store)
+    assert extended.fitted == 5 and len(extended.references) == 6
+    assert extended.vocab == fitted.vocab
+
+    for n in range(5, 8):
+        submit(store, n, f"Rust project {n}", "rust cli tool")
+    refitted = load_model(path, store)  # 9 documents > 5 * 1.5
+    assert refitted.fitted == 9 and "rust" in refitted.vocab
+
+
+def test_cache_is_refitted_when_the_history_changes(store, tmp_path):
+    path = str(tmp_path / "ranking_model.npz")
+    submit(store, 1, "Python project", "python api backend")
+    load_model(path, store)
+    other = BidStore(str(tmp_path / "other.db"))
+    submit(other, 2, "Go service", "golang grpc service")
+    model = load_model(path, other)
+    assert "golang" in model.vocab
+    other.close()
@@ -0,0 +1,62 @@
+# tests/test_repost.py
+import pytest
+from bid_store import BidStore
+from dedupe import SUBMITTED, SKIPPED
+from repost import RepostIndex, lsh_params, shingles
+
+DESCRIPTION = ("We need an experienced Python developer to build a scraper that collects product prices "
+               "from five ecommerce sites every night and stores them in PostgreSQL with a small dashboard")
+
+
+def project(n, description=DESCRIPTION, title="Price scraper"):
+    return {"title": title, "link": f"https://www.freelancer.com/projects/python/scraper-{8000000 + n}",
+            "description": description}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    yield store
+    store.close()
+
+
+def test_short_descriptions_are_not_shingled():
+    assert len(shingles("Need a logo")) == 0
+    assert len(shingles(DESCRIPTION)) > 20
+
+
+def test_lsh_params_fit_the_signature_and_threshold():
+    bands, rows = lsh_params(0.7, 128)
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.7) < 0.05
+
+
+def test_reworded_repost_matches_and_unrelated_project_does_not():
+    index = RepostIndex()
+    assert index.add(project(1), SUBMITTED)
+    reworded = "Hi! " + DESCRIPTION + " asap please"
+    similarity, record = index.match(project(2, reworded, title="Scraper needed again"))
+    assert similarity >= 0.7
+    assert record == {"title": "Price scraper", "link": project(1)["link"], "status": SUBMITTED}
+    other = ("Design a modern logo and brand identity for a small bakery including color palette "
+             "typography business cards and social media templates for launch")
+    assert index.match(project(3, other)) is None
+
+
+def test_add_is_idempotent_per_project():
+    index = RepostIndex()
+    assert index.add(project(1), SUBMITTED)
+    assert not index.add(project(1), SKIPPED)
+    assert not index.add(project(4, "too short"), SKIPPED)
+    assert len(index) == 1
+
+
+def test_only_submitted_and_restricted_outcomes_are_indexed(store):
+    store.add_submitted(dict(project(1), proposal="Hello"))
+    store.add_skipped(project(2, DESCRIPTION + " one"), "Cannot bid on this project due to restrictions")
+    for n, reason in enumerate(["Bid not confirmed (no redirect with bidCreated=true)",
+                                "Could not place bid due to exception",
+                                "Near-duplicate of a previous project"], start=3):
+        store.add_skipped(project(n, DESCRIPTION + " two"), reason)
+    index = RepostIndex.from_store(store)
+    assert sorted(r["link"] for r in index.records) == [project(1)["link"], project(2)["link"]]
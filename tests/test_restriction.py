@@ -0,0 +1,86 @@
+# tests/test_restriction.py
+import time
+import numpy as np
+import pytest
+from bid_store import BidStore
+from restriction import (RESTRICTED_REASON, RestrictionModel, RestrictionPredictor, features, is_active,
+                         load_model, precision_recall, training_data)
+
+
+def restricted(n):
+    return {"title": f"Data entry {n}", "link": f"https://www.freelancer.com/projects/data-entry/Typing-job-{5200000 + n}",
+            "budget": "₹600 - 1,500 INR per hour", "description": "copy paste"}
+
+
+def biddable(n):
+    return {"title": f"Python API {n}", "link": f"https://www.freelancer.com/projects/python/Api-{5300000 + n}",
+            "budget": "$250 - 750 USD", "description": "build an api", "proposal": "Hello"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    for n in range(25):
+        store.add_skipped(restricted(n), RESTRICTED_REASON)
+    for n in range(40):
+        store.add_submitted(biddable(n))
+    store.add_skipped(biddable(99), "Could not place bid due to exception")  # form reached: not restricted
+    store.add_skipped(biddable(98), "Near-duplicate of a previous project")  # says nothing: left out
+    yield store
+    store.close()
+
+
+def test_features_describe_budget_shape_and_link():
+    assert set(features(restricted(1), text=False)) == {
+        "currency:INR", "hourly:True", "open:False", "size:4", "category:data-entry", "slug_id:True"}
+    assert "t:python" in features(biddable(1), text=True)
+
+
+def test_training_data_labels(store):
+    projects, labels = training_data(store)
+    assert len(projects) == 66 and labels.sum() == 25
+
+
+def test_model_separates_the_classes(store):
+    projects, labels = training_data(store)
+    model = RestrictionModel.fit(projects, labels)
+    probs = model.predict([restricted(100), biddable(100)])
+    assert probs[0] > 0.9 > 0.1 > probs[1]
+    assert precision_recall(probs, np.array([1, 0]), 0.7) == (1.0, 1.0)
+
+
+def test_load_model_caches_by_outcomes(store, tmp_path):
+    path = str(tmp_path / "model.npz")
+    assert load_model(path, store, train=False) is None
+    model = load_model(path, store)
+    assert model.positives == 25 and model.precision == 1.0
+    assert is_active(model)
+    assert load_model(path, store, train=False).fingerprint == model.fingerprint
+    store.add_skipped(restricted(50), RESTRICTED_REASON)
+    assert load_model(path, store, train=False) is None
+
+
+def test_predictor_trains_in_the_background(store, tmp_path):
+    predictor = RestrictionPredictor(path=str(tmp_path / "model.npz"), store=store, retrain_interval=3600)
+    thread = predictor.training
+    assert thread is not None  # no cached model: the first fit runs off the discovery path
+    thread.join(30)
+    cards = [restricted(200), biddable(200)]
+    assert predictor.filter(cards) == [biddable(200)]
+    assert len(predictor.avoided) == 1
+
+
+def test_retrain_keeps_serving_the_previous_model(store, tmp_path):
+    path = str(tmp_path / "model.npz")
+    load_model(path, store)
+    predictor = RestrictionPredictor(path=path, store=store, retrain_interval=0)
+    assert predictor.training is None  # cached model matched, nothing to fit
+    previous = predictor.model
+    store.add_skipped(restricted(60), RESTRICTED_REASON)
+    start = time.monotonic()
+    assert predictor.filter([restricted(201)]) == []  # answered by the previous model
+    assert time.monotonic() - start < 0.5
+    thread = predictor.training
+    if thread is not None:
+        thread.join(30)
+    assert predictor.model is not previous and predictor.model.positives == 26
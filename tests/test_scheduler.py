@@ -0,0 +1,67 @@
+# tests/test_scheduler.py
+import random
+from scheduler import AdaptivePoller, FakeClock, parse_profiles
+
+
+def make_poller(clock, **kwargs):
+    options = dict(min_interval=1, max_interval=60, backoff=2, jitter=0, target_per_poll=1, profiles=[])
+    options.update(kwargs)
+    return AdaptivePoller(clock=clock.monotonic, sleep=clock.sleep, current_hour=clock.current_hour, **options)
+
+
+def test_idle_polls_back_off_exponentially_up_to_the_cap():
+    clock = FakeClock()
+    poller = make_poller(clock)
+    intervals = [poller.wait(0) for _ in range(8)]
+    assert intervals == [2, 4, 8, 16, 32, 60, 60, 60]
+    assert clock.now == sum(intervals)
+    assert poller.last_decision["reason"] == "idle-backoff"
+
+
+def test_arrivals_aim_for_the_target_per_poll():
+    clock = FakeClock()
+    poller = make_poller(clock)
+    poller.record(0)
+    clock.sleep(10)
+    assert poller.record(2) == 5  # 0.2 projects/s -> one every 5s
+    assert poller.last_decision["reason"] == "arrivals"
+    clock.sleep(5)
+    poller.wait(0)
+    assert poller.interval == 10  # backs off from the arrival-driven interval
+
+
+def test_jitter_stays_within_bounds():
+    clock = FakeClock()
+    rng = random.Random(7)
+    poller = make_poller(clock, jitter=0.2, rng=rng.random, max_interval=1000)
+    for _ in range(50):
+        interval = poller.wait(0)
+        base = poller.interval
+        assert base * 0.8 <= interval <= base * 1.2
+        assert poller.min_interval <= interval <= poller.max_interval
+
+
+def test_jitter_is_clamped_to_the_interval_bounds():
+    clock = FakeClock()
+    poller = make_poller(clock, jitter=0.5, rng=lambda: 0.0)
+    assert poller.wait(0) == 1  # 2 * 0.5 would fall below min_interval
+    poller = make_poller(clock, jitter=0.5, rng=lambda: 1.0, max_interval=4)
+    assert [poller.wait(0) for _ in range(3)] == [3, 4, 4]
+
+
+def test_time_of_day_profile_scales_the_bounds():
+    clock = FakeClock(hour=3)
+    poller = make_poller(clock, profiles=parse_profiles("0-7:4,22-24:2"))
+    assert poller.wait(0) == 4  # min_interval 1 x 4 at night
+    intervals = [poller.wait(0) for _ in range(8)]
+    assert max(intervals) == 240
+    assert poller.last_decision["profile_multiplier"] == 4
+
+    clock.hour = 12
+    assert poller.wait(0) == 60
+    assert poller.last_decision["profile_multiplier"] == 1.0
+
+
+def test_parse_profiles():
+    assert parse_profiles("0-7:4, 22-24:2") == [(0, 7, 4.0), (22, 24, 2.0)]
+    assert parse_profiles("") == []
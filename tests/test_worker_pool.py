@@ -0,0 +1,78 @@
+# tests/test_worker_pool.py
+import threading
+import pytest
+from bid_store import BidStore
+from dedupe import DedupeIndex
+from priority import BidQueue
+from worker_pool import BidWorkerPool
+
+
+def card(n, **fields):
+    return dict({"title": f"Project {n}", "link": f"https://www.freelancer.com/projects/python/p-{6100000 + n}",
+                 "budget": "$100 USD", "posted": "just now"}, **fields)
+
+
+@pytest.fixture
+def dedupe(tmp_path):
+    store = BidStore(str(tmp_path / "bids.db"))
+    yield DedupeIndex(store)
+    store.close()
+
+
+def test_every_finished_project_is_released(dedupe):
+    released, handled = [], []
+
+    def handle(driver, project):
+        handled.append(project["title"])
+        if project["title"] == "Project 2":
+            raise RuntimeError("navigation failed")  # before the proposal stream was taken
+        return True
+
+    pool = BidWorkerPool(["driver"], handle, dedupe=dedupe, bid_queue=BidQueue(max_age=600),
+                         on_release=lambda p: released.append(p["title"]))
+    pool.submit([card(1), card(2), card(3, posted="2 hours ago")])  # project 3 is stale
+    pool.join()
+    pool.shutdown()
+    assert sorted(handled) == ["Project 1", "Project 2"]
+    assert sorted(released) == ["Project 1", "Project 2", "Project 3"]
+    assert pool.placed == 1
+
+
+def test_project_claimed_by_another_worker_is_released(dedupe):
+    released = []
+    dedupe.claim(card(1))  # held by a worker outside this pool
+    pool = BidWorkerPool(["driver"], lambda d, p: True, dedupe=dedupe,
+                         on_release=lambda p: released.append(p["title"]))
+    pool.queue.put(card(1))
+    pool.join()
+    pool.shutdown()
+    assert released == ["Project 1"] and pool.placed == 0
+
+
+def test_workers_bid_in_parallel_on_their_own_driver(dedupe):
+    barrier = threading.Barrier(2, timeout=2)
+    seen = {}
+
+    def handle(driver, project):
+        seen[project["title"]] = driver
+        barrier.wait()  # both workers must be busy at once
+        return True
+
+    placed = []
+    pool = BidWorkerPool(["driver-0", "driver-1"], handle, dedupe=dedupe, on_placed=placed.append)
+    assert pool.submit([card(1), card(2)]) == 2
+    pool.join()
+    pool.shutdown()
+    assert sorted(seen.values()) == ["driver-0", "driver-1"]
+    assert pool.placed == 2 and sorted(placed) == [1, 2]
+
+
+def test_submit_skips_seen_and_pending_projects(dedupe):
+    dedupe.add_submitted(card(1))
+    gate = threading.Event()
+    pool = BidWorkerPool(["driver"], lambda d, p: gate.wait(2), dedupe=dedupe)
+    assert pool.submit([card(1), card(2), card(3)]) == 2
+    assert pool.submit([card(3)]) == 0
+    gate.set()
+    pool.join()
+    pool.shutdown()
@@ -0,0 +1,22 @@
+# text_utils.py
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can could do does for from has have i if in into is it its me my need
+needed of on or our so that the their them then there these this to us we will with you your
+""".split())
+
+
+def tokenize(text: str) -> list:
+    """Lowercased unigrams plus adjacent bigrams, stopwords removed."""
+    words = [w for w in _TOKEN_RE.findall((text or "").lower()) if w not in _STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def project_text(project: dict) -> str:
+    return " ".join([
+        project.get("title", ""),
+        " ".join(project.get("skills", []) or []),
+        project.get("full_description") or project.get("description", ""),
+    ])
@@ -0,0 +1,82 @@
+# worker_pool.py
+import os
+import threading
+from dedupe import get_dedupe_index
+from priority import BidQueue
+from logger import get_logger
+
+BID_WORKERS = int(os.getenv("BID_WORKERS", "1"))
+
+log = get_logger("worker_pool")
+
+
+class BidWorkerPool:
+    """
+    N bidding workers, each owning its own browser session, pulling projects from a shared
+    priority queue (freshest, most valuable first). Projects are claimed in the shared dedupe index so two workers never bid on the same one.
+    """
+
+    def __init__(self, drivers, handle, dedupe=None, on_placed=None, bid_queue=None, on_release=None):
+        self.handle = handle  # handle(driver, project) -> bool
+        self.on_placed = on_placed  # on_placed(session_count)
+        # on_release(project) runs once a worker is done with a project, however it ended
+        # (stale, claimed elsewhere, bid, or failed), e.g. to free its pre-generation slot
+        self.on_release = on_release
+        self.dedupe = dedupe or get_dedupe_index()
+        self.queue = bid_queue or BidQueue()
+        self.lock = threading.Lock()
+        self.placed = 0
+        self.threads = [
+            threading.Thread(target=self._run, args=(driver,), name=f"bid-worker-{i}", daemon=True)
+            for i, driver in enumerate(drivers)
+        ]
+        for t in self.threads:
+            t.start()
+
+    def submit(self, projects) -> int:
+        """Queue projects by priority; returns how many were not already pending or being bid on."""
+        # Discovery may overlap bidding, so skip projects a worker holds or finished meanwhile
+        return sum(self.queue.put(p) for p in projects if not self.dedupe.is_claimed(p) and not self.dedupe.seen(p))
+
+    def pending(self) -> int:
+        return self.queue.qsize()
+
+    def join(self):
+        """Block until every submitted project has been handled."""
+        self.queue.join()
+
+    def _run(self, driver):
+        while True:
+            project = self.queue.get()
+            try:
+                if project is None:
+                    return
+                if self.queue.evict_if_stale(project):
+                    continue
+                if not self.dedupe.claim(project):
+                    continue  # another worker is already bidding on it
+                try:
+                    ok = self.handle(driver, project)
+                finally:
+                    self.dedupe.release(project)
+                if ok:
+                    with self.lock:
+                        self.placed += 1
+                        placed = self.placed
+                    if self.on_placed:
+                        self.on_placed(placed)
+            except Exception as e:
+                log.exception(f"⚠️ Worker {threading.current_thread().name} failed on {project.get('title', 'N/A')}: {e}")
+            finally:
+                if project is not None and self.on_release:
+                    try:
+                        self.on_release(project)
+                    except Exception as e:
+                        log.warning(f"⚠️ Releasing {project.get('title', 'N/A')} failed: {e}")
+                self.queue.task_done()
+
+    def shutdown(self):
+        for _ in self.threads:
+            self.queue.put(None)
+        for t in self.threads:
+            t.join()